@@ -0,0 +1,54 @@
+"""Encode cost per OSC message: pythonosc builder vs cached prefix encoder used by `OscOut.send`.
+
+Run from the repository root: `python -m benchmarks.osc_encode`
+"""
+
+import timeit
+
+import pythonosc.osc_message_builder
+
+from midiscripter.osc.osc_codec import _encode_message, _encode_prefix
+
+MESSAGES_COUNT = 100_000
+
+CASES = {
+    'float': ('/live/device/set/parameter/value', (0, 1, 5, 0.42)),
+    'int': ('/live/track/set/mute', (3, 1)),
+    'string': ('/live/clip/set/name', (2, 0, 'Chorus')),
+    'mixed': ('/touchosc/fader', (0.5, 'label', True, None, b'\x01\x02')),
+}
+
+
+def encode_with_pythonosc(address: str, args: tuple) -> bytes:
+    builder = pythonosc.osc_message_builder.OscMessageBuilder(address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def main() -> None:
+    print(f'{"case":<8} {"pythonosc, us":>14} {"cached, us":>11} {"speedup":>8}')
+    for case_name, (address, args) in CASES.items():
+        assert _encode_message(address, args) == encode_with_pythonosc(address, args)
+
+        _encode_prefix.cache_clear()
+        pythonosc_time = timeit.timeit(
+            lambda address=address, args=args: encode_with_pythonosc(address, args),
+            number=MESSAGES_COUNT,
+        )
+        cached_time = timeit.timeit(
+            lambda address=address, args=args: _encode_message(address, args),
+            number=MESSAGES_COUNT,
+        )
+        pythonosc_us = pythonosc_time / MESSAGES_COUNT * 1_000_000
+        cached_us = cached_time / MESSAGES_COUNT * 1_000_000
+        print(
+            f'{case_name:<8} {pythonosc_us:>14.2f} {cached_us:>11.2f} '
+            f'{pythonosc_us / cached_us:>7.1f}x'
+        )
+
+    print(_encode_prefix.cache_info())
+
+
+if __name__ == '__main__':
+    main()
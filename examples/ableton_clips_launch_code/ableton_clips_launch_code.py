@@ -22,12 +22,15 @@ def set_clip_fire_listener() -> None:
 
 
 @ableton_osc.subscribe('/live/track/get/playing_slot_index')
-def clip_fired(msg: OscMsg) -> None:
+async def clip_fired(msg: OscMsg) -> None:
     """Launches current module's function named like the first word of launched clip's name and other words as args"""
     if msg.data[1] == -1:  # no clip is playing
         return
 
-    fired_clip_name = ableton_osc.query('/live/clip/get/name', msg.data)[2]
+    # Clip names are cached, so repeated launches don't wait for Ableton response
+    fired_clip_name = (
+        await ableton_osc.cached_query_async('/live/clip/get/name', msg.data, match_data=True)
+    )[2]
 
     if not fired_clip_name:
         return
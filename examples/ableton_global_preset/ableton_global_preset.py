@@ -73,19 +73,29 @@ class Preset:
             log.red('Ableton OSC is not running')
             return
 
+        # Query all tracks' devices at once instead of waiting for each response
+        tracks_devices_names = ableton_osc.query_many(
+            [
+                ('/live/track/get/devices/name', track_index)
+                for track_index in range(len(track_names))
+            ],
+            match_data=True,
+        )
+
         for track_index, track_name in enumerate(track_names):
-            devices_names = ableton_osc.query('/live/track/get/devices/name', track_index)[1:]
+            devices_names = tracks_devices_names[track_index][1:]
 
             for device_index, device_name in enumerate(devices_names):
                 if not device_name.startswith(SAVED_DEVICE_NAME_PREFIX):
                     continue
 
-                param_names = ableton_osc.query(
-                    '/live/device/get/parameters/name', (track_index, device_index)
-                )[2:]
-                param_values = ableton_osc.query(
-                    '/live/device/get/parameters/value', (track_index, device_index)
-                )[2:]
+                param_names, param_values = ableton_osc.query_many(
+                    [
+                        ('/live/device/get/parameters/name', (track_index, device_index)),
+                        ('/live/device/get/parameters/value', (track_index, device_index)),
+                    ]
+                )
+                param_names, param_values = param_names[2:], param_values[2:]
 
                 device_preset = dict(zip(param_names, param_values, strict=True))
                 self.param_data[track_name][device_name] = device_preset
@@ -3,12 +3,14 @@ import music21.key
 import music21.note
 import music21.roman
 
+import midiscripter.shared
 from midiscripter import *
 
 
 midi_input_from_daw = MidiIn('DAW', virtual=True)  # MIDI input from (after) DAW
 
-pressed_notes_midi_data = []  # A global variable
+# Start worker processes with the ports, so they import music21 before the first chord
+midiscripter.shared.process_executor.is_used = True
 
 # GUI widgets
 root_selector = GuiButtonSelectorV(('C', 'D', 'E', 'F', 'G', 'A', 'B'), select='C')
@@ -29,38 +31,40 @@ labels_layout = GuiWidgetLayout(chord_degree_label,
 
 @midi_input_from_daw.subscribe((MidiType.NOTE_ON, MidiType.NOTE_OFF))
 def show_chord_info(msg: MidiMsg) -> None:
-    """Gathers pressed notes and prints chord info to GUI widgets"""
-    global pressed_notes_midi_data
-
-    # Clear chord on first note off
-    if msg.type == MidiType.NOTE_OFF:
-        pressed_notes_midi_data = []
-
-    if msg.type == MidiType.NOTE_ON:
-        # Gather pressed notes data
-        pressed_notes_midi_data.append(msg.data1)
-        if len(pressed_notes_midi_data) < 3:  # Wait for chord
-            return
-
-        # Get settings from GUI selector widgets
-        if root_alteration_selector.selected_item_text == '♮':
-            key = root_selector.selected_item_text
-        else:
-            key = root_selector.selected_item_text + root_alteration_selector.selected_item_text
-
-        # Get chord and key into music21 library objects
-        chord = music21.chord.Chord(pressed_notes_midi_data)
-        key = music21.key.Key(key, mode_selector.selected_item_text)
-
-        # Print info to GUI widgets
-        chord_name_label.content = chord.pitchedCommonName
-        chord_degree_label.content = music21.roman.romanNumeralFromChord(chord, key).figure.upper()
-
-        # If the chord is out of key its degree will be printed red
-        if not all(key.getScaleDegreeFromPitch(pitch) for pitch in chord.pitches):
-            chord_degree_label.color = 'red'
-        else:
-            chord_degree_label.color = 'black'
+    """Gets pressed notes and settings and sends them to chord analysis"""
+    # Input port keeps track of pressed notes
+    pressed_notes_midi_data = midi_input_from_daw.notes.held_notes(msg.channel)
+    if len(pressed_notes_midi_data) < 3:  # Wait for chord
+        return
+
+    # Get settings from GUI selector widgets
+    if root_alteration_selector.selected_item_text == '♮':
+        key = root_selector.selected_item_text
+    else:
+        key = root_selector.selected_item_text + root_alteration_selector.selected_item_text
+
+    # music21 analysis is CPU-heavy, so it's run in worker process to not delay other calls.
+    # Worker process doesn't share ports and widgets state, so the data is passed as arguments.
+    midiscripter.shared.process_executor.submit(
+        analyze_chord, pressed_notes_midi_data, key, mode_selector.selected_item_text
+    )
+
+
+def analyze_chord(notes: tuple[int, ...], key_name: str, mode: str) -> None:
+    """Prints chord info to GUI widgets. Widget changes are forwarded from worker process."""
+    # Get chord and key into music21 library objects
+    chord = music21.chord.Chord(list(notes))
+    key = music21.key.Key(key_name, mode)
+
+    # Print info to GUI widgets
+    chord_name_label.content = chord.pitchedCommonName
+    chord_degree_label.content = music21.roman.romanNumeralFromChord(chord, key).figure.upper()
+
+    # If the chord is out of key its degree will be printed red
+    if not all(key.getScaleDegreeFromPitch(pitch) for pitch in chord.pitches):
+        chord_degree_label.color = 'red'
+    else:
+        chord_degree_label.color = 'black'
 
 
 if __name__ == '__main__':
@@ -18,7 +18,7 @@ bank_selector_widget = GuiButtonSelectorH(
 
 
 current_bank_index = 0
-banks_feedback_cc_values = {bank_index: {} for bank_index in range(0, NUMBER_OF_BANKS)}
+banks_feedback_state = MidiState()  # Keeps the latest feedback values for all banks' channels
 
 BANK_SELECTOR_ATTRS = (MidiType.CONTROL_CHANGE, MIDI_CONTROLLER_CHANNEL, BANK_SELECTOR_CC_CONTROL)
 BANKS_CHANNELS_RANGE = range(BANKS_CHANNELS_START_FROM, BANKS_CHANNELS_START_FROM + NUMBER_OF_BANKS)
@@ -26,9 +26,11 @@ BANKS_CHANNELS_RANGE = range(BANKS_CHANNELS_START_FROM, BANKS_CHANNELS_START_FRO
 
 def send_saved_feedback_values() -> None:
     """Sends messages with all CC latest values for selected bank to MIDI controller"""
-    for control, value in banks_feedback_cc_values[current_bank_index].items():
-        feedback_msg = MidiMsg(MidiType.CONTROL_CHANGE, MIDI_CONTROLLER_CHANNEL, control, value)
-        midi_controller.send(feedback_msg)
+    bank_channel = BANKS_CHANNELS_START_FROM + current_bank_index
+    for feedback_msg in banks_feedback_state.as_msgs(bank_channel):
+        if feedback_msg.type is MidiType.CONTROL_CHANGE:
+            feedback_msg.channel = MIDI_CONTROLLER_CHANNEL
+            midi_controller.send(feedback_msg)
 
 
 @bank_selector_widget.subscribe(type=GuiEvent.SELECTED)
@@ -84,7 +86,7 @@ def feedback_proxy(msg: MidiMsg) -> None:
     bank_index_for_msg = msg.channel - BANKS_CHANNELS_START_FROM
 
     if msg.channel in BANKS_CHANNELS_RANGE:
-        banks_feedback_cc_values[bank_index_for_msg][msg.data1] = msg.data2
+        banks_feedback_state.update(msg)
 
     if msg.channel not in BANKS_CHANNELS_RANGE or bank_index_for_msg == current_bank_index:
         midi_controller.send(msg)
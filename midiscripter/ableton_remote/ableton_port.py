@@ -11,6 +11,7 @@ from midiscripter.ableton_remote.remote_script_midi_mapping import (
 )
 
 if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
     from collections.abc import Container, Callable
 
 
@@ -56,6 +57,8 @@ class AbletonIn(MidiIn):
         type: 'None | Container[AbletonEvent] | AbletonEvent' = None,
         index: 'None | Container | int | tuple[int, int]' = None,
         value: 'None | Container[int] | int | bool' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
@@ -63,8 +66,12 @@ class AbletonIn(MidiIn):
         type: 'None | Container[AbletonEvent] | AbletonEvent' = None,
         index: 'None | Container[int, tuple[int, int]] | int | tuple[int, int]' = None,
         value: 'None | Container[int] | int | bool' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return Input.subscribe(self, type, index, value)  # bypassing MidiIn method
+        return Input.subscribe(
+            self, type, index, value, executor=executor
+        )  # bypassing MidiIn method
 
 
 class AbletonOut(MidiOut):
@@ -130,6 +137,8 @@ class AbletonIO(MidiIO):
         type: 'None | Container[AbletonEvent] | AbletonEvent' = None,
         index: 'None | Container | int | tuple[int, int]' = None,
         value: 'None | Container[int] | int | bool' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
@@ -137,8 +146,10 @@ class AbletonIO(MidiIO):
         type: 'None | Container[AbletonEvent] | AbletonEvent' = None,
         index: 'None | Container[int, tuple[int, int]] | int | tuple[int, int]' = None,
         value: 'None | Container[int] | int | bool' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return self._input_ports[0].subscribe(type, index, value)
+        return self._input_ports[0].subscribe(type, index, value, executor=executor)
 
     def send(self, msg: AbletonMsg | ChannelMsg) -> None:
         """Send message to Ableton remote script.
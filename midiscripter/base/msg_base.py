@@ -95,7 +95,7 @@ class Msg:
                     continue
 
             try:
-                if attr in condition and not isinstance(condition, str):
+                if attr in condition and not isinstance(condition, str | bytes):
                     if isinstance(condition, Not):
                         return False
                     else:
@@ -1,3 +1,4 @@
+import asyncio
 import collections
 import contextlib
 import copy
@@ -14,7 +15,8 @@ from midiscripter.logger import log
 from midiscripter.base.msg_base import Msg
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Hashable, Container
+    import concurrent.futures
+    from collections.abc import Callable, Hashable, Container, Iterable
 
 
 class CallOn(enum.StrEnum):
@@ -27,8 +29,26 @@ class CallOn(enum.StrEnum):
     """Call after port is initially opened"""
 
 
+class Executor(enum.StrEnum):
+    """Executors to run subscribed calls with, set as `subscribe(executor=...)`"""
+
+    THREAD = 'thread'
+    """Shared thread pool of the script process. Coroutine functions are run
+    on the shared asyncio event loop instead."""
+
+    PROCESS = 'process'
+    """Worker process pool for CPU-heavy calls that shouldn't hold the script process.
+    The message is pickled and sent to a worker process that imported the script.
+    Port sends, GUI widget changes and log messages made in the worker
+    are forwarded to the script process."""
+
+
 @contextlib.contextmanager
 def _all_opened() -> None:
+    midiscripter.shared.async_loop.start()
+    if midiscripter.shared.process_executor.is_used:
+        midiscripter.shared.process_executor.start()
+
     for port in itertools.chain(Input._subclass_instances, Output._subclass_instances):
         if not port.is_opened:
             port._open()
@@ -42,13 +62,28 @@ def _all_opened() -> None:
         if port.is_opened:
             port._close()
 
+    midiscripter.shared.async_loop.stop()
+    midiscripter.shared.process_executor.stop()
     log._flush()
     log._flushing_is_enabled = False
     midiscripter.shared.thread_executor.shutdown(wait=False, cancel_futures=True)
 
 
+def _process_call_worker(callable_: 'Callable', msg: 'Msg | None') -> None:
+    """Function run in process pool worker for each call subscribed with process executor.
+
+    Args:
+        callable_: Subscribed callable.
+        msg: Received message to use as callable only argument, `None` for callable without it.
+    """
+    result = callable_() if msg is None else callable_(msg)
+    if inspect.isawaitable(result):
+        asyncio.run(result)
+
+
 class SubscribedCall:
-    """Wrapper object created for subscribed callable"""
+    """Wrapper object created for subscribed callable.
+    Coroutine functions are run on the shared asyncio event loop instead of the thread pool."""
 
     conditions: None | tuple[tuple, dict]
     """Message match conditions for call"""
@@ -60,7 +95,11 @@ class SubscribedCall:
     _log_show_link: bool = False
 
     def __init__(
-        self, conditions: 'None | tuple[tuple, dict]', callable_: 'Callable', owner: 'Subscribable'
+        self,
+        conditions: 'None | tuple[tuple, dict]',
+        callable_: 'Callable',
+        owner: 'Subscribable',
+        executor: Executor | str = Executor.THREAD,
     ):
         self.conditions = conditions
         self.statistics = collections.deque(maxlen=20)
@@ -68,6 +107,15 @@ class SubscribedCall:
         self.__callable = callable_
         self.__required_parameter_count = len(inspect.signature(callable_).parameters)
 
+        self.is_coroutine = inspect.iscoroutinefunction(callable_)
+        """The callable is a coroutine function that is run on asyncio event loop"""
+
+        self.executor = Executor(executor)
+        """Executor the call is run with"""
+
+        if self.executor == Executor.PROCESS:
+            midiscripter.shared.process_executor.is_used = True
+
     def __call__(self, msg: 'Msg' = None) -> None:
         msg = msg or Msg('')
         if self.__required_parameter_count == 0:
@@ -76,11 +124,39 @@ class SubscribedCall:
             self.__callable(msg)
         self.statistics.append(msg._age_ms)
 
+    async def _call_async(self, msg: 'Msg' = None) -> None:
+        msg = msg or Msg('')
+        if self.__required_parameter_count == 0:
+            await self.__callable()
+        else:
+            await self.__callable(msg)
+        self.statistics.append(msg._age_ms)
+
+    def _submit_to_process_executor(self, msg: 'Msg') -> None:
+        """Run the call in process pool worker. Only the callable reference
+        and the message are pickled and sent to the worker."""
+        future = midiscripter.shared.process_executor.submit(
+            _process_call_worker, self.__callable, msg if self.__required_parameter_count else None
+        )
+        future.add_done_callback(lambda future: self.__process_call_done(future, msg))
+
+    def __process_call_done(self, future: 'concurrent.futures.Future', msg: 'Msg') -> None:
+        if future.cancelled():
+            return
+
+        if exc := future.exception():
+            self._print_exception_to_log(exc)
+        else:
+            self.statistics.append(msg._age_ms)
+
     def __str__(self):
         return self.__callable.__qualname__
 
     def _print_exception_to_log(self, exc: Exception) -> None:
-        traceback_text = ''.join(traceback.format_exception(exc, limit=-2)[1:])
+        try:  # exception raised in process pool worker has its traceback text as a cause
+            traceback_text = exc.__cause__.tb.strip('\n"') + '\n'
+        except AttributeError:
+            traceback_text = ''.join(traceback.format_exception(exc, limit=-2)[1:])
         log.red(
             'Calling {call} subscribed to {port} raised exception:\n{traceback_text}',
             call=self,
@@ -109,6 +185,7 @@ class Subscribable:
     def subscribe(
         self,
         *msg_matches_args: 'None | Container[Any] | Any',
+        executor: Executor | str = Executor.THREAD,
         **msg_matches_kwargs: 'str, None | Container[Any] | Any',
     ) -> 'Callable':
         """Decorator to subscribe a callable to the input's messages.
@@ -126,6 +203,12 @@ class Subscribable:
         3. If condition is a container (list, tuple) and contains the message's attribute value,
         it matches the attribute.
 
+        Calls are run in the shared thread pool. `executor='process'` argument runs
+        CPU-heavy call in a worker process pool, so it doesn't hold the script process.
+        Worker processes import the script, so it should start with
+        `if __name__ == '__main__':` condition. Ports and widgets state
+        is not shared with workers, so the call should get all the data from the message.
+
         ??? Examples
             1. Calls function for all MIDI port's messages:
             ``` python
@@ -143,6 +226,20 @@ class Subscribable:
             ``` python
             midi_input_instance.subscribe((MidiType.NOTE_ON, MidiType.NOTE_OFF))(object.method)
             ```
+            4. Coroutine function is run on asyncio event loop and can await without
+            occupying a thread:
+            ``` python
+            @osc_io_instance.subscribe(address='/live/track/get/playing_slot_index')
+            async def function(msg: OscMsg) -> None:
+                clip_name = await osc_io_instance.query_async('/live/clip/get/name', msg.data)
+            ```
+            5. CPU-heavy function is run in worker process. Its sends, GUI widget changes
+            and log messages are forwarded to the script process:
+            ``` python
+            @midi_input_instance.notes.subscribe(executor='process')
+            def function(msg: ChordMsg) -> None:
+                gui_text_instance.content = heavy_chord_analysis(msg.notes)
+            ```
 
         Returns:
             Subscribed callable.
@@ -151,16 +248,16 @@ class Subscribable:
         def wrapped_subscribe(
             callable_: 'Callable[[Msg], None] | Callable[[], None]',
         ) -> 'Callable':
-            if msg_matches_args[0] in CallOn:
+            if msg_matches_args and isinstance(msg_matches_args[0], CallOn):
                 conditions = msg_matches_args[0]
-            elif (
-                msg_matches_args[0] is callable_ or not msg_matches_args and not msg_matches_kwargs
+            elif (msg_matches_args and msg_matches_args[0] is callable_) or (
+                not msg_matches_args and not msg_matches_kwargs
             ):  # noqa: SIM108
                 conditions = None
             else:
                 conditions = (msg_matches_args, msg_matches_kwargs)
 
-            call = SubscribedCall(conditions, callable_, self)
+            call = SubscribedCall(conditions, callable_, self, executor)
 
             try:
                 call_list_for_conditions = next(
@@ -172,7 +269,7 @@ class Subscribable:
 
             return callable_
 
-        if callable(msg_matches_args[0]):
+        if msg_matches_args and callable(msg_matches_args[0]):
             return wrapped_subscribe(msg_matches_args[0])
 
         return wrapped_subscribe
@@ -192,7 +289,7 @@ class Subscribable:
 
         matched_calls = []
         not_matched_by_any_calls = []
-        for conditions, call_list in self._calls:
+        for conditions, call_list in self._get_calls_to_match(msg):
             if conditions == CallOn.NOT_MATCHED_BY_ANY_CALL:
                 not_matched_by_any_calls = call_list
             elif isinstance(conditions, str) and conditions in CallOn:
@@ -202,8 +299,28 @@ class Subscribable:
 
         calls = matched_calls or not_matched_by_any_calls
 
-        msg_copies = [copy.copy(msg) for _ in range(len(calls))]
-        midiscripter.shared.thread_executor.map(self.__call_worker, calls, msg_copies)
+        for call in calls:
+            self.__submit_call(call, copy.copy(msg))
+
+    def _get_calls_to_match(
+        self, msg: 'Msg'
+    ) -> 'Iterable[tuple[None | CallOn | tuple[tuple, dict], list[SubscribedCall]]]':
+        """Get the subscribed calls that the message should be matched with.
+        Overridden by ports that index the calls to skip the calls that can't match.
+
+        Args:
+            msg: A message received by the input port.
+        """
+        return self._calls
+
+    def __submit_call(self, call: SubscribedCall, msg: 'Msg') -> None:
+        if call.executor == Executor.PROCESS:
+            log._call_made(call)
+            call._submit_to_process_executor(msg)
+        elif call.is_coroutine:
+            midiscripter.shared.async_loop.run_coroutine(self.__async_call_worker(call, msg))
+        else:
+            midiscripter.shared.thread_executor.submit(self.__call_worker, call, msg)
 
     @staticmethod
     def __call_worker(call: SubscribedCall, msg: 'Msg') -> None:
@@ -223,6 +340,21 @@ class Subscribable:
         except Exception as exc:
             call._print_exception_to_log(exc)
 
+    @staticmethod
+    async def __async_call_worker(call: SubscribedCall, msg: 'Msg') -> None:
+        """Coroutine scheduled on asyncio event loop for each subscribed coroutine call
+        and each received message.
+
+        Args:
+            call: Subscribed coroutine callable.
+            msg: Received message to use as callable only argument.
+        """
+        log._call_made(call)
+        try:
+            await call._call_async(msg)
+        except Exception as exc:
+            call._print_exception_to_log(exc)
+
     def _call_on_init(self) -> None:
         """Called after input port is opened for the first time.
 
@@ -236,7 +368,15 @@ class Subscribable:
         for conditions, call_list in self._calls:
             if conditions == CallOn.PORT_INIT:
                 for call in call_list:
-                    midiscripter.shared.thread_executor.submit(self.__call_worker, call, Msg(''))
+                    self.__submit_call(call, Msg(''))
+
+
+def _get_port_instance(port_class: type['Port'], uid: 'Hashable', init_args: dict) -> 'Port':
+    """Get the port singleton unpickled in other process, declare it if it wasn't declared"""
+    try:
+        return port_class._uid_to_instance[uid]
+    except KeyError:
+        return port_class(**init_args)
 
 
 class Port:
@@ -339,6 +479,11 @@ class Port:
     def __repr__(self):
         return self.__repr
 
+    def __reduce__(self) -> tuple:
+        # Port is pickled as a reference to the singleton to send it to process pool workers
+        uid = next(uid for uid, port in self._uid_to_instance.items() if port is self)
+        return _get_port_instance, (type(self), uid, self.__inited_with_args)
+
     def __str__(self):
         return str(self._uid)
 
@@ -404,7 +549,22 @@ class Output(Port):
         # noinspection PyUnreachableCode
         log._msg_sent(self, msg)
 
+    async def send_async(self, msg: Msg) -> None:
+        """Send message using the output port from a coroutine
+        without blocking asyncio event loop.
+
+        Args:
+            msg: Message to send.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            midiscripter.shared.thread_executor, self.send, msg
+        )
+
     def _validate_msg_send(self, msg: 'Msg') -> bool:
+        if midiscripter.shared.process_executor.is_worker_process():
+            midiscripter.shared.process_executor.forward_to_main_process(self.send, msg)
+            return False
+
         if not self.is_opened:
             log.red("Can't send message {msg} - {output} is disabled!", msg=msg, output=self)
             return False
@@ -463,6 +623,7 @@ class MultiPort(Port):
     def subscribe(
         self,
         *msg_matches_args: 'None | Container[Any] | Any',
+        executor: Executor | str = Executor.THREAD,
         **msg_matches_kwargs: 'str, None | Container[Any] | Any',
     ) -> 'Callable':
         """Decorator to subscribe a callable to all the wrapped inputs' messages.
@@ -480,6 +641,12 @@ class MultiPort(Port):
         3. If condition is a container (list, tuple) and contains the message's attribute value,
         it matches the attribute.
 
+        Calls are run in the shared thread pool. `executor='process'` argument runs
+        CPU-heavy call in a worker process pool, so it doesn't hold the script process.
+        Worker processes import the script, so it should start with
+        `if __name__ == '__main__':` condition. Ports and widgets state
+        is not shared with workers, so the call should get all the data from the message.
+
         ??? Examples
             1. Calls function for all MIDI port's messages:
             ``` python
@@ -497,6 +664,20 @@ class MultiPort(Port):
             ``` python
             midi_input_instance.subscribe((MidiType.NOTE_ON, MidiType.NOTE_OFF))(object.method)
             ```
+            4. Coroutine function is run on asyncio event loop and can await without
+            occupying a thread:
+            ``` python
+            @osc_io_instance.subscribe(address='/live/track/get/playing_slot_index')
+            async def function(msg: OscMsg) -> None:
+                clip_name = await osc_io_instance.query_async('/live/clip/get/name', msg.data)
+            ```
+            5. CPU-heavy function is run in worker process. Its sends, GUI widget changes
+            and log messages are forwarded to the script process:
+            ``` python
+            @midi_input_instance.notes.subscribe(executor='process')
+            def function(msg: ChordMsg) -> None:
+                gui_text_instance.content = heavy_chord_analysis(msg.notes)
+            ```
 
         Returns:
             Subscribed callable.
@@ -506,7 +687,7 @@ class MultiPort(Port):
 
         call = None
         for input_port in self._input_ports:
-            call = input_port.subscribe(*msg_matches_args, **msg_matches_kwargs)
+            call = input_port.subscribe(*msg_matches_args, executor=executor, **msg_matches_kwargs)
         return call
 
     def send(self, msg: Msg) -> None:
@@ -517,3 +698,14 @@ class MultiPort(Port):
         """
         for output_port in self._output_ports:
             output_port.send(msg)
+
+    async def send_async(self, msg: Msg) -> None:
+        """Send message using wrapped output ports from a coroutine
+        without blocking asyncio event loop.
+
+        Args:
+            msg: Message to send.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            midiscripter.shared.thread_executor, self.send, msg
+        )
@@ -9,12 +9,21 @@ import midiscripter.midi
 from midiscripter.logger import log
 
 
-def start_cli_debug() -> NoReturn:
+def start_cli_debug(*, plain_text: bool = False, output_file: str | None = None) -> NoReturn:
     """Starts the script with log output to console.
-    Console prints increase latency and jitter. Use for debugging only.
+    Log is written by its own thread, so slow console doesn't delay the script,
+    but log lines that don't fit the output queue are dropped. Use for debugging only.
+
+    Args:
+        plain_text: Print log without colors, which is faster for terminal to render
+        output_file: Write plain text log to the file instead of the console
     """
-    log._formatter = midiscripter.logger.console.console_log_formatter
-    log._sink = midiscripter.logger.console.console_sink
+    console_sink = midiscripter.logger.console.ConsoleSink(output_file)
+    if plain_text or output_file:
+        log._formatter = midiscripter.logger.console.plain_console_log_formatter
+    else:
+        log._formatter = midiscripter.logger.console.console_log_formatter
+    log._sink = console_sink
     log._flushing_is_enabled = True
 
     log('')
@@ -29,6 +38,7 @@ def start_cli_debug() -> NoReturn:
     log('')
 
     _run_cli_loop()
+    console_sink.close()
 
 
 def start_silent() -> NoReturn:
@@ -9,6 +9,7 @@ import midiscripter.file_event
 from midiscripter.logger import log
 
 if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
     from collections.abc import Container, Callable
     from midiscripter.file_event.file_event_msg import FileEvent, FileEventMsg
 
@@ -85,11 +86,15 @@ class FileEventIn(midiscripter.base.port_base.Input, watchdog.events.FileSystemE
         self,
         type: 'None | Container[FileEvent] | FileEvent | str' = None,
         path: 'None | Container[pathlib.Path] | pathlib.Path' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
         self,
         type: 'None | Container[FileEvent] | FileEvent | str' = None,
         path: 'None | Container[pathlib.Path] | pathlib.Path' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return super().subscribe(type, path)
+        return super().subscribe(type, path, executor=executor)
@@ -115,8 +115,9 @@ class ScripterGUI(QApplication):
         self.__single_instance_socket.close()
 
 
-# Creating app at import to allow QWidget instance init in other modules
-app_instance = ScripterGUI()
+# Creating app at import to allow QWidget instance init in other modules.
+# Process pool workers import the script without GUI.
+app_instance = None if midiscripter.shared.process_executor.is_worker_process() else ScripterGUI()
 
 
 def add_qwidget(qwidget: QWidget) -> None:
@@ -1,3 +1,4 @@
+import functools
 import types
 from typing import TYPE_CHECKING, overload, Any, Self
 from collections.abc import Sequence
@@ -7,14 +8,41 @@ from PySide6.QtWidgets import *
 import midiscripter.base.msg_base
 import midiscripter.base.port_base
 import midiscripter.gui.app
+import midiscripter.shared
 
 from .gui_msg import GuiEventMsg, GuiEvent
 
 if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
     from collections.abc import Container, Callable
     from .mixins import WrappedQWidgetMixin
 
 
+def _get_widget_by_title(title: str) -> 'GuiWidget':
+    """Get the widget unpickled in process pool worker or forwarded from it"""
+    return GuiWindowItem._title_to_instance[title]
+
+
+def _forwarded_from_worker_process(method: 'Callable') -> 'Callable':
+    """Decorator for widget setters and methods that change the widget.
+    Forwards the change made in process pool worker to the script process."""
+
+    @functools.wraps(method)
+    def wrapper(self: 'GuiWidget', arg: Any) -> None:
+        if not midiscripter.shared.process_executor.is_worker_process():
+            method(self, arg)
+        elif isinstance(getattr(type(self), method.__name__), property):
+            midiscripter.shared.process_executor.forward_to_main_process(
+                setattr, self, method.__name__, arg
+            )
+        else:
+            midiscripter.shared.process_executor.forward_to_main_process(
+                getattr(self, method.__name__), arg
+            )
+
+    return wrapper
+
+
 class GuiWindowItem:
     """GUI windows item (widget, layout) which can also by bound to `GuiWidgetLayout`"""
 
@@ -85,6 +113,8 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
         """
         midiscripter.base.port_base.Subscribable.__init__(self)
         GuiWindowItem.__init__(self, content, title)
+        if midiscripter.shared.process_executor.is_worker_process():
+            return  # worker process has no GUI, the widget is a reference for forwarded changes
 
         self.qt_widget = self._qt_widget_class()  # workaround for mkdocstrings issue #607
 
@@ -114,7 +144,11 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
         self.__connect_change_signals_to_msgs()
 
     def __str__(self):
-        return self.qt_widget.objectName()
+        return self._title
+
+    def __reduce__(self) -> tuple:
+        # Widget is pickled as a reference to be forwarded from process pool workers
+        return _get_widget_by_title, (self._title,)
 
     def __connect_change_signals_to_msgs(self) -> None:
         self.qt_widget.triggered_signal.connect(
@@ -147,6 +181,7 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
             return self._content
 
     @content.setter
+    @_forwarded_from_worker_process
     def content(self, content: str | Sequence[str]) -> None:
         self._content = content
         self.qt_widget.set_content_signal.emit(content)
@@ -161,6 +196,7 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
             return None
 
     @value.setter
+    @_forwarded_from_worker_process
     def value(self, value: str | int | bool | None) -> None:
         self.qt_widget.set_value_signal.emit(value)
         self.qt_widget.value_changed_signal.emit()
@@ -181,6 +217,7 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
         except NotImplementedError:
             return None
 
+    @_forwarded_from_worker_process
     def select(self, selection: int | str) -> None:
         """Select widget's item
 
@@ -199,6 +236,7 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
             return None
 
     @toggle_state.setter
+    @_forwarded_from_worker_process
     def toggle_state(self, state: bool) -> None:
         self.qt_widget.set_toggle_state_signal.emit(state)
         self.qt_widget.toggle_state_changed_signal.emit()
@@ -209,6 +247,7 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
         return self._range
 
     @range.setter
+    @_forwarded_from_worker_process
     def range(self, range: tuple[int, int]) -> None:
         self._range = range
         self.qt_widget.set_range_signal.emit(range)
@@ -220,6 +259,7 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
         return self._color
 
     @color.setter
+    @_forwarded_from_worker_process
     def color(self, color: str | tuple[int, int, int]) -> None:
         self._color = color
         self.qt_widget.set_color_signal.emit(color)
@@ -238,11 +278,15 @@ class GuiWidget(GuiWindowItem, midiscripter.base.port_base.Subscribable):
         self,
         type: 'None | Container[GuiEvent] | GuiEvent' = None,
         data: 'None | Container | str | int | bool | Sequence' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
         self,
         type: 'None | Container[GuiEvent] | GuiEvent' = None,
         data: 'None | Container | str | int | bool | Sequence' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return super().subscribe(type, data)
+        return super().subscribe(type, data, executor=executor)
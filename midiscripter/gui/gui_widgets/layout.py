@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from PySide6.QtWidgets import *
 
 import midiscripter.gui.app
+import midiscripter.shared
 from .gui_widget_base import GuiWindowItem
 
 if TYPE_CHECKING:
@@ -65,6 +66,8 @@ class GuiWidgetLayout(GuiWindowItem):
             Calls can't be subscribed to `GuiWidgetLayout`. Subscribe calls to widgets instead.
         """
         super().__init__(title=title)
+        if midiscripter.shared.process_executor.is_worker_process():
+            return
 
         self.qt_widget = QWidget()
         self.qt_widget.setObjectName(self._title)
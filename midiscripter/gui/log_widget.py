@@ -1,13 +1,15 @@
-import collections
+import bisect
+import functools
+import operator
 import re
-from collections.abc import Collection
+from typing import Any
 
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
-import midiscripter.logger.html
 from midiscripter.logger import log
+from midiscripter.logger.log_rows import LogRow, LogSegment, log_rows_formatter
 from midiscripter.gui.color_theme import theme_color
 
 
@@ -60,156 +62,311 @@ class LogWidget(QWidget):
         if event.keyCombination() == QKeyCombination(
             Qt.KeyboardModifier.ControlModifier, Qt.Key.Key_F
         ):
-            self.filter_line.setText(self.log_view.textCursor().selectedText())
+            self.filter_line.setText(self.log_view.hovered_text())
 
         if event.keyCombination() == QKeyCombination(
             Qt.KeyboardModifier.ControlModifier, Qt.Key.Key_E
         ):
-            self.exclude_line.setText(self.log_view.textCursor().selectedText())
+            self.exclude_line.setText(self.log_view.hovered_text())
 
 
-class LogView(QPlainTextEdit):
-    append_html_entry = Signal(list)
-    entry_ctime_part_len = len(f'{log._get_precise_timestamp()}: ')
+@functools.lru_cache(maxsize=16)
+def _compile_text_parts_pattern(text_parts: tuple[str, ...]) -> re.Pattern | None:
+    """Compile pattern matching any of the text parts, `None` for no text parts.
+    Longer parts go first to match the whole part when a shorter part is its beginning."""
+    if not text_parts:
+        return None
+    return re.compile(
+        '|'.join(re.escape(text) for text in sorted(text_parts, key=len, reverse=True))
+    )
 
-    def __init__(self):
+
+class _LogModel(QAbstractListModel):
+    """Log rows kept in a ring buffer and the rows that pass the filters.
+    Only the added rows are filtered, the filter change that narrows the filters
+    filters the rows that passed the previous filters only."""
+
+    def __init__(self, history_size: int):
         super().__init__()
-        self.__anchor_text: str | None = None
-        self.__filter_text_parts = []
-        self.__exclude_text_parts = []
-        self.__log_content = collections.deque(maxlen=log.BUFFER_SIZE)
-        self.__previous_filtered_entry_text = None
-
-        self.setReadOnly(True)
-        self.setUndoRedoEnabled(False)
-        self.setWordWrapMode(QTextOption.WrapMode.NoWrap)
-        self.setMaximumBlockCount(log.BUFFER_SIZE)
-        self.setMouseTracking(True)
+        self.__history_size = history_size
+        self.__rows: list[LogRow] = []
+        self.__visible_rows: list[LogRow] = []
+        self.filter_text_parts: tuple[str, ...] = ()
+        self.exclude_text_parts: tuple[str, ...] = ()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self.__visible_rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        row = self.__visible_rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return f'{row.timestamp}: {row.text}' if row.timestamp else row.text
+        return None
+
+    def add_rows(self, rows: list[LogRow]) -> None:
+        if not rows:
+            return
 
-        self.setFrameStyle(QFrame.Shape.NoFrame)
+        if rows[0].run_id is not None:  # repeated entries run update
+            self.__remove_run_rows(rows[0].run_id)
+
+        self.__rows.extend(rows)
+        previous_row = self.__visible_rows[-1] if self.__visible_rows else None
+        visible_rows = self.__filter_rows(rows, previous_row)
+        if visible_rows:
+            row_count = len(self.__visible_rows)
+            self.beginInsertRows(QModelIndex(), row_count, row_count + len(visible_rows) - 1)
+            self.__visible_rows.extend(visible_rows)
+            self.endInsertRows()
+
+        self.__trim_history()
+
+    def set_filters(
+        self, filter_text_parts: tuple[str, ...], exclude_text_parts: tuple[str, ...]
+    ) -> None:
+        if self.__narrows_filters(filter_text_parts, exclude_text_parts):
+            rows_to_filter = self.__visible_rows
+        else:
+            rows_to_filter = self.__rows
+
+        self.filter_text_parts = filter_text_parts
+        self.exclude_text_parts = exclude_text_parts
+
+        self.beginResetModel()
+        self.__visible_rows = self.__filter_rows(rows_to_filter)
+        self.endResetModel()
+
+    def __narrows_filters(
+        self, filter_text_parts: tuple[str, ...], exclude_text_parts: tuple[str, ...]
+    ) -> bool:
+        """Check if the rows passing the new filters pass the current filters too"""
+        filter_is_narrower = not self.filter_text_parts or (
+            bool(filter_text_parts)
+            and all(
+                any(old_part in new_part for old_part in self.filter_text_parts)
+                for new_part in filter_text_parts
+            )
+        )
+        exclude_is_wider = all(
+            any(new_part in old_part for new_part in exclude_text_parts)
+            for old_part in self.exclude_text_parts
+        )
+        return filter_is_narrower and exclude_is_wider
+
+    def __filter_rows(self, rows: list[LogRow], previous_row: LogRow | None = None) -> list[LogRow]:
+        """Get rows passing the filters with their filter matches found for highlighting"""
+        filter_pattern = _compile_text_parts_pattern(self.filter_text_parts)
+        exclude_pattern = _compile_text_parts_pattern(self.exclude_text_parts)
+
+        filtered_rows = []
+        previous_row_is_spacer = previous_row is None or previous_row.is_spacer
+        for row in rows:
+            if row.is_spacer:
+                if previous_row_is_spacer:  # two separators in a row
+                    continue
+            elif (exclude_pattern and exclude_pattern.search(row.search_text)) or (
+                filter_pattern and not filter_pattern.search(row.search_text)
+            ):
+                continue
 
-        self.append_html_entry.connect(self.__add_entries)
+            if filter_pattern:
+                row.highlight_spans = tuple(
+                    match.span() for match in filter_pattern.finditer(row.text.lower())
+                )
+            else:
+                row.highlight_spans = ()
 
-        log._formatter = midiscripter.logger.html.html_log_formatter
-        log._sink = self.append_html_entry.emit
-        log._flushing_is_enabled = True
+            filtered_rows.append(row)
+            previous_row_is_spacer = row.is_spacer
+        return filtered_rows
 
-    @Slot(str)
-    def set_filter(self, filter_text: str) -> None:
-        self.__filter_text_parts = [
-            text.lower().strip().strip("'") for text in filter_text.split(';') if text.strip()
-        ]
-        QSettings().setValue('log filter', filter_text)
-        self.__apply_filter()
+    def __remove_run_rows(self, run_id: int) -> None:
+        """Remove the rows of the previous state of the repeated entries run"""
+        while self.__rows and self.__rows[-1].run_id == run_id:
+            self.__rows.pop()
 
-    @Slot(str)
-    def set_exclude(self, exclude_text: str) -> None:
-        self.__exclude_text_parts = [
-            text.lower().strip().strip("'") for text in exclude_text.split(';') if text.strip()
+        run_row_count = 0
+        while (
+            run_row_count < len(self.__visible_rows)
+            and self.__visible_rows[-run_row_count - 1].run_id == run_id
+        ):
+            run_row_count += 1
+
+        if run_row_count:
+            row_count = len(self.__visible_rows)
+            self.beginRemoveRows(QModelIndex(), row_count - run_row_count, row_count - 1)
+            del self.__visible_rows[-run_row_count:]
+            self.endRemoveRows()
+
+    def __trim_history(self) -> None:
+        excess_row_count = len(self.__rows) - self.__history_size
+        if excess_row_count <= 0:
+            return
+
+        first_kept_number = self.__rows[excess_row_count].number
+        del self.__rows[:excess_row_count]
+
+        removed_visible_count = bisect.bisect_left(
+            self.__visible_rows, first_kept_number, key=operator.attrgetter('number')
+        )
+        if removed_visible_count:
+            self.beginRemoveRows(QModelIndex(), 0, removed_visible_count - 1)
+            del self.__visible_rows[:removed_visible_count]
+            self.endRemoveRows()
+
+
+class _LogRowDelegate(QStyledItemDelegate):
+    """Paints log row segments, only the visible rows are painted"""
+
+    __MARGIN = 3
+    __TIMESTAMP_PLACEHOLDER = f'{log._get_precise_timestamp()}: '
+
+    def __get_row_parts(self, row: LogRow, metrics: QFontMetrics) -> list[tuple[LogSegment, int]]:
+        """Row text segments with the timestamp as a first one and their widths"""
+        timestamp_segment = LogSegment(f'{row.timestamp}: ' if row.timestamp else '', 'grey', None)
+        timestamp_width = metrics.horizontalAdvance(self.__TIMESTAMP_PLACEHOLDER)
+        return [
+            (timestamp_segment, timestamp_width),
+            *((segment, metrics.horizontalAdvance(segment.text)) for segment in row.segments),
         ]
-        QSettings().setValue('log exclude', exclude_text)
-        self.__apply_filter()
-
-    def __text_line_is_excluded(self, text_line: str) -> bool:
-        if not self.__exclude_text_parts:
-            return False
-        return any(text in text_line.lower() for text in self.__exclude_text_parts)
-
-    def __text_line_matches_filter(self, text_line: str) -> bool:
-        if not self.__filter_text_parts:
-            return True
-        return any(text in text_line.lower() for text in self.__filter_text_parts)
-
-    def __filter_entries(self, log_entries: Collection[str]) -> list[str]:
-        filtered_entries = []
-        for entry in log_entries:
-            entry_plain_text = re.sub(r'<.*?>', '', entry)
-            log_msg_text = entry_plain_text[self.entry_ctime_part_len :]
-
-            if log_msg_text and (  # noqa: SIM114
-                self.__text_line_is_excluded(log_msg_text)
-                or not self.__text_line_matches_filter(log_msg_text)
-            ):
-                continue
-            elif (
-                not log_msg_text and not self.__previous_filtered_entry_text
-            ):  # two separators in a row
-                continue
-            else:
-                filtered_entries.append(entry)
-                self.__previous_filtered_entry_text = log_msg_text
 
-        return filtered_entries
+    def segment_at(
+        self, rect: QRect, row: LogRow, x: int, metrics: QFontMetrics
+    ) -> LogSegment | None:
+        """Get the row text segment at the view position, not the timestamp"""
+        segment_x = rect.left() + self.__MARGIN
+        for part_number, (segment, width) in enumerate(self.__get_row_parts(row, metrics)):
+            if part_number and segment_x <= x < segment_x + width:
+                return segment
+            segment_x += width
+        return None
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        row: LogRow = index.data(Qt.ItemDataRole.UserRole)
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        option.text = ''
+        option.widget.style().drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget
+        )
+        if row.is_spacer:
+            return
+
+        painter.save()
+        metrics = option.fontMetrics
+        rect = option.rect
+        row_parts = self.__get_row_parts(row, metrics)
+        text_x = rect.left() + self.__MARGIN + row_parts[0][1]
+        self.__paint_filter_matches(painter, row, rect, text_x, metrics)
+
+        segment_x = rect.left() + self.__MARGIN
+        for segment, width in row_parts:
+            if segment.color:
+                painter.setPen(QColor(theme_color(segment.color)))
+            else:
+                painter.setPen(option.palette.color(QPalette.ColorRole.Text))
 
-    def __clear_highlighting(self) -> None:
-        text_format = QTextCharFormat()
-        text_format.setBackground(QBrush(Qt.NoBrush))
-        cursor = self.textCursor()
-        cursor.select(QTextCursor.SelectionType.Document)
-        cursor.mergeCharFormat(text_format)
+            font = QFont(option.font)
+            font.setUnderline(segment.link is not None)
+            painter.setFont(font)
 
-    def __highlight_filter_matches(self, last_n_blocks: int = 0) -> None:
-        if not self.__filter_text_parts:
+            painter.drawText(
+                QRect(segment_x, rect.top(), width, rect.height()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                segment.text,
+            )
+            segment_x += width
+            if segment_x > rect.right():
+                break
+        painter.restore()
+
+    @staticmethod
+    def __paint_filter_matches(
+        painter: QPainter, row: LogRow, rect: QRect, text_x: int, metrics: QFontMetrics
+    ) -> None:
+        if not row.highlight_spans:
             return
 
-        document: QTextDocument = self.document()
-        cursor: QTextCursor = self.textCursor()
+        highlight_color = QColor(theme_color('yellow', True))
+        for match_start, match_end in row.highlight_spans:
+            painter.fillRect(
+                QRect(
+                    text_x + metrics.horizontalAdvance(row.text[:match_start]),
+                    rect.top(),
+                    metrics.horizontalAdvance(row.text[match_start:match_end]),
+                    rect.height(),
+                ),
+                highlight_color,
+            )
 
-        text_format = QTextCharFormat()
-        text_format.setBackground(QBrush(QColor(theme_color('yellow', True))))
 
-        if not last_n_blocks:
-            start_from = 0
-        else:
-            first_new_block = document.findBlockByNumber(document.blockCount() - last_n_blocks)
-            start_from = first_new_block.position()
+class LogView(QTableView):
+    """Log rows view. Table view is used as a list since it doesn't lay out all the rows
+    on rows insert like `QListView` does, its fixed height rows are found by position."""
 
-        for filter_word in self.__filter_text_parts:
-            regex = QRegularExpression(filter_word, QRegularExpression.CaseInsensitiveOption)
-            match_iter = regex.globalMatch(self.toPlainText(), start_from)
+    append_rows = Signal(list)
 
-            while match_iter.hasNext():
-                match = match_iter.next()
+    def __init__(self):
+        super().__init__()
+        self.__hovered_segment: LogSegment | None = None
+
+        self.__model = _LogModel(log.HISTORY_SIZE)
+        self.setModel(self.__model)
+        self.__delegate = _LogRowDelegate(self)
+        self.setItemDelegate(self.__delegate)
+
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 2)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
 
-                text_block: QTextBlock = document.findBlock(match.capturedStart())
-                if match.capturedStart() < text_block.position() + self.entry_ctime_part_len:
-                    continue
+        self.setFrameStyle(QFrame.Shape.NoFrame)
 
-                cursor.setPosition(match.capturedStart())
-                cursor.movePosition(
-                    QTextCursor.MoveOperation.NextCharacter,
-                    QTextCursor.MoveMode.KeepAnchor,
-                    match.capturedLength(),
-                )
-                cursor.mergeCharFormat(text_format)
+        self.append_rows.connect(self.__add_rows)
 
-    def __print_entries(self, log_entries: Collection[str]) -> None:
-        self.appendHtml(''.join(log_entries))
+        log._formatter = log_rows_formatter
+        log._sink = self.append_rows.emit
+        log._flushing_is_enabled = True
 
-    @Slot(list)
-    def __add_entries(self, log_entries: Collection[str]) -> None:
-        self.__log_content.extend(log_entries)
-
-        if self.__filter_text_parts or self.__exclude_text_parts:
-            filtered_entries = self.__filter_entries(log_entries)
-            if filtered_entries:
-                self.__print_entries(filtered_entries)
-            if self.__filter_text_parts:
-                self.__highlight_filter_matches(len(filtered_entries))
-        else:
-            self.__print_entries(log_entries)
+    @Slot(str)
+    def set_filter(self, filter_text: str) -> None:
+        filter_text_parts = tuple(
+            text.lower().strip().strip("'") for text in filter_text.split(';') if text.strip()
+        )
+        QSettings().setValue('log filter', filter_text)
+        self.__model.set_filters(filter_text_parts, self.__model.exclude_text_parts)
+        self.scrollToBottom()
+
+    @Slot(str)
+    def set_exclude(self, exclude_text: str) -> None:
+        exclude_text_parts = tuple(
+            text.lower().strip().strip("'") for text in exclude_text.split(';') if text.strip()
+        )
+        QSettings().setValue('log exclude', exclude_text)
+        log._set_excluded_texts(exclude_text_parts)
+        self.__model.set_filters(self.__model.filter_text_parts, exclude_text_parts)
+        self.scrollToBottom()
 
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+    def hovered_text(self) -> str:
+        """Text of the object under the mouse cursor"""
+        return self.__hovered_segment.text.strip() if self.__hovered_segment else ''
 
-    def __apply_filter(self) -> None:
-        self.clear()
-        if self.__filter_text_parts or self.__exclude_text_parts:
-            filtered_entries = self.__filter_entries(self.__log_content)
-            self.__print_entries(filtered_entries)
-            self.__highlight_filter_matches(len(filtered_entries))
-        else:
-            self.__print_entries(self.__log_content)
-            self.__clear_highlighting()
+    @Slot(list)
+    def __add_rows(self, rows: list[LogRow]) -> None:
+        scroll_bar = self.verticalScrollBar()
+        is_scrolled_to_bottom = scroll_bar.value() == scroll_bar.maximum()
+        self.__model.add_rows(rows)
+        if is_scrolled_to_bottom:
+            self.scrollToBottom()
 
     def hideEvent(self, event: QHideEvent) -> None:
         log._flushing_is_enabled = False
@@ -219,25 +376,43 @@ class LogView(QPlainTextEdit):
         log._flushing_is_enabled = True
         super().showEvent(event)
 
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        if event.matches(QKeySequence.StandardKey.Copy):
+            selected_rows = sorted(index.row() for index in self.selectedIndexes())
+            QGuiApplication.clipboard().setText(
+                '\n'.join(self.__model.index(row).data() for row in selected_rows)
+            )
+            return
+        super().keyPressEvent(event)
+
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
-        self.__anchor_text = self.anchorAt(event.pos())
-        if self.__anchor_text:
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            self.__hovered_segment = self.__delegate.segment_at(
+                self.visualRect(index),
+                index.data(Qt.ItemDataRole.UserRole),
+                event.pos().x(),
+                self.fontMetrics(),
+            )
+        else:
+            self.__hovered_segment = None
+
+        if self.__hovered_segment and self.__hovered_segment.link:
             self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
         else:
-            self.viewport().setCursor(Qt.CursorShape.IBeamCursor)
+            self.viewport().unsetCursor()
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
-        if not self.__anchor_text or event.button() != Qt.MouseButton.LeftButton:
+        anchor_text = self.__hovered_segment.link if self.__hovered_segment else None
+        if not anchor_text or event.button() != Qt.MouseButton.LeftButton:
             super().mouseReleaseEvent(event)
             return
 
         if QGuiApplication.keyboardModifiers() == Qt.KeyboardModifier.ControlModifier:
-            text_for_clipboard = self.__anchor_text[
-                self.__anchor_text.find('(') + 1 : self.__anchor_text.rfind(')')
-            ]
+            text_for_clipboard = anchor_text[anchor_text.find('(') + 1 : anchor_text.rfind(')')]
         else:
-            text_for_clipboard = self.__anchor_text
+            text_for_clipboard = anchor_text
 
         QGuiApplication.clipboard().setText(text_for_clipboard)
         QApplication.instance().main_window.message_sender_widget.paste(text_for_clipboard)
@@ -6,6 +6,7 @@ from midiscripter.logger import log
 from midiscripter.keyboard.keyboard_msg import KeyEvent, KeyMsg
 
 if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
     from collections.abc import Container, Callable
 
 
@@ -84,14 +85,18 @@ class KeyIn(midiscripter.base.port_base.Input):
         self,
         type: 'None | Container[KeyEvent] | KeyEvent' = None,
         shortcut: 'None | Container[str] | str' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
         self,
         type: 'None | Container[KeyEvent] | KeyEvent' = None,
         shortcut: 'None | Container[str] | str' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return super().subscribe(type, shortcut)
+        return super().subscribe(type, shortcut, executor=executor)
 
 
 class KeyOut(midiscripter.base.port_base.Output):
@@ -173,14 +178,18 @@ class KeyIO(midiscripter.base.port_base.MultiPort):
         self,
         type: 'None | Container[KeyEvent] | KeyEvent' = None,
         shortcut: 'None | Container[str] | str' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
         self,
         type: 'None | Container[KeyEvent] | KeyEvent' = None,
         shortcut: 'None | Container[str] | str' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return self._input_ports[0].subscribe(type, shortcut)
+        return self._input_ports[0].subscribe(type, shortcut, executor=executor)
 
     def send(self, msg: KeyMsg) -> None:
         """Send the keyboard input.
@@ -1,3 +1,4 @@
 from midiscripter.logger.log_obj import Log as _Log
+from midiscripter.logger.log_obj import LogCategory
 
 log = _Log()
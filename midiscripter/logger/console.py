@@ -1,8 +1,11 @@
+import os
 import sys
+import threading
 
 import colorama
 
-from midiscripter.logger.log_obj import LogEntry
+import midiscripter.shared
+from midiscripter.logger.log_obj import LogEntry, _format_plain_text
 
 
 def _to_colored_text(text: str, color: str, global_color: None | str = None) -> str:
@@ -20,7 +23,7 @@ def _to_colored_text(text: str, color: str, global_color: None | str = None) ->
 def console_log_formatter(log_entries: list[LogEntry]) -> str:
     entries = []
     for entry in log_entries:
-        text, format_args, format_kwargs, timestamp, color = entry
+        text, format_args, format_kwargs, timestamp, color, _, repeat = entry
 
         if not text:
             entries.append('\n')
@@ -39,6 +42,9 @@ def console_log_formatter(log_entries: list[LogEntry]) -> str:
         except (KeyError, IndexError):
             pass
 
+        if repeat and repeat.count > 1:
+            text += f'{colorama.Style.DIM}{repeat}{colorama.Style.RESET_ALL}'
+
         ctime_text = f'{colorama.Style.DIM}{timestamp}: {colorama.Style.RESET_ALL}'
         entry_text = ctime_text + text + '\n'
         entries.append(entry_text)
@@ -46,6 +52,104 @@ def console_log_formatter(log_entries: list[LogEntry]) -> str:
     return ''.join(entries)
 
 
-def console_sink(output: str) -> None:
-    sys.stdout.write(output)
-    sys.stdout.flush()
+def plain_console_log_formatter(log_entries: list[LogEntry]) -> str:
+    """Format log entries without color escape sequences that slow down terminal rendering"""
+    entries = []
+    for entry in log_entries:
+        if not entry.text:
+            entries.append('\n')
+            continue
+
+        repeat_text = str(entry.repeat) if entry.repeat else ''
+        entries.append(f'{entry.timestamp}: {_format_plain_text(entry)}{repeat_text}\n')
+
+    return ''.join(entries)
+
+
+class ConsoleSink:
+    """Log sink that writes to console or text file from the background thread,
+    so slow terminal doesn't block the log flush worker. Output that doesn't fit
+    the queue while the terminal is busy is dropped, the number of dropped lines
+    is printed after the queued output.
+    """
+
+    MAX_QUEUED_LINES = 10_000
+    """Max number of log lines waiting to be written"""
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        """
+        Args:
+            path: Text file path to write to instead of the console
+        """
+        self.dropped_count = 0
+        """Total number of dropped log lines"""
+
+        self.__pending: list[str] = []
+        self.__pending_lines_count = 0
+        self.__unreported_dropped_count = 0
+        self.__lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__worker_is_running = False
+
+        if path is None:
+            self.__file = sys.stdout
+        else:
+            self.__file = open(path, 'a', encoding='utf-8')  # noqa: SIM115
+
+    def __call__(self, output: str) -> None:
+        """Queue the formatted output to write"""
+        lines_count = output.count('\n')
+        with self.__lock:
+            if self.__pending_lines_count + lines_count > self.MAX_QUEUED_LINES:
+                self.dropped_count += lines_count
+                self.__unreported_dropped_count += lines_count
+                return
+
+            self.__pending.append(output)
+            self.__pending_lines_count += lines_count
+            if self.__worker_is_running:
+                return
+            self.__worker_is_running = True
+
+        try:
+            midiscripter.shared.thread_executor.submit(self.__write_worker)
+        except RuntimeError:  # executor is shut down at the script exit, write in this thread
+            self.__worker_is_running = False
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the queued output now"""
+        with self.__lock:
+            output = ''.join(self.__pending)
+            dropped_count = self.__unreported_dropped_count
+            self.__pending = []
+            self.__pending_lines_count = 0
+            self.__unreported_dropped_count = 0
+
+        if dropped_count:
+            output += f'{dropped_count} log lines dropped while the output was busy\n'
+        if output:
+            self.__write(output)
+
+    def close(self) -> None:
+        self.flush()
+        if self.__file is not sys.stdout:
+            with self.__write_lock:
+                self.__file.close()
+
+    def __write_worker(self) -> None:
+        """Thread worker that writes the queued output until there is none"""
+        while True:
+            with self.__lock:
+                if not self.__pending and not self.__unreported_dropped_count:
+                    self.__worker_is_running = False
+                    return
+            self.flush()
+
+    def __write(self, output: str) -> None:
+        with self.__write_lock:
+            try:
+                self.__file.write(output)
+                self.__file.flush()
+            except (OSError, ValueError):  # closed console or file
+                pass
@@ -0,0 +1,304 @@
+"""Log file sink writing JSON lines records with size rotation, the records reader and viewer.
+
+View the log files with `python -m midiscripter.logger.log_file <log file path>`,
+`--help` argument prints the filtering options.
+"""
+
+import argparse
+import datetime
+import json
+import mmap
+import os
+import pathlib
+import sys
+import threading
+from typing import TYPE_CHECKING, Any
+
+import midiscripter.shared
+from midiscripter.logger.log_obj import Log, LogEntry, _format_plain_text, _resolve_entry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+def json_log_formatter(log_entries: 'Sequence[LogEntry]') -> list[str]:
+    """Format log entries to JSON lines records with the entry time, plain text and color,
+    the names of the entry's ports and the types of its messages"""
+    records = []
+    for entry in log_entries:
+        if not entry.text:  # spacer
+            continue
+
+        obj_refs = (*entry.format_args, *entry.format_kwargs.values())
+        record = {
+            'time': entry.time,
+            'text': _format_plain_text(entry),
+            'color': entry.color,
+            'ports': [obj_ref.text for obj_ref in obj_refs if obj_ref.is_port],
+            'msg_types': [obj_ref.msg_type for obj_ref in obj_refs if obj_ref.msg_type],
+        }
+        if entry.repeat and entry.repeat.count > 1:  # sink set to log with collapsed repeats
+            record['count'] = entry.repeat.count
+        records.append(json.dumps(record, ensure_ascii=False) + '\n')
+    return records
+
+
+class LogFileSink:
+    """Log sink that writes JSON lines records to a file from the background thread.
+    The file is rotated by size: `log.jsonl` is renamed to `log.jsonl.1`,
+    `log.jsonl.1` to `log.jsonl.2` and so on, the oldest backup is removed.
+
+    Used by `log.set_file`. Can be set as `log._sink` with `json_log_formatter`
+    as `log._formatter` to log to the file only.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_size_bytes: int, backup_count: int):
+        """
+        Args:
+            path: Log file path
+            max_size_bytes: File size to rotate the file at
+            backup_count: Number of rotated files to keep
+        """
+        self.path = pathlib.Path(path)
+        self.max_size_bytes = max_size_bytes
+        self.backup_count = backup_count
+
+        self.__pending_entries: list[LogEntry] = []
+        self.__pending_lines: list[str] = []
+        self.__lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__worker_is_running = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__file = open(self.path, 'ab')  # noqa: SIM115
+        self.__file_size = self.__file.tell()
+
+    def __call__(self, lines: list[str]) -> None:
+        """Write the formatted lines"""
+        with self.__lock:
+            self.__pending_lines.extend(lines)
+            if self.__worker_is_running:
+                return
+            self.__worker_is_running = True
+        self.__start_worker()
+
+    def _append_entry(self, log_entry: LogEntry) -> None:
+        """Write the buffered log entry. Formatted in the background thread."""
+        with self.__lock:
+            self.__pending_entries.append(log_entry)
+            if self.__worker_is_running:
+                return
+            self.__worker_is_running = True
+        self.__start_worker()
+
+    def flush(self) -> None:
+        """Write the pending records now"""
+        with self.__lock:
+            entries = self.__pending_entries
+            lines = self.__pending_lines
+            self.__pending_entries = []
+            self.__pending_lines = []
+
+        if entries:
+            lines.extend(json_log_formatter([_resolve_entry(entry) for entry in entries]))
+        if lines:
+            self.__write(lines)
+
+    def close(self) -> None:
+        self.flush()
+        with self.__write_lock:
+            self.__file.close()
+
+    def __start_worker(self) -> None:
+        try:
+            midiscripter.shared.thread_executor.submit(self.__write_worker)
+        except RuntimeError:  # executor is shut down at the script exit, write in this thread
+            self.__worker_is_running = False
+            self.flush()
+
+    def __write_worker(self) -> None:
+        """Thread worker that writes the pending records until there are none"""
+        while True:
+            with self.__lock:
+                if not self.__pending_entries and not self.__pending_lines:
+                    self.__worker_is_running = False
+                    return
+            self.flush()
+
+    def __write(self, lines: list[str]) -> None:
+        with self.__write_lock:
+            if self.__file.closed:
+                return
+
+            chunk = []
+            for line in lines:
+                line_bytes = line.encode()
+                if self.__file_size and self.__file_size + len(line_bytes) > self.max_size_bytes:
+                    self.__file.write(b''.join(chunk))
+                    chunk.clear()
+                    self.__rotate()
+                chunk.append(line_bytes)
+                self.__file_size += len(line_bytes)
+
+            self.__file.write(b''.join(chunk))
+            self.__file.flush()
+
+    def __rotate(self) -> None:
+        self.__file.close()
+        for backup_number in range(self.backup_count - 1, 0, -1):
+            backup_path = self.path.with_name(f'{self.path.name}.{backup_number}')
+            if backup_path.exists():
+                os.replace(
+                    backup_path, self.path.with_name(f'{self.path.name}.{backup_number + 1}')
+                )
+        if self.backup_count:
+            os.replace(self.path, self.path.with_name(f'{self.path.name}.1'))
+        else:
+            self.path.unlink()
+        self.__file = open(self.path, 'ab')  # noqa: SIM115
+        self.__file_size = 0
+
+
+def _get_record_time(line: bytes) -> float:
+    try:
+        return json.loads(line)['time']
+    except (json.JSONDecodeError, KeyError):  # line written partially
+        return float('inf')
+
+
+def _find_time_offset(file_map: mmap.mmap, since_time: float) -> int:
+    """Binary search for the first record not older than the time. Records are time ordered."""
+    low = 0
+    high = len(file_map)
+    while low < high:
+        middle = (low + high) // 2
+        line_start = file_map.rfind(b'\n', 0, middle) + 1
+        line_end = file_map.find(b'\n', line_start)
+        if line_end == -1:
+            line_end = len(file_map)
+
+        if _get_record_time(file_map[line_start:line_end]) < since_time:
+            low = line_end + 1
+        else:
+            high = line_start
+    return low
+
+
+def _get_log_file_paths(path: str | os.PathLike) -> list[pathlib.Path]:
+    """Log file and its rotated backups from the oldest to the newest"""
+    path = pathlib.Path(path)
+    backup_paths = sorted(
+        (
+            backup_path
+            for backup_path in path.parent.glob(f'{path.name}.*')
+            if backup_path.suffix[1:].isdigit()
+        ),
+        key=lambda backup_path: int(backup_path.suffix[1:]),
+        reverse=True,
+    )
+    return [*backup_paths, path] if path.exists() else backup_paths
+
+
+def read_log_file(
+    path: str | os.PathLike,
+    *,
+    port: str | None = None,
+    msg_type: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+) -> 'Iterator[dict[str, Any]]':
+    """Read log records written by the log file sink from the file and its rotated backups.
+    Files are memory mapped and the time range start is found by binary search,
+    so the records out of range aren't read.
+
+    Args:
+        path: Log file path
+        port: Read only records with the port name
+        msg_type: Read only records with the message type
+        since: Read only records not older than the epoch time
+        until: Read only records not newer than the epoch time
+
+    Returns:
+        Record dicts with `time`, `text`, `color`, `ports` and `msg_types` keys
+    """
+    # Quick rejection of the lines before parsing
+    port_bytes = json.dumps(port, ensure_ascii=False).encode() if port else None
+    msg_type_bytes = json.dumps(msg_type).encode() if msg_type else None
+
+    for file_path in _get_log_file_paths(path):
+        if not file_path.stat().st_size:
+            continue
+
+        with (
+            open(file_path, 'rb') as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map,
+        ):
+            offset = _find_time_offset(file_map, since) if since else 0
+            while offset < len(file_map):
+                line_end = file_map.find(b'\n', offset)
+                if line_end == -1:
+                    line_end = len(file_map)
+                line = file_map[offset:line_end]
+                offset = line_end + 1
+
+                if (port_bytes and port_bytes not in line) or (
+                    msg_type_bytes and msg_type_bytes not in line
+                ):
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:  # line written partially
+                    continue
+
+                if until and record['time'] > until:
+                    return
+                if (port and port not in record['ports']) or (
+                    msg_type and msg_type not in record['msg_types']
+                ):
+                    continue
+                yield record
+
+
+def _parse_time(time_text: str) -> float:
+    """Parse epoch time, ISO date and time or today's time"""
+    try:
+        return float(time_text)
+    except ValueError:
+        pass
+
+    try:
+        return datetime.datetime.fromisoformat(time_text).timestamp()
+    except ValueError:
+        today_time = datetime.time.fromisoformat(time_text)
+        return datetime.datetime.combine(datetime.date.today(), today_time).timestamp()
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+    """Print records from log file filtered by command line arguments"""
+    parser = argparse.ArgumentParser(
+        prog='python -m midiscripter.logger.log_file',
+        description='Print MIDI Scripter log file records',
+    )
+    parser.add_argument('path', help='log file path, rotated backups are read too')
+    parser.add_argument('--port', help='only records with the port name')
+    parser.add_argument('--type', dest='msg_type', help='only records with the message type')
+    parser.add_argument('--since', type=_parse_time, help='epoch time, ISO date and time or time')
+    parser.add_argument('--until', type=_parse_time, help='epoch time, ISO date and time or time')
+    args = parser.parse_args(argv)
+
+    try:
+        for record in read_log_file(
+            args.path,
+            port=args.port,
+            msg_type=args.msg_type,
+            since=args.since,
+            until=args.until,
+        ):
+            sys.stdout.write(f'{Log._get_precise_timestamp(record["time"])}: {record["text"]}\n')
+    except BrokenPipeError:  # output piped to `head`
+        pass
+
+
+if __name__ == '__main__':
+    main()
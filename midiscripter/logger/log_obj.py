@@ -1,23 +1,35 @@
 import collections
+import enum
+import itertools
+import threading
 import time
 from typing import TYPE_CHECKING, NamedTuple, Any
 
+import midiscripter
 import midiscripter.shared
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    import os
+    from collections.abc import Callable, Iterable
+    from midiscripter.logger.log_file import LogFileSink
     from midiscripter.base.port_base import Port, Output, Subscribable, SubscribedCall
     from midiscripter.base.msg_base import Msg
 
 
 class LogObjRef:
-    __slots__ = ('text', 'color', 'link')
+    __slots__ = ('text', 'color', 'link', 'is_port', 'msg_type')
     text: str
     color: None | str
     link: None | str
+    is_port: bool
+    msg_type: None | str
 
     def __init__(self, obj: Any):
         self.text = str(obj)
+        self.is_port = isinstance(
+            obj, midiscripter.base.port_base.Port | midiscripter.base.port_base.Subscribable
+        )
+        self.msg_type = str(obj.type) if isinstance(obj, midiscripter.base.msg_base.Msg) else None
 
         try:
             self.color = obj._log_color
@@ -30,12 +42,161 @@ class LogObjRef:
             self.link = None
 
 
+class LogCategory(enum.StrEnum):
+    MSG_RECEIVED = 'msg received'
+    """Messages received by inputs"""
+    MSG_SENT = 'msg sent'
+    """Messages sent by outputs"""
+    CALL_MADE = 'call made'
+    """Subscribed calls made"""
+    PORT = 'port'
+    """Ports opened and closed"""
+    USER = 'user'
+    """Other log messages: script's `log` calls, warnings and errors"""
+
+
+_CATEGORY_FIXED_TEXTS = {
+    LogCategory.MSG_RECEIVED: ('got message',),
+    LogCategory.MSG_SENT: ('sent message',),
+    LogCategory.CALL_MADE: ('calling',),
+}
+"""Lowercase text parts that all entries of the category contain"""
+
+
+class _RepeatSummary(NamedTuple):
+    """Summary of the run of structurally identical entries collapsed to its last entry"""
+
+    run_id: int
+    count: int
+    min: float | None
+    max: float | None
+
+    def __str__(self):
+        if self.count == 1:
+            return ''
+        if self.min is None:
+            return f' (x{self.count})'
+        return f' (x{self.count}, min {self.min}, max {self.max})'
+
+
 class LogEntry(NamedTuple):
+    """Log entry. Buffered entries keep the objects to format the text with
+    and the epoch time. They are converted to `LogObjRef` objects and the timestamp string
+    by the flush worker, so the logging thread doesn't spend time on that."""
+
     text: str
-    format_args: tuple[LogObjRef, ...]
-    format_kwargs: dict[str, LogObjRef]
-    timestamp: str
+    format_args: tuple[LogObjRef | Any, ...]
+    format_kwargs: dict[str, LogObjRef | Any]
+    timestamp: str | float
     color: None | str
+    time: float = 0
+    """Epoch time of the entry, set by the conversion"""
+    repeat: _RepeatSummary | None = None
+    """Summary of the repeated entries collapsed to the entry"""
+
+
+def _to_obj_ref(obj: Any) -> LogObjRef:
+    return obj if isinstance(obj, LogObjRef) else LogObjRef(obj)
+
+
+def _copy_msg(msg: 'Msg') -> 'Msg':
+    """Copy that is several times faster than `copy.copy`.
+    List and dict attributes like OSC message data are copied too."""
+    msg_copy = object.__new__(type(msg))
+    msg_copy.__dict__.update(
+        {
+            attr: value.copy() if type(value) is list or type(value) is dict else value
+            for attr, value in msg.__dict__.items()
+        }
+    )
+    return msg_copy
+
+
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _snapshot_obj(obj: Any) -> Any:
+    """Make the object to format the entry with later, that keeps its state at the log call.
+    Messages are copied, other mutable objects are converted to `LogObjRef`.
+    Ports, calls and other scripter objects are printed by the name and kept as they are."""
+    obj_type = type(obj)
+    if obj_type in _IMMUTABLE_TYPES or isinstance(obj, enum.Enum):
+        return obj
+    if isinstance(obj, midiscripter.base.msg_base.Msg):
+        return _copy_msg(obj)
+    if hasattr(obj_type, '_log_color'):
+        return obj
+    return LogObjRef(obj)
+
+
+def _resolve_entry(log_entry: LogEntry) -> LogEntry:
+    """Convert buffered log entry objects to `LogObjRef` objects and the time to timestamp"""
+    text, format_args, format_kwargs, timestamp, color, entry_time, repeat = log_entry
+    if isinstance(timestamp, float):
+        entry_time = timestamp
+        timestamp = Log._get_precise_timestamp(timestamp)
+
+    return LogEntry(
+        text,
+        tuple(_to_obj_ref(obj) for obj in format_args),
+        {arg: _to_obj_ref(obj) for arg, obj in format_kwargs.items()},
+        timestamp,
+        color,
+        entry_time,
+        repeat,
+    )
+
+
+def _format_plain_text(log_entry: LogEntry) -> str:
+    """Format converted entry text with the objects texts"""
+    try:
+        return log_entry.text.format(
+            *[obj_ref.text for obj_ref in log_entry.format_args],
+            **{arg: obj_ref.text for arg, obj_ref in log_entry.format_kwargs.items()},
+        )
+    except (KeyError, IndexError):
+        return log_entry.text
+
+
+def _get_entry_structure(log_entry: LogEntry) -> tuple[list, list]:
+    """Split the entry to its structure and the values that change in the repeated entries.
+    Message value is its last attribute, the rest of the attributes are its structure.
+    Numbers are the values of the entries without messages and are ignored in the entries
+    with messages, like the sent message age.
+
+    Returns:
+        Entry structure to compare and the entry values
+    """
+    msg_class = midiscripter.base.msg_base.Msg
+    structure = [log_entry.text, log_entry.color]
+    values = []
+    number_values = []
+    for obj in (*log_entry.format_args, *log_entry.format_kwargs.values()):
+        obj_type = type(obj)
+        if obj_type is int or obj_type is float:
+            number_values.append(obj)
+        elif obj_type is str:
+            structure.append(obj)
+        elif obj_type is LogObjRef:
+            structure.append(obj.text)
+        elif isinstance(obj, msg_class):
+            msg_attrs = obj._as_tuple()
+            structure.append(obj_type)
+            structure.extend(msg_attrs[:-1])
+            values.append(msg_attrs[-1])
+        else:  # ports, calls and the objects that can't be compared safely
+            structure.append(id(obj))
+
+    if not values:
+        structure.append(len(number_values))
+        values = number_values
+    return structure, values
+
+
+def _append_forwarded_entry(log_entry: LogEntry, entry_time: float) -> None:
+    """Append log entry made in process pool worker to the script process log"""
+    if midiscripter.logger.log._accepts_messages:
+        midiscripter.logger.log._append_entry(log_entry, entry_time)
 
 
 class Log:
@@ -52,6 +213,8 @@ class Log:
     """
 
     FLUSH_DELAY = 0.05
+    """Min time between flushes. Entries are flushed at once when the log is idle
+    and collected for this time under load."""
 
     ADD_SPACER_THRESHOLD_SEC = 2
     """Time in seconds after which an empty line is added to log to separate logged actions"""
@@ -59,8 +222,11 @@ class Log:
     BUFFER_SIZE = 200
     """Max size of message buffer to flush to log widget when it becomes visible"""
 
-    _formatter: 'Callable[list[[LogEntry | None]], str]'
-    _sink: 'Callable[[str], None]'
+    HISTORY_SIZE = 100_000
+    """Max number of log lines kept by the GUI log widget"""
+
+    _formatter: 'Callable[list[[LogEntry | None]], str] | None' = None
+    _sink: 'Callable[[str], None] | None' = None
     _accepts_messages: bool
     _flushing_is_enabled: bool
 
@@ -68,9 +234,26 @@ class Log:
         self._accepts_messages = True
         self.__flushing_is_enabled = False
 
+        self.__disabled_categories: set[LogCategory] = set()
+        self.__excluded_categories: set[LogCategory] = set()
+        self.__skipped_categories: set[LogCategory] = set()
+        self.__disabled_ports: set[Port] = set()
+        self.__only_ports: set[Port] | None = None
+
         self.__buffer: collections.deque[LogEntry]
         self.__buffer = collections.deque(maxlen=self.BUFFER_SIZE)
+        self.__buffer_condition = threading.Condition()
         self.__last_entry_time = time.time()
+        self.__last_flush_time = 0
+        self.__flush_worker_is_running = False
+        self.__flush_worker_is_waiting = False
+        self.__file_sink: LogFileSink | None = None
+
+        self.__repeat_window_sec = 0
+        self.__run_ids = itertools.count()
+        self.__run_structure: list | None = None
+        self.__run_start_time = 0
+        self.__run_summary: _RepeatSummary | None = None
 
     def __call__(self, text: str | Any, *args: Any, **kwargs: Any):
         """Print log message.
@@ -83,26 +266,232 @@ class Log:
         [inputs][midiscripter.base.port_base.Input],
         [outputs][midiscripter.base.port_base.Output],
         [messages][midiscripter.base.msg_base.Msg] and callable arguments are highlighted.
+
+        The text is formatted later by background thread. Messages are copied
+        and other mutable arguments are converted to text at the call,
+        so the entry shows them as they were at the call.
         """
-        if not self._accepts_messages:
-            return
+        if self.__is_enabled(LogCategory.USER):
+            self.__add_entry(text, args, kwargs)
 
-        entry_color = kwargs.pop('_color', None)
+    def set_file(
+        self, path: 'str | os.PathLike | None', *, max_size_mb: float = 10, backup_count: int = 5
+    ) -> None:
+        """Also write log entries to JSON lines file. The file gets the entries hidden
+        by the GUI log filter, but not the entries of disabled categories and ports.
+        The file is written by background thread and rotated by size.
+        View it with `python -m midiscripter.logger.log_file <path>`.
+
+        Args:
+            path: Log file path, `None` to stop writing the file
+            max_size_mb: File size in megabytes to rotate the file at
+            backup_count: Number of rotated files to keep
+        """
+        from midiscripter.logger.log_file import LogFileSink
+
+        if self.__file_sink:
+            self.__file_sink.close()
+            self.__file_sink = None
 
-        format_args = tuple(LogObjRef(obj) for obj in args)
-        format_kwargs = {arg: LogObjRef(obj) for arg, obj in kwargs.items()}
+        if path is not None:
+            self.__file_sink = LogFileSink(path, int(max_size_mb * 1024 * 1024), backup_count)
+        self.__update_skipped_categories()
 
+    def set_collapse_repeats(self, enabled: bool = True, *, window_sec: float = 1) -> None:
+        """Collapse runs of structurally identical entries, like messages of a moving fader,
+        to one updating entry with the number of the entries and min and max values.
+        Entries are identical if they have the same text template, ports and message attributes
+        but the last one, which is the message value. The log file gets the entries uncollapsed.
+
+        Args:
+            enabled: Collapse the repeated entries
+            window_sec: Max time from the first entry of the run to collapse to it,
+                a new entry is started after it
+        """
+        with self.__buffer_condition:
+            self.__repeat_window_sec = window_sec if enabled else 0
+            self.__run_structure = None
+
+    def set_category_enabled(self, category: LogCategory | str, enabled: bool = True) -> None:
+        """Enable or disable logging of the entries of the category.
+        Disabled entries are dropped before any formatting, so they cost nothing.
+
+        Args:
+            category: Log entries category
+            enabled: Log the category entries
+        """
+        category = LogCategory(category)
+        if enabled:
+            self.__disabled_categories.discard(category)
+        else:
+            self.__disabled_categories.add(category)
+        self.__update_skipped_categories()
+
+    def _set_excluded_texts(self, excluded_texts: 'Iterable[str]') -> None:
+        """Don't buffer the categories which all entries would be excluded by the log widget
+        for containing any of the lowercase texts. They are still written to the log file."""
+        self.__excluded_categories = {
+            category
+            for category, fixed_texts in _CATEGORY_FIXED_TEXTS.items()
+            if all(
+                any(excluded_text in fixed_text for excluded_text in excluded_texts)
+                for fixed_text in fixed_texts
+            )
+        }
+        self.__update_skipped_categories()
+
+    def __update_skipped_categories(self) -> None:
+        """Skip making the entries that neither the log file nor the buffer gets"""
+        self.__skipped_categories = self.__disabled_categories
+        if not self.__file_sink:
+            self.__skipped_categories = self.__skipped_categories | self.__excluded_categories
+
+    def set_port_enabled(self, port: 'Port | Subscribable', enabled: bool = True) -> None:
+        """Enable or disable logging of the messages, calls and events of the port.
+
+        Args:
+            port: Port or other object that calls can subscribe to
+            enabled: Log the port entries
+        """
+        for port_to_set in self.__with_wrapped_ports(port):
+            if enabled:
+                self.__disabled_ports.discard(port_to_set)
+            else:
+                self.__disabled_ports.add(port_to_set)
+
+    def set_only_ports(self, *ports: 'Port | Subscribable') -> None:
+        """Log the messages, calls and events of these ports only.
+        Entries without port like `log` calls are logged as usual.
+
+        Args:
+            ports: Ports or other objects that calls can subscribe to, none to log all ports
+        """
+        if ports:
+            self.__only_ports = {
+                port_to_set for port in ports for port_to_set in self.__with_wrapped_ports(port)
+            }
+        else:
+            self.__only_ports = None
+
+    @staticmethod
+    def __with_wrapped_ports(port: 'Port | Subscribable') -> list['Port | Subscribable']:
+        """Multiport with the ports it wraps, as its inputs log the received messages"""
+        return [port, *getattr(port, '_wrapped_ports', ())]
+
+    def __is_enabled(
+        self, category: LogCategory, port: 'Port | Subscribable | None' = None
+    ) -> bool:
+        """Check if entry should be logged before making it"""
+        if not self._accepts_messages or category in self.__skipped_categories:
+            return False
+        if port is None:
+            return True
+        return port not in self.__disabled_ports and (
+            self.__only_ports is None or port in self.__only_ports
+        )
+
+    def __add_entry(
+        self,
+        text: str | Any,
+        args: tuple,
+        kwargs: dict,
+        category: LogCategory = LogCategory.USER,
+    ) -> None:
+        entry_color = kwargs.pop('_color', None)
         now_time = midiscripter.shared.precise_epoch_time()
-        timestamp = self._get_precise_timestamp(now_time)
 
-        text = str(text)
-        log_entry = LogEntry(text, format_args, format_kwargs, timestamp, entry_color)
+        # Objects can be changed before the flush that formats the entry
+        for arg, obj in kwargs.items():
+            kwargs[arg] = _snapshot_obj(obj)
+        if args:
+            args = tuple(_snapshot_obj(obj) for obj in args)
+
+        log_entry = LogEntry(str(text), args, kwargs, now_time, entry_color)
+
+        if midiscripter.shared.process_executor.is_worker_process():
+            # objects aren't always picklable, so they are converted in the worker
+            log_entry = _resolve_entry(log_entry)._replace(timestamp=now_time)
+            midiscripter.shared.process_executor.forward_to_main_process(
+                _append_forwarded_entry, log_entry, now_time
+            )
+        else:
+            self._append_entry(
+                log_entry, now_time, to_buffer=category not in self.__excluded_categories
+            )
+
+    def _append_entry(
+        self, log_entry: LogEntry, now_time: float, *, to_buffer: bool = True
+    ) -> None:
+        """Write the entry to the log file and buffer it for the sink
+
+        Args:
+            log_entry: Entry to append
+            now_time: Entry epoch time
+            to_buffer: Buffer the entry, entries hidden by the GUI log filter are only written
+                to the log file
+        """
+        if self.__file_sink:
+            self.__file_sink._append_entry(log_entry)
+        if not to_buffer:
+            return
+
+        with self.__buffer_condition:
+            if self.__repeat_window_sec:
+                log_entry = self.__collapse_repeated_entry(log_entry, now_time)
+                if log_entry is None:
+                    return
+
+            if now_time - self.__last_entry_time > self.ADD_SPACER_THRESHOLD_SEC:
+                self.__buffer.append(LogEntry('', (), {}, now_time, log_entry.color))
+            self.__last_entry_time = now_time
+
+            self.__buffer.append(log_entry)
+
+            if self.__flush_worker_is_waiting:
+                self.__flush_worker_is_waiting = False
+                self.__buffer_condition.notify()
 
-        if now_time - self.__last_entry_time > self.ADD_SPACER_THRESHOLD_SEC:
-            self.__buffer.append(LogEntry('', (), {}, timestamp, entry_color))
+    def __collapse_repeated_entry(self, log_entry: LogEntry, now_time: float) -> LogEntry | None:
+        """Collapse the entry to the run of the previous entries if it repeats them.
+        Runs under the buffer lock.
+
+        Returns:
+            Entry with the run summary to append, `None` if the entry is collapsed
+            to the buffered run entry
+        """
+        structure, values = _get_entry_structure(log_entry)
+        value = values[0] if len(values) == 1 else None
+        if type(value) is not int and type(value) is not float:
+            value = None
+
+        summary = self.__run_summary
+        if (
+            structure != self.__run_structure
+            or now_time - self.__run_start_time > self.__repeat_window_sec
+        ):
+            self.__run_structure = structure
+            self.__run_start_time = now_time
+            self.__run_summary = _RepeatSummary(next(self.__run_ids), 1, value, value)
+            return LogEntry(*log_entry[:6], self.__run_summary)
+
+        if value is None or summary.min is None:
+            summary = _RepeatSummary(summary.run_id, summary.count + 1, None, None)
+        else:
+            summary = _RepeatSummary(
+                summary.run_id,
+                summary.count + 1,
+                value if value < summary.min else summary.min,
+                value if value > summary.max else summary.max,
+            )
+        self.__run_summary = summary
         self.__last_entry_time = now_time
+        log_entry = LogEntry(*log_entry[:6], summary)
 
-        self.__buffer.append(log_entry)
+        last_entry = self.__buffer[-1] if self.__buffer else None
+        if last_entry and last_entry.repeat and last_entry.repeat.run_id == summary.run_id:
+            self.__buffer[-1] = log_entry
+            return None
+        return log_entry  # previous run entry is flushed
 
     @property
     def _flushing_is_enabled(self) -> bool:
@@ -110,25 +499,49 @@ class Log:
 
     @_flushing_is_enabled.setter
     def _flushing_is_enabled(self, state: bool) -> None:
-        if not self._formatter or not self._sink:
+        if state and (not self._formatter or not self._sink):
             raise AttributeError('Set `log._formatter` and `log._sink` before enabling flushing')
 
-        self.__flushing_is_enabled = state
-        if state:
-            midiscripter.shared.thread_executor.submit(self._buffer_flush_worker)
+        with self.__buffer_condition:
+            self.__flushing_is_enabled = state
+            if state and not self.__flush_worker_is_running:
+                self.__flush_worker_is_running = True
+                midiscripter.shared.thread_executor.submit(self._buffer_flush_worker)
+            self.__buffer_condition.notify()  # to flush or to stop
 
     def _buffer_flush_worker(self) -> None:
-        """Thread worker loop that flushes buffered messages"""
-        while self.__flushing_is_enabled:
-            if self.__buffer:
-                self._flush()
-            time.sleep(self.FLUSH_DELAY)
+        """Thread worker loop that waits for buffered messages and flushes them"""
+        while True:
+            with self.__buffer_condition:
+                while self.__flushing_is_enabled and not self.__buffer:
+                    self.__flush_worker_is_waiting = True
+                    self.__buffer_condition.wait()
+
+                if not self.__flushing_is_enabled:
+                    self.__flush_worker_is_running = False
+                    return
+
+            # Cap the flush rate under load, more entries are collected meanwhile
+            wait_time = self.__last_flush_time + self.FLUSH_DELAY - time.monotonic()
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+            self._flush()
+            self.__last_flush_time = time.monotonic()
 
     def _flush(self) -> None:
         """Sends buffered messages to sink"""
-        output_entries = []
-        while self.__buffer:
-            output_entries.append(self.__buffer.popleft())  # for thread safety
+        if self.__file_sink:
+            self.__file_sink.flush()
+
+        with self.__buffer_condition:
+            if not self.__buffer or not self._sink:
+                return
+            output_entries = self.__buffer
+            self.__buffer = collections.deque(maxlen=self.BUFFER_SIZE)
+
+        # entries dropped by the buffer overflow are never converted
+        output_entries = [_resolve_entry(entry) for entry in output_entries]
 
         try:
             self._sink(self._formatter(output_entries))
@@ -157,24 +570,31 @@ class Log:
         **log_call_kwargs,
     ) -> None:
         """Print port open message"""
+        if success and not self.__is_enabled(LogCategory.PORT, port_instance):
+            return
+        if not success and not self.__is_enabled(LogCategory.USER):  # failures are errors
+            return
+
         if custom_text:
-            self(custom_text, **log_call_kwargs)
+            self.__add_entry(custom_text, (), log_call_kwargs)
         elif success:
             if port_instance._is_virtual:
-                self(
+                self.__add_entry(
                     'Created and opened {port} virtual {desc}',
-                    port=port_instance,
-                    desc=port_instance._log_description,
+                    (),
+                    {'port': port_instance, 'desc': port_instance._log_description},
                 )
             else:
-                self(
-                    'Opened {port} {desc}', port=port_instance, desc=port_instance._log_description
+                self.__add_entry(
+                    'Opened {port} {desc}',
+                    (),
+                    {'port': port_instance, 'desc': port_instance._log_description},
                 )
         else:
-            self.red(
+            self.__add_entry(
                 'Failed to open {port} {desc}',
-                port=port_instance,
-                desc=port_instance._log_description,
+                (),
+                {'port': port_instance, 'desc': port_instance._log_description, '_color': 'red'},
             )
 
     def _port_close(
@@ -186,37 +606,60 @@ class Log:
         **log_call_kwargs,
     ) -> None:
         """Print port close message"""
+        if success and not self.__is_enabled(LogCategory.PORT, port_instance):
+            return
+        if not success and not self.__is_enabled(LogCategory.USER):  # failures are errors
+            return
+
         if custom_text:
-            self(custom_text, **log_call_kwargs)
+            self.__add_entry(custom_text, (), log_call_kwargs)
         elif success:
-            self('Closed {port} {desc}', port=port_instance, desc=port_instance._log_description)
+            self.__add_entry(
+                'Closed {port} {desc}',
+                (),
+                {'port': port_instance, 'desc': port_instance._log_description},
+            )
         else:
-            self.red(
+            self.__add_entry(
                 'Failed to close {port} {desc}',
-                port=port_instance,
-                desc=port_instance._log_description,
+                (),
+                {'port': port_instance, 'desc': port_instance._log_description, '_color': 'red'},
             )
 
     def _msg_received(self, subscribable_instance: 'Subscribable', msg: 'Msg') -> None:
         """Print message received message"""
-        self('{subscribable} got message {msg}', subscribable=subscribable_instance, msg=msg)
+        if self.__is_enabled(LogCategory.MSG_RECEIVED, subscribable_instance):
+            self.__add_entry(
+                '{subscribable} got message {msg}',
+                (),
+                {'subscribable': subscribable_instance, 'msg': msg},
+                LogCategory.MSG_RECEIVED,
+            )
 
     def _msg_sent(self, output: 'Output', msg: 'Msg') -> None:
         """Print message sent message"""
+        if not self.__is_enabled(LogCategory.MSG_SENT, output):
+            return
+
         if msg.source:
-            self(
+            self.__add_entry(
                 '{output} sent message {msg} received {age_ms} ms ago',
-                output=output,
-                msg=msg,
-                age_ms=msg._age_ms,
+                (),
+                {'output': output, 'msg': msg, 'age_ms': msg._age_ms},
+                LogCategory.MSG_SENT,
             )
         else:
-            self('{output} sent message {msg}', output=output, msg=msg)
+            self.__add_entry(
+                '{output} sent message {msg}',
+                (),
+                {'output': output, 'msg': msg},
+                LogCategory.MSG_SENT,
+            )
 
     def _call_made(self, call: 'SubscribedCall') -> None:
         """Print subscribed callable called message"""
-        if '._' not in str(call):
-            self('Calling {call}', call=call)
+        if self.__is_enabled(LogCategory.CALL_MADE, call.owner) and '._' not in str(call):
+            self.__add_entry('Calling {call}', (), {'call': call}, LogCategory.CALL_MADE)
 
     def red(self, text: str | Any, *args, **kwargs) -> None:
         """Print red log message"""
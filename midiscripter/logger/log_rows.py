@@ -0,0 +1,149 @@
+import functools
+import itertools
+import string
+from typing import NamedTuple
+
+from midiscripter.logger.log_obj import LogEntry, LogObjRef
+
+_row_numbers = itertools.count()
+
+
+class LogSegment(NamedTuple):
+    """Part of the log row text printed with the same color"""
+
+    text: str
+    color: None | str
+    link: None | str
+
+
+class LogRow:
+    """Log entry text line split to colored segments, made by the flush worker
+    for the GUI log widget to print without parsing"""
+
+    __slots__ = (
+        'number',
+        'timestamp',
+        'segments',
+        'text',
+        'search_text',
+        'run_id',
+        'highlight_spans',
+    )
+
+    def __init__(
+        self,
+        timestamp: str,
+        segments: tuple[LogSegment, ...],
+        search_text: str,
+        run_id: int | None,
+    ):
+        """
+        Args:
+            timestamp: Entry timestamp, empty for the spacer and the entry's following lines
+            segments: Row text segments
+            search_text: Lowercase text of the whole entry to filter the entry rows together
+            run_id: Collapsed repeated entries run the entry belongs to
+        """
+        self.number = next(_row_numbers)
+        self.timestamp = timestamp
+        self.segments = segments
+        self.text = ''.join(segment.text for segment in segments)
+        self.search_text = search_text
+        self.run_id = run_id
+        self.highlight_spans: tuple[tuple[int, int], ...] = ()
+        """Start and end indexes of the filter matches in the row text,
+        set by the log widget when it filters the row"""
+
+    @property
+    def is_spacer(self) -> bool:
+        return not self.search_text
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(text: str) -> tuple[tuple[str, str | int | None, str], ...]:
+    """Split `.format` template to literal text and the fields to insert after it
+
+    Returns:
+        Literal text, field argument name or position (`None` for no field) and format spec
+    """
+    template_parts = []
+    auto_position = itertools.count()
+    for literal_text, field_name, format_spec, _ in string.Formatter().parse(text):
+        if field_name is None:
+            field = None
+        elif field_name == '':
+            field = next(auto_position)
+        elif field_name.isdigit():
+            field = int(field_name)
+        else:
+            field = field_name
+        template_parts.append((literal_text, field, format_spec or ''))
+    return tuple(template_parts)
+
+
+def _to_segments(log_entry: LogEntry) -> list[LogSegment]:
+    """Format the entry text to segments colored by the entry color
+    and the inserted objects colors"""
+    try:
+        segments = []
+        for literal_text, field, format_spec in _parse_template(log_entry.text):
+            if literal_text:
+                segments.append(LogSegment(literal_text, log_entry.color, None))
+            if field is None:
+                continue
+
+            if isinstance(field, int):
+                obj_ref: LogObjRef = log_entry.format_args[field]
+            else:
+                obj_ref: LogObjRef = log_entry.format_kwargs[field]
+
+            segments.append(
+                LogSegment(
+                    format(obj_ref.text, format_spec),
+                    obj_ref.color or log_entry.color,
+                    obj_ref.link if obj_ref.color else None,
+                )
+            )
+    except (KeyError, IndexError, ValueError):
+        segments = [LogSegment(log_entry.text, log_entry.color, None)]
+
+    if log_entry.repeat and log_entry.repeat.count > 1:
+        segments.append(LogSegment(str(log_entry.repeat), 'grey', None))
+    return segments
+
+
+def _split_lines(segments: list[LogSegment]) -> list[list[LogSegment]]:
+    lines = [[]]
+    for segment in segments:
+        first_line_text, *next_lines_texts = segment.text.split('\n')
+        if first_line_text:
+            lines[-1].append(segment._replace(text=first_line_text))
+        lines.extend(
+            [segment._replace(text=line_text)] if line_text else []
+            for line_text in next_lines_texts
+        )
+    return lines
+
+
+def log_rows_formatter(log_entries: list[LogEntry]) -> list[LogRow]:
+    """Format log entries to rows for the GUI log widget, a row per entry text line"""
+    rows = []
+    for entry in log_entries:
+        if not entry.text:
+            rows.append(LogRow('', (), '', None))
+            continue
+
+        segments = _to_segments(entry)
+        search_text = ''.join(segment.text for segment in segments).lower()
+        run_id = entry.repeat.run_id if entry.repeat else None
+
+        for line_number, line_segments in enumerate(_split_lines(segments)):
+            rows.append(
+                LogRow(
+                    '' if line_number else entry.timestamp,
+                    tuple(line_segments),
+                    search_text,
+                    run_id,
+                )
+            )
+    return rows
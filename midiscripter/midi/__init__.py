@@ -1,4 +1,17 @@
-from midiscripter.midi.midi_msg import ChannelMsg, MidiMsg, MidiType, SysexMsg
+from midiscripter.midi.midi_msg import (
+    ChannelMsg,
+    MidiMsg,
+    MidiType,
+    SysexMsg,
+    SysexData,
+    SysexChunkMsg,
+    SystemMsg,
+)
+from midiscripter.midi.midi_clock import MidiClock
+from midiscripter.midi.midi_file_port import MidiFileIn, MidiFileOut
 from midiscripter.midi.midi_note_data import NoteData
+from midiscripter.midi.midi_note_tracker import ChordMsg, NoteTracker, CHORD_SHAPES
 from midiscripter.midi.midi_port import MidiIn, MidiOut, MidiIO
 from midiscripter.midi.midi_ports_changed import MidiPortsChangedIn
+from midiscripter.midi.midi_state import MidiState
+from midiscripter.midi.midi_sysex_transfer import SysexTransfer
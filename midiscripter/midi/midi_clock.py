@@ -0,0 +1,100 @@
+import time
+from typing import TYPE_CHECKING
+
+import rtmidi.midiconstants
+
+if TYPE_CHECKING:
+    from midiscripter.midi.midi_port import MidiIn
+
+
+CLOCK_TICKS_PER_QUARTER_NOTE = 24
+_CLOCK_TICKS_PER_SONG_POSITION_STEP = 6  # song position is counted in 16th notes
+_MAX_CLOCK_TICK_INTERVAL_SEC = 0.5  # slower clock means it was stopped
+
+
+class MidiClock:
+    """MIDI clock follower of [`MidiIn`][midiscripter.MidiIn] port available
+    as its `clock` attribute. Tracks transport state, song position and tempo.
+
+    Clock ticks are handled in the port callback thread without creating messages,
+    so following the clock costs nearly nothing. Tempo is estimated
+    by smoothing clock tick intervals.
+
+    Example:
+        ``` python
+        @midi_input.subscribe(MidiType.START)
+        def on_start() -> None:
+            log(f'Started at {midi_input.clock.bpm} BPM')
+        ```
+    """
+
+    is_playing: bool
+    """Transport is playing: started or continued and not stopped"""
+
+    ticks: int
+    """Clock ticks since song start, moved by song position messages.
+    Ticks are counted only while playing."""
+
+    def __init__(self, port: 'MidiIn', smoothing: float = 0.1):
+        """
+        Args:
+            port: The [`MidiIn`][midiscripter.MidiIn] instance which clock is followed
+            smoothing: Tempo estimation smoothing factor (0-1). Lower is smoother but slower
+                       to follow tempo changes.
+        """
+        self.__port = port
+        self.__smoothing = smoothing
+        self.__last_tick_time = 0
+        self.__tick_interval_sec = 0
+
+        self.is_playing = False
+        self.ticks = 0
+
+    def __str__(self):
+        return f'{self.__port} clock'
+
+    @property
+    def bpm(self) -> float | None:
+        """Smoothed tempo estimated from the clock ticks or `None` if there's no clock"""
+        if not self.__tick_interval_sec or (
+            time.perf_counter() - self.__last_tick_time > _MAX_CLOCK_TICK_INTERVAL_SEC
+        ):
+            return None
+        return 60 / (self.__tick_interval_sec * CLOCK_TICKS_PER_QUARTER_NOTE)
+
+    @property
+    def beats(self) -> float:
+        """Quarter notes since song start"""
+        return self.ticks / CLOCK_TICKS_PER_QUARTER_NOTE
+
+    def _update_raw(self, raw_midi_data: 'list[int] | tuple[int, ...]') -> None:
+        """Update the clock with raw MIDI data in the port callback thread"""
+        status_byte = raw_midi_data[0]
+
+        if status_byte == rtmidi.midiconstants.TIMING_CLOCK:
+            now = time.perf_counter()
+            interval_sec = now - self.__last_tick_time
+            self.__last_tick_time = now
+
+            if interval_sec > _MAX_CLOCK_TICK_INTERVAL_SEC:
+                pass  # first tick after pause, no interval to measure
+            elif not self.__tick_interval_sec:
+                self.__tick_interval_sec = interval_sec
+            else:  # exponential moving average
+                self.__tick_interval_sec += self.__smoothing * (
+                    interval_sec - self.__tick_interval_sec
+                )
+
+            if self.is_playing:
+                self.ticks += 1
+
+        elif status_byte == rtmidi.midiconstants.SONG_START:
+            self.ticks = 0
+            self.is_playing = True
+        elif status_byte == rtmidi.midiconstants.SONG_CONTINUE:
+            self.is_playing = True
+        elif status_byte == rtmidi.midiconstants.SONG_STOP:
+            self.is_playing = False
+        elif status_byte == rtmidi.midiconstants.SONG_POSITION_POINTER:
+            song_position = raw_midi_data[1] | (raw_midi_data[2] << 7)
+            self.ticks = song_position * _CLOCK_TICKS_PER_SONG_POSITION_STEP
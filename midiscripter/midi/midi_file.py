@@ -0,0 +1,190 @@
+import heapq
+import mmap
+import operator
+import pathlib
+import struct
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+_HEADER_CHUNK_ID = b'MThd'
+_TRACK_CHUNK_ID = b'MTrk'
+_META_EVENT = 0xFF
+_SYSEX_EVENT = 0xF0
+_ESCAPE_EVENT = 0xF7
+_TEMPO_META_TYPE = 0x51
+_END_OF_TRACK_META_TYPE = 0x2F
+_DEFAULT_TEMPO_USEC_PER_QUARTER = 500000  # 120 BPM
+
+
+def _read_variable_length(data: 'mmap.mmap | bytes', position: int) -> tuple[int, int]:
+    """Read variable-length quantity.
+
+    Returns:
+        The value and the position after it
+    """
+    value = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, position
+
+
+def _encode_variable_length(value: int) -> bytes:
+    encoded = [value & 0x7F]
+    value >>= 7
+    while value:
+        encoded.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(encoded))
+
+
+class _SmfReader:
+    """Standard MIDI file (type 0 or 1) reader. Reads events from memory-mapped file
+    one by one as they are iterated, so the file size doesn't affect the start time.
+    """
+
+    def __init__(self, file_path: pathlib.Path):
+        with open(file_path, 'rb') as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self.__mmap[:4] != _HEADER_CHUNK_ID:
+                raise ValueError('Not a standard MIDI file')
+
+            header_len = int.from_bytes(self.__mmap[4:8], 'big')
+            file_format, _, self.__division = struct.unpack('>HHH', self.__mmap[8:14])
+            if file_format not in (0, 1):
+                raise ValueError(f'Standard MIDI file type {file_format} is not supported')
+
+            self.__tracks_ranges = []
+            position = 8 + header_len
+            while position + 8 <= len(self.__mmap):
+                chunk_len = int.from_bytes(self.__mmap[position + 4 : position + 8], 'big')
+                if self.__mmap[position : position + 4] == _TRACK_CHUNK_ID:
+                    self.__tracks_ranges.append((position + 8, position + 8 + chunk_len))
+                position += 8 + chunk_len
+        except Exception:
+            self.__mmap.close()
+            raise
+
+    def close(self) -> None:
+        self.__mmap.close()
+
+    def iter_events(self) -> 'Iterator[tuple[float, bytes]]':
+        """Iterate all tracks' events merged in time order.
+
+        Yields:
+            Event time in seconds from the file start and raw MIDI data
+        """
+        if self.__division & 0x8000:  # SMPTE timing, negative frames per second in high byte
+            frames_per_sec = 256 - (self.__division >> 8)
+            sec_per_tick = 1 / (frames_per_sec * (self.__division & 0xFF))
+            ticks_per_quarter = None
+        else:
+            ticks_per_quarter = self.__division
+            sec_per_tick = _DEFAULT_TEMPO_USEC_PER_QUARTER / 1000000 / ticks_per_quarter
+
+        last_tick = 0
+        last_time_sec = 0
+        tracks_events = [self.__iter_track(start, end) for start, end in self.__tracks_ranges]
+        for tick, is_tempo, data in heapq.merge(*tracks_events, key=operator.itemgetter(0)):
+            last_time_sec += (tick - last_tick) * sec_per_tick
+            last_tick = tick
+
+            if not is_tempo:
+                yield last_time_sec, data
+            elif ticks_per_quarter:
+                sec_per_tick = data / 1000000 / ticks_per_quarter
+
+    def __iter_track(self, position: int, end: int) -> 'Iterator[tuple[int, bool, bytes | int]]':
+        """Iterate track events.
+
+        Yields:
+            Event time in ticks, `True` for tempo change,
+            raw MIDI data or new tempo in microseconds per quarter note
+        """
+        data = self.__mmap
+        tick = 0
+        running_status = 0
+
+        while position < end:
+            delta_ticks, position = _read_variable_length(data, position)
+            tick += delta_ticks
+
+            status_byte = data[position]
+            if status_byte & 0x80:
+                position += 1
+            else:
+                status_byte = running_status
+
+            if status_byte == _META_EVENT:
+                meta_type = data[position]
+                length, position = _read_variable_length(data, position + 1)
+                if meta_type == _TEMPO_META_TYPE:
+                    yield tick, True, int.from_bytes(data[position : position + 3], 'big')
+                elif meta_type == _END_OF_TRACK_META_TYPE:
+                    return
+                position += length
+
+            elif status_byte in (_SYSEX_EVENT, _ESCAPE_EVENT):
+                running_status = 0
+                length, position = _read_variable_length(data, position)
+                event_data = data[position : position + length]
+                position += length
+                if status_byte == _SYSEX_EVENT:
+                    event_data = b'\xf0' + event_data
+                yield tick, False, event_data
+
+            else:
+                running_status = status_byte
+                data_len = 1 if (status_byte & 0xF0) in (0xC0, 0xD0) else 2
+                yield tick, False, bytes((status_byte,)) + data[position : position + data_len]
+                position += data_len
+
+
+class _SmfWriter:
+    """Standard MIDI file (type 0) writer. Writes events to file as they come."""
+
+    TICKS_PER_QUARTER = 960
+    TICKS_PER_SEC = TICKS_PER_QUARTER * 1000000 / _DEFAULT_TEMPO_USEC_PER_QUARTER
+
+    def __init__(self, file_path: pathlib.Path):
+        self.__file: BinaryIO = open(file_path, 'wb')  # noqa: SIM115
+        self.__file.write(_HEADER_CHUNK_ID + struct.pack('>IHHH', 6, 0, 1, self.TICKS_PER_QUARTER))
+        self.__file.write(_TRACK_CHUNK_ID + b'\x00\x00\x00\x00')  # length is written on close
+        self.__track_start = self.__file.tell()
+        self.__last_tick = 0
+
+        tempo_bytes = _DEFAULT_TEMPO_USEC_PER_QUARTER.to_bytes(3, 'big')
+        self.__file.write(bytes((0, _META_EVENT, _TEMPO_META_TYPE, 3)) + tempo_bytes)
+
+    def write(self, time_sec: float, raw_midi_data: 'bytes | tuple[int, ...]') -> None:
+        """Write the event. Events that are earlier than previous one are written at its time."""
+        tick = max(round(time_sec * self.TICKS_PER_SEC), self.__last_tick)
+        delta_bytes = _encode_variable_length(tick - self.__last_tick)
+        self.__last_tick = tick
+
+        if raw_midi_data[0] == _SYSEX_EVENT:
+            event_bytes = (
+                b'\xf0' + _encode_variable_length(len(raw_midi_data) - 1) + bytes(raw_midi_data[1:])
+            )
+        elif raw_midi_data[0] >= _SYSEX_EVENT:  # system messages are stored as escaped data
+            event_bytes = (
+                b'\xf7' + _encode_variable_length(len(raw_midi_data)) + bytes(raw_midi_data)
+            )
+        else:
+            event_bytes = bytes(raw_midi_data)
+
+        self.__file.write(delta_bytes + event_bytes)
+
+    def close(self) -> None:
+        self.__file.write(bytes((0, _META_EVENT, _END_OF_TRACK_META_TYPE, 0)))
+        track_end = self.__file.tell()
+        self.__file.seek(self.__track_start - 4)
+        self.__file.write((track_end - self.__track_start).to_bytes(4, 'big'))
+        self.__file.close()
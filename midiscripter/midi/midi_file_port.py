@@ -0,0 +1,212 @@
+import pathlib
+import threading
+import time
+from typing import TYPE_CHECKING, overload
+
+import midiscripter.base.port_base
+import midiscripter.shared
+from midiscripter.logger import log
+from midiscripter.midi.midi_file import _SmfReader, _SmfWriter
+from midiscripter.midi.midi_high_resolution import HIGH_RESOLUTION_TYPES, _HighResolutionEncoder
+from midiscripter.midi.midi_msg import MidiType
+from midiscripter.midi.midi_port import raw_midi_to_msg, msg_to_raw_midi
+
+if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
+    from collections.abc import Callable, Container
+    from midiscripter.midi.midi_msg import MidiMsg
+
+
+_MAX_WORKER_SLEEP_SEC = 0.1  # to stop playing soon after the port is closed
+
+
+class MidiFileIn(midiscripter.base.port_base.Input):
+    """Standard MIDI file (type 0 or 1) player input port.
+    Produces [`MidiMsg`][midiscripter.MidiMsg] objects at the file events' time
+    following the file's tempo changes.
+
+    The file is played when the port is opened. The file events are read from
+    memory-mapped file as they are played, so large files start playing instantly.
+    """
+
+    _log_description: str = 'MIDI file player'
+
+    def __init__(self, file_path: str | pathlib.Path, *, loop: bool = False, speed: float = 1):
+        """
+        Args:
+            file_path: Standard MIDI file path
+            loop: Restart playing when the file ends
+            speed: Playback speed multiplier
+        """
+        if isinstance(file_path, str):
+            file_path = pathlib.Path(file_path)
+
+        super().__init__(file_path)
+        self.__file_path = file_path
+        self.__loop = loop
+        self.__speed = speed
+
+        self.position_sec: float = 0
+        """The last played event time from the file start"""
+
+    def __str__(self):
+        return f"'{self.__file_path.name}' player"
+
+    @property
+    def _is_available(self) -> bool:
+        return self.__file_path.is_file()
+
+    def _open(self) -> None:
+        try:
+            _SmfReader(self.__file_path).close()  # validate the file
+        except (OSError, ValueError) as exc:
+            log._port_open(
+                self, False, custom_text="Can't play {input}: {error}", input=self, error=exc
+            )
+            return
+
+        self.is_opened = True
+        midiscripter.shared.thread_executor.submit(self.__play_worker)
+        log._port_open(self, True, custom_text='Started {input}', input=self)
+
+    def _close(self) -> None:
+        self.is_opened = False
+        log._port_close(self, True, custom_text='Stopped {input}', input=self)
+
+    def __play_worker(self) -> None:
+        while self.is_opened:
+            reader = _SmfReader(self.__file_path)
+            try:
+                self.__play(reader)
+            finally:
+                reader.close()
+
+            if not self.__loop:
+                if self.is_opened:
+                    log('{input} finished playing', input=self)
+                return
+
+    def __play(self, reader: _SmfReader) -> None:
+        start_time = time.perf_counter()
+        for event_time_sec, raw_midi_data in reader.iter_events():
+            due_time = start_time + event_time_sec / self.__speed
+
+            while due_time - time.perf_counter() > _MAX_WORKER_SLEEP_SEC:
+                time.sleep(_MAX_WORKER_SLEEP_SEC)
+                if not self.is_opened:
+                    return
+            midiscripter.shared.precise_sleep_until(due_time)
+
+            if not self.is_opened:
+                return
+
+            self.position_sec = event_time_sec
+            if not raw_midi_data or raw_midi_data[0] < 0x80 or raw_midi_data[0] == 0xF7:
+                continue  # split sysex parts are not supported
+            msg = raw_midi_to_msg(raw_midi_data, self)
+            if msg:
+                self._send_input_msg_to_calls(msg)
+
+    @overload
+    def subscribe(self, call: 'Callable[[MidiMsg], None]') -> 'Callable': ...
+
+    @overload
+    def subscribe(
+        self,
+        type: 'None | Container | MidiType' = None,
+        channel: 'None | Container | int | tuple[int, ...]' = None,
+        data1: 'None | Container | int | tuple[int, ...]' = None,
+        data2: 'None | Container | int | tuple[int, ...]' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
+    ) -> 'Callable': ...
+
+    def subscribe(
+        self,
+        type: 'None | Container | MidiType' = None,
+        channel: 'None | Container | int | tuple[int, ...]' = None,
+        data1: 'None | Container | int | tuple[int, ...]' = None,
+        data2: 'None | Container | int | tuple[int, ...]' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
+    ) -> 'Callable':
+        return super().subscribe(type, channel, data1, data2, executor=executor)
+
+
+class MidiFileOut(midiscripter.base.port_base.Output):
+    """Standard MIDI file (type 0) recorder output port.
+    Writes [`MidiMsg`][midiscripter.MidiMsg] objects sent to it to the file
+    at their creation time, so messages from input ports are recorded at the time they came.
+
+    The file is overwritten when the port is opened and finalized when the port is closed.
+
+    Example:
+        ``` python
+        midi_input.subscribe(MidiFileOut('recording.mid').send)
+        ```
+    """
+
+    _log_description: str = 'MIDI file recorder'
+
+    def __init__(self, file_path: str | pathlib.Path):
+        """
+        Args:
+            file_path: Standard MIDI file path
+        """
+        if isinstance(file_path, str):
+            file_path = pathlib.Path(file_path)
+
+        super().__init__(file_path)
+        self.__file_path = file_path
+        self.__writer: _SmfWriter | None = None
+        self.__start_time = 0
+        self.__lock = threading.Lock()
+        self.__high_resolution_encoder = _HighResolutionEncoder()
+
+    def __str__(self):
+        return f"'{self.__file_path.name}' recorder"
+
+    def _open(self) -> None:
+        try:
+            self.__writer = _SmfWriter(self.__file_path)
+        except OSError as exc:
+            log._port_open(
+                self, False, custom_text="Can't record {output}: {error}", output=self, error=exc
+            )
+            return
+
+        self.__start_time = midiscripter.shared.precise_epoch_time()
+        self.is_opened = True
+        log._port_open(self, True, custom_text='Started {output}', output=self)
+
+    def _close(self) -> None:
+        with self.__lock:
+            self.is_opened = False
+            self.__writer.close()
+            self.__writer = None
+        log._port_close(self, True, custom_text='Stopped {output}', output=self)
+
+    def send(self, msg: 'MidiMsg') -> None:
+        """Record the MIDI message.
+
+        Args:
+            msg: object to record
+        """
+        if not self._validate_msg_send(msg):
+            return
+
+        with self.__lock:  # encoder's selected parameters must match the written sequence
+            if not self.__writer:
+                return
+
+            if msg.type in HIGH_RESOLUTION_TYPES:
+                raw_midi_outputs = self.__high_resolution_encoder.encode(msg)
+            else:
+                raw_midi_outputs = (msg_to_raw_midi(msg),)
+                if msg.type == MidiType.CONTROL_CHANGE:
+                    self.__high_resolution_encoder._update_raw(raw_midi_outputs[0])
+
+            for raw_midi_output in raw_midi_outputs:
+                self.__writer.write(msg.ctime - self.__start_time, raw_midi_output)
+
+        log._msg_sent(self, msg)
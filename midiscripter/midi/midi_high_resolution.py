@@ -0,0 +1,192 @@
+import array
+from typing import TYPE_CHECKING
+
+from midiscripter.midi.midi_msg import MidiType, ChannelMsg
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from midiscripter.midi.midi_port import MidiIn
+
+
+HIGH_RESOLUTION_TYPES = frozenset((MidiType.CONTROL_CHANGE_14BIT, MidiType.RPN, MidiType.NRPN))
+
+_CONTROL_CHANGE_STATUS = 0xB0
+_LSB_CONTROL_OFFSET = 32
+_NRPN_MSB_CONTROL = 99
+_NRPN_LSB_CONTROL = 98
+_RPN_MSB_CONTROL = 101
+_RPN_LSB_CONTROL = 100
+_DATA_ENTRY_MSB_CONTROL = 6
+_DATA_ENTRY_LSB_CONTROL = 38
+_NULL_PARAMETER_BYTE = 127
+
+_NO_PARAMETER = 0
+_RPN_PARAMETER = 1
+_NRPN_PARAMETER = 2
+_UNKNOWN_VALUE = -1
+
+
+class _HighResolutionDecoder:
+    """Decoder stage of [`MidiIn`][midiscripter.MidiIn] port that combines
+    14-bit control change pairs and RPN/NRPN sequences into single messages.
+    Keeps per-channel state in preallocated arrays.
+    """
+
+    def __init__(
+        self,
+        port: 'MidiIn',
+        controls: 'Iterable[int]',
+        rpn: bool,
+        nrpn: bool,
+        wait_for_lsb: bool,
+    ):
+        self.__port = port
+        self.__rpn = rpn
+        self.__nrpn = nrpn
+        self.__wait_for_lsb = wait_for_lsb
+
+        self.__is_14bit_control = bytearray(32)
+        for control in controls:
+            self.__is_14bit_control[control] = 1
+
+        self.__controls_msb = array.array('h', [_UNKNOWN_VALUE]) * (16 * 32)
+        self.__parameters_kind = bytearray(16)
+        self.__parameters_msb = bytearray([_NULL_PARAMETER_BYTE]) * 16
+        self.__parameters_lsb = bytearray([_NULL_PARAMETER_BYTE]) * 16
+        self.__data_entries_msb = array.array('h', [_UNKNOWN_VALUE]) * 16
+
+    def feed(self, raw_midi_data: 'list[int] | tuple[int, ...]') -> bool:
+        """Handle raw control change MIDI data in the port callback thread.
+
+        Returns:
+            `True` if the message is a part of high resolution message
+            and should not be sent to calls by itself
+        """
+        channel_index = raw_midi_data[0] & 0x0F
+        control = raw_midi_data[1]
+        value = raw_midi_data[2]
+
+        if control in (_DATA_ENTRY_MSB_CONTROL, _DATA_ENTRY_LSB_CONTROL) and self.__enter_data(
+            channel_index, control, value
+        ):
+            return True
+
+        if control < _LSB_CONTROL_OFFSET:
+            if not self.__is_14bit_control[control]:
+                return False
+            self.__controls_msb[(channel_index << 5) | control] = value
+            if not self.__wait_for_lsb:
+                self.__emit(MidiType.CONTROL_CHANGE_14BIT, channel_index, control, value << 7)
+            return True
+
+        if control < _LSB_CONTROL_OFFSET * 2:
+            msb_control = control - _LSB_CONTROL_OFFSET
+            if not self.__is_14bit_control[msb_control]:
+                return False
+            msb = self.__controls_msb[(channel_index << 5) | msb_control]
+            if msb == _UNKNOWN_VALUE:
+                return False
+            self.__emit(MidiType.CONTROL_CHANGE_14BIT, channel_index, msb_control, msb << 7 | value)
+            return True
+
+        if control in (_NRPN_MSB_CONTROL, _NRPN_LSB_CONTROL):
+            return self.__select_parameter(channel_index, _NRPN_PARAMETER, control, value)
+
+        if control in (_RPN_MSB_CONTROL, _RPN_LSB_CONTROL):
+            return self.__select_parameter(channel_index, _RPN_PARAMETER, control, value)
+
+        return False
+
+    def __select_parameter(self, channel_index: int, kind: int, control: int, value: int) -> bool:
+        if not (self.__rpn if kind == _RPN_PARAMETER else self.__nrpn):
+            # Following data entry is for the parameter that is not decoded
+            self.__parameters_kind[channel_index] = _NO_PARAMETER
+            return False
+
+        if self.__parameters_kind[channel_index] != kind:
+            self.__parameters_kind[channel_index] = kind
+            self.__parameters_msb[channel_index] = _NULL_PARAMETER_BYTE
+            self.__parameters_lsb[channel_index] = _NULL_PARAMETER_BYTE
+
+        if control in (_NRPN_MSB_CONTROL, _RPN_MSB_CONTROL):
+            self.__parameters_msb[channel_index] = value
+        else:
+            self.__parameters_lsb[channel_index] = value
+        self.__data_entries_msb[channel_index] = _UNKNOWN_VALUE
+        return True
+
+    def __enter_data(self, channel_index: int, control: int, value: int) -> bool:
+        kind = self.__parameters_kind[channel_index]
+        parameter_msb = self.__parameters_msb[channel_index]
+        parameter_lsb = self.__parameters_lsb[channel_index]
+        if kind == _NO_PARAMETER or (
+            parameter_msb == _NULL_PARAMETER_BYTE and parameter_lsb == _NULL_PARAMETER_BYTE
+        ):
+            return False
+
+        msg_type = MidiType.RPN if kind == _RPN_PARAMETER else MidiType.NRPN
+        parameter = parameter_msb << 7 | parameter_lsb
+
+        if control == _DATA_ENTRY_MSB_CONTROL:
+            self.__data_entries_msb[channel_index] = value
+            if not self.__wait_for_lsb:
+                self.__emit(msg_type, channel_index, parameter, value << 7)
+            return True
+
+        data_entry_msb = self.__data_entries_msb[channel_index]
+        if data_entry_msb == _UNKNOWN_VALUE:
+            return False
+        self.__emit(msg_type, channel_index, parameter, data_entry_msb << 7 | value)
+        return True
+
+    def __emit(self, msg_type: MidiType, channel_index: int, data1: int, data2: int) -> None:
+        msg = ChannelMsg(msg_type, channel_index + 1, data1, data2, source=self.__port)
+        self.__port._send_input_msg_to_calls(msg)
+
+
+class _HighResolutionEncoder:
+    """Encoder of [`MidiOut`][midiscripter.MidiOut] port that converts high resolution messages
+    to control change sequences. Skips parameter selection if the parameter
+    is already selected on the channel.
+    """
+
+    def __init__(self):
+        self.__channels_selected_parameters: list[tuple[MidiType, int] | None] = [None] * 16
+
+    def encode(self, msg: ChannelMsg) -> list[tuple[int, int, int]]:
+        """Get raw MIDI control change messages for high resolution message"""
+        channel_index = msg.channel - 1
+        status_byte = _CONTROL_CHANGE_STATUS | channel_index
+        value_msb = msg.data2 >> 7
+        value_lsb = msg.data2 & 0x7F
+
+        if msg.type == MidiType.CONTROL_CHANGE_14BIT:
+            return [
+                (status_byte, msg.data1, value_msb),
+                (status_byte, msg.data1 + _LSB_CONTROL_OFFSET, value_lsb),
+            ]
+
+        raw_midi_outputs = []
+        if self.__channels_selected_parameters[channel_index] != (msg.type, msg.data1):
+            if msg.type == MidiType.NRPN:
+                msb_control, lsb_control = _NRPN_MSB_CONTROL, _NRPN_LSB_CONTROL
+            else:
+                msb_control, lsb_control = _RPN_MSB_CONTROL, _RPN_LSB_CONTROL
+            raw_midi_outputs.append((status_byte, msb_control, msg.data1 >> 7))
+            raw_midi_outputs.append((status_byte, lsb_control, msg.data1 & 0x7F))
+            self.__channels_selected_parameters[channel_index] = (msg.type, msg.data1)
+
+        raw_midi_outputs.append((status_byte, _DATA_ENTRY_MSB_CONTROL, value_msb))
+        raw_midi_outputs.append((status_byte, _DATA_ENTRY_LSB_CONTROL, value_lsb))
+        return raw_midi_outputs
+
+    def _reset_channel(self, channel: int) -> None:
+        """Forget the selected parameter of the channel, so the next message selects it again"""
+        self.__channels_selected_parameters[channel - 1] = None
+
+    def _update_raw(self, raw_midi_data: 'list[int] | tuple[int, ...]') -> None:
+        """Forget the selected parameter if other message selects one"""
+        if (raw_midi_data[0] & 0xF0) == _CONTROL_CHANGE_STATUS and (
+            _NRPN_LSB_CONTROL <= raw_midi_data[1] <= _RPN_MSB_CONTROL
+        ):
+            self.__channels_selected_parameters[raw_midi_data[0] & 0x0F] = None
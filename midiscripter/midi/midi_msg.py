@@ -20,31 +20,78 @@ class MidiType(midiscripter.base.msg_base.AttrEnum):
     AFTERTOUCH = 'AFTERTOUCH'
     PROGRAM_CHANGE = 'PROGRAM_CHANGE'
     PITCH_BEND = 'PITCH_BEND'
+    CONTROL_CHANGE_14BIT = 'CONTROL_CHANGE_14BIT'
+    """Control change MSB (0-31) and LSB (32-63) pair combined
+    by [`MidiIn`][midiscripter.MidiIn] port's high resolution decoder"""
+    RPN = 'RPN'
+    """Registered parameter number message combined
+    by [`MidiIn`][midiscripter.MidiIn] port's high resolution decoder"""
+    NRPN = 'NRPN'
+    """Non-registered parameter number message combined
+    by [`MidiIn`][midiscripter.MidiIn] port's high resolution decoder"""
     SYSEX = 'SYSEX'
+    SYSEX_CHUNK = 'SYSEX_CHUNK'
+    """Part of incomplete sysex message delivered by [`MidiIn`][midiscripter.MidiIn]
+    port in sysex streaming mode as [`SysexChunkMsg`][midiscripter.SysexChunkMsg]"""
+    TIME_CODE = 'TIME_CODE'
+    """MIDI time code quarter frame"""
+    SONG_POSITION = 'SONG_POSITION'
+    SONG_SELECT = 'SONG_SELECT'
+    TUNE_REQUEST = 'TUNE_REQUEST'
+    CLOCK = 'CLOCK'
+    """Clock tick, 24 per quarter note. Sent only to calls subscribed to this type explicitly."""
+    START = 'START'
+    CONTINUE = 'CONTINUE'
+    STOP = 'STOP'
+    ACTIVE_SENSING = 'ACTIVE_SENSING'
+    """Sent only to calls subscribed to this type explicitly"""
+    RESET = 'RESET'
+
+
+_SYSTEM_TYPES = frozenset(
+    (
+        MidiType.TIME_CODE,
+        MidiType.SONG_POSITION,
+        MidiType.SONG_SELECT,
+        MidiType.TUNE_REQUEST,
+        MidiType.CLOCK,
+        MidiType.START,
+        MidiType.CONTINUE,
+        MidiType.STOP,
+        MidiType.ACTIVE_SENSING,
+        MidiType.RESET,
+    )
+)
 
 
 class MidiMsg(midiscripter.base.msg_base.Msg):
-    """The base class for MIDI messages that produces [`ChannelMsg`][midiscripter.ChannelMsg]
-    or [`SysexMsg`][midiscripter.SysexMsg] objects depending on init arguments.
+    """The base class for MIDI messages that produces [`ChannelMsg`][midiscripter.ChannelMsg],
+    [`SysexMsg`][midiscripter.SysexMsg] or [`SystemMsg`][midiscripter.SystemMsg] objects
+    depending on init arguments.
 
-    It is advised to use [`ChannelMsg`][midiscripter.ChannelMsg]
-    or [`SysexMsg`][midiscripter.SysexMsg] classes to create MIDI messages for clarity.
+    It is advised to use [`ChannelMsg`][midiscripter.ChannelMsg],
+    [`SysexMsg`][midiscripter.SysexMsg] or [`SystemMsg`][midiscripter.SystemMsg]
+    classes to create MIDI messages for clarity.
     """
 
     __match_args__: tuple[str] = ('type', 'channel', 'data1', 'data2')
 
     type: MidiType
-    channel: int | tuple[int] | tuple[int, int, int]
-    data1: int | tuple[int, int]
-    data2: int | tuple[int, ...]
-    combined_data: int | tuple[int, ...]
+    channel: 'None | int | SysexData'
+    data1: 'None | int | SysexData'
+    data2: 'None | int | SysexData'
+    combined_data: 'None | int | SysexData'
     source: 'None | MidiIn'
 
     def __new__(cls, *args, **kwargs):
-        if (args and isinstance(args[0], tuple)) or (
-            not args and isinstance(kwargs.get('combined_data'), tuple)
+        if (args and isinstance(args[0], tuple | bytes | bytearray)) or (
+            not args and isinstance(kwargs.get('combined_data'), tuple | bytes | bytearray)
         ):
             return SysexMsg.__new__(SysexMsg, *args, **kwargs)
+        elif isinstance(msg_type := args[0] if args else kwargs.get('type'), str) and (
+            msg_type in _SYSTEM_TYPES
+        ):
+            return SystemMsg.__new__(SystemMsg, *args, **kwargs)
         else:
             return ChannelMsg.__new__(ChannelMsg, *args, **kwargs)
 
@@ -70,11 +117,13 @@ class ChannelMsg(MidiMsg):
     """MIDI message channel (1-16)"""
 
     data1: int
-    """First data byte: note, control, program or aftertouch value 
-    depending on MIDI message type (0-127)"""
+    """First data byte: note, control, program or aftertouch value
+    depending on MIDI message type (0-127). Control or parameter number (0-16383)
+    for high resolution messages."""
 
     data2: int
-    """Second data byte: velocity or value depending on MIDI message type (0-127)"""
+    """Second data byte: velocity or value depending on MIDI message type (0-127).
+    14-bit value (0-16383) for high resolution messages."""
 
     def __new__(cls, *args, **kwargs):
         """Resets base class custom __new__"""
@@ -141,26 +190,138 @@ class ChannelMsg(MidiMsg):
         return super().matches(type, channel, data1, data2, combined_data=combined_data)
 
 
-class SysexMsg(MidiMsg):
-    """System exclusive MIDI message"""
+class SystemMsg(MidiMsg):
+    """System common or real-time MIDI message: clock, transport, song position, time code."""
 
-    type = MidiType.SYSEX
+    type: MidiType
     """MIDI message type"""
 
-    channel: tuple[int, ...]
-    """Manufacturer ID (protocol)"""
+    channel: None
+    """System messages have no channel"""
+
+    data1: int | None
+    """Time code quarter frame data, song number or song position LSB (0-127)"""
+
+    data2: int | None
+    """Song position MSB (0-127)"""
+
+    def __new__(cls, *args, **kwargs):
+        """Resets base class custom __new__"""
+        return object.__new__(SystemMsg)
+
+    def __init__(
+        self,
+        type: MidiType = MidiType.CLOCK,
+        data1: int | None = None,
+        data2: int | None = None,
+        *,
+        combined_data: None | int = None,
+        source: 'None | MidiIn' = None,
+    ):
+        """
+        Args:
+            type: MIDI message type
+            data1: Time code quarter frame data, song number or song position LSB (0-127)
+            data2: Song position MSB (0-127)
+            combined_data: Song position in 16th notes (0-16383)
+            source: The [`MidiIn`][midiscripter.MidiIn] instance that generated the message
+        """
+        midiscripter.base.msg_base.Msg.__init__(self, type, source)
+        self.channel = None
+        if combined_data is not None:
+            self.combined_data = combined_data
+        else:
+            self.data1 = data1
+            self.data2 = data2
+
+    def __repr__(self):
+        args = [repr(self.type)]
+        if self.type == MidiType.SONG_POSITION:
+            args.append(f'combined_data={self.combined_data!r}')
+        elif self.data1 is not None:
+            args.append(repr(self.data1))
+        return f'{self.__class__.__name__}({", ".join(args)})'
+
+    @property
+    def combined_data(self) -> int | None:
+        """Both data bytes combined to 14-bit number -
+        song position in 16th notes for song position MIDI message (0-16383)"""
+        if self.data1 is None or self.data2 is None:
+            return None
+        return self.data1 | (self.data2 << 7)
+
+    @combined_data.setter
+    def combined_data(self, combined_data_value: int) -> None:
+        self.data1 = combined_data_value & 0x7F
+        self.data2 = combined_data_value >> 7
+
+    def matches(
+        self,
+        type: 'None | Container[MidiType] | MidiType' = None,
+        channel: None = None,
+        data1: 'None | Container[int] | int' = None,
+        data2: 'None | Container[int] | int' = None,
+        *,
+        combined_data: 'None | Container[int] | int' = None,
+    ) -> bool:
+        return super().matches(type, channel, data1, data2, combined_data=combined_data)
+
+
+class SysexData(bytes):
+    """Sysex message bytes. Equal to tuples and lists of the same ints, hashed as the tuple
+    and represented as a tuple of ints for compatibility. Not equal to plain bytes.
+    The hash is calculated once. Slices are copies."""
+
+    def __eq__(self, other: object):
+        if isinstance(other, SysexData):
+            return bytes.__eq__(self, other)
+        if isinstance(other, tuple | list):
+            try:
+                return bytes.__eq__(self, bytes(other))
+            except (ValueError, TypeError):
+                return False
+        return False  # plain bytes hash differs from the tuple hash
+
+    def __ne__(self, other: object):
+        return not self == other
+
+    def __hash__(self):
+        try:
+            return self.__hash
+        except AttributeError:  # tuple of ints is made only for the first hash
+            self.__hash = hash(tuple(self))
+            return self.__hash
 
-    data1: tuple[int, ...]
-    """Sub ID (model, device, command, etc.)"""
+    def __repr__(self):
+        return repr(tuple(self))
+
+    def __str__(self):
+        return repr(tuple(self))
+
+    def __getitem__(self, key: int | slice) -> 'int | SysexData':
+        if isinstance(key, slice):  # slicing the view doesn't make intermediate bytes copy
+            return SysexData(memoryview(self)[key])
+        return bytes.__getitem__(self, key)
 
-    data2: tuple[int, ...]
-    """Message data"""
+
+class SysexMsg(MidiMsg):
+    """System exclusive MIDI message.
+
+    The whole message is stored once as bytes.
+    `channel`, `data1` and `data2` attributes are copies of its parts compared as tuples,
+    `payload` is zero-copy view of the whole message without opening and closing bytes.
+    """
+
+    type = MidiType.SYSEX
+    """MIDI message type"""
 
     def __new__(cls, *args, **kwargs):
         """Resets base class custom __new__"""
         return object.__new__(SysexMsg)
 
-    def __init__(self, combined_data: Sequence[int, ...], *, source: 'None | MidiIn' = None):
+    def __init__(
+        self, combined_data: 'Sequence[int, ...] | bytes', *, source: 'None | MidiIn' = None
+    ):
         """
         Args:
             combined_data: Whole sysex message including opening (`240`) and closing (`247`) bytes
@@ -179,18 +340,15 @@ class SysexMsg(MidiMsg):
         return f'{self.__class__.__name__}({self.combined_data!s})'
 
     @property
-    def combined_data(self) -> tuple[int, ...]:
+    def combined_data(self) -> SysexData:
         """Whole sysex message including opening `240` and closing `247` bytes"""
-        return (
-            rtmidi.midiconstants.SYSTEM_EXCLUSIVE,
-            *self.channel,
-            *self.data1,
-            *self.data2,
-            rtmidi.midiconstants.END_OF_EXCLUSIVE,
-        )
+        return self.__combined_data
 
     @combined_data.setter
-    def combined_data(self, combined_data: Sequence[int]) -> None:
+    def combined_data(self, combined_data: 'Sequence[int] | bytes') -> None:
+        if not isinstance(combined_data, SysexData):
+            combined_data = SysexData(combined_data)
+
         if (
             combined_data[0] != rtmidi.midiconstants.SYSTEM_EXCLUSIVE
             or combined_data[-1] != rtmidi.midiconstants.END_OF_EXCLUSIVE
@@ -199,11 +357,9 @@ class SysexMsg(MidiMsg):
                 'Sysex message should start with 240 (0xF0) and end with 247 (0xF7)'
             )
 
-        payload_data = combined_data[1:-1]  # without opening and closing bytes
-
-        if payload_data[0] == 0:  # 3 int manufacturer
+        if combined_data[1] == 0:  # 3 int manufacturer
             channel_len = 3
-        elif payload_data[0] in (126, 127):  # universal
+        elif combined_data[1] in (126, 127):  # universal
             channel_len = 2
         else:  # single int manufacturer
             channel_len = 1
@@ -217,9 +373,53 @@ class SysexMsg(MidiMsg):
                 f'starting with 240 and ending with 247, it has only {len(combined_data)}'
             )
 
-        self.channel = tuple(payload_data[0:channel_len])
-        self.data1 = tuple(payload_data[channel_len : channel_len + sub_id_len])
-        self.data2 = tuple(payload_data[channel_len + sub_id_len :])
+        self.__combined_data = combined_data
+        self.__data1_start = 1 + channel_len
+        self.__data2_start = 1 + channel_len + sub_id_len
+        self.__data2 = None
+
+    @property
+    def channel(self) -> SysexData:
+        """Manufacturer ID (protocol), copied from the message bytes"""
+        return self.__combined_data[1 : self.__data1_start]
+
+    @channel.setter
+    def channel(self, channel: 'Sequence[int] | bytes') -> None:
+        self.combined_data = (
+            self.__combined_data[:1] + bytes(channel) + self.__combined_data[self.__data1_start :]
+        )
+
+    @property
+    def data1(self) -> SysexData:
+        """Sub ID (model, device, command, etc.), copied from the message bytes"""
+        return self.__combined_data[self.__data1_start : self.__data2_start]
+
+    @data1.setter
+    def data1(self, data1: 'Sequence[int] | bytes') -> None:
+        self.combined_data = (
+            self.__combined_data[: self.__data1_start]
+            + bytes(data1)
+            + self.__combined_data[self.__data2_start :]
+        )
+
+    @property
+    def data2(self) -> SysexData:
+        """Message data, copied from the message bytes once.
+        Use `payload` view to read large data without copying."""
+        if self.__data2 is None:  # sliced once, may be large
+            self.__data2 = self.__combined_data[self.__data2_start : -1]
+        return self.__data2
+
+    @data2.setter
+    def data2(self, data2: 'Sequence[int] | bytes') -> None:
+        self.combined_data = (
+            self.__combined_data[: self.__data2_start] + bytes(data2) + self.__combined_data[-1:]
+        )
+
+    @property
+    def payload(self) -> memoryview:
+        """Zero-copy view of the whole message without opening and closing bytes"""
+        return memoryview(self.__combined_data)[1:-1]
 
     def matches(
         self,
@@ -231,3 +431,48 @@ class SysexMsg(MidiMsg):
         combined_data: 'None | Container[tuple[int, ...]] | tuple[int, ...]' = None,
     ) -> bool:
         return super().matches(type, channel, data1, data2, combined_data=combined_data)
+
+
+class SysexChunkMsg(midiscripter.base.msg_base.Msg):
+    """Part of incomplete sysex message delivered by [`MidiIn`][midiscripter.MidiIn] port
+    in sysex streaming mode. Allows handling large sysex dumps incrementally
+    as the port receives them.
+    """
+
+    __match_args__: tuple[str] = ('type', 'data', 'offset', 'is_last')
+
+    type = MidiType.SYSEX_CHUNK
+    """MIDI message type"""
+
+    data: bytes
+    """Chunk bytes, opening `240` byte for the first chunk and closing `247` for the last one"""
+
+    offset: int
+    """Number of sysex message bytes received before the chunk"""
+
+    is_last: bool
+    """The chunk ends the sysex message"""
+
+    source: 'None | MidiIn'
+
+    def __init__(self, data: bytes, offset: int, is_last: bool, *, source: 'None | MidiIn' = None):
+        """
+        Args:
+            data: Chunk bytes
+            offset: Number of sysex message bytes received before the chunk
+            is_last: The chunk ends the sysex message
+            source: The [`MidiIn`][midiscripter.MidiIn] instance that generated the message
+        """
+        super().__init__(MidiType.SYSEX_CHUNK, source)
+        self.data = data
+        self.offset = offset
+        self.is_last = is_last
+
+    def __str__(self):
+        return (
+            f'{self.type} | {len(self.data)} bytes at {self.offset}'
+            f'{" | last" if self.is_last else ""}'
+        )
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.data!r}, {self.offset!r}, {self.is_last!r})'
@@ -0,0 +1,269 @@
+from typing import TYPE_CHECKING, overload
+
+import midiscripter.base.msg_base
+import midiscripter.base.port_base
+from midiscripter.midi.midi_note_data import _NOTE_INT_TO_NOTE_NAME_MAP_SHARPS
+
+if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
+    from collections.abc import Callable, Container
+    from midiscripter.midi.midi_port import MidiIn
+
+
+CHORD_SHAPES: dict[str, tuple[int, ...]] = {
+    'maj': (0, 4, 7),
+    'min': (0, 3, 7),
+    '7': (0, 4, 7, 10),
+    'maj7': (0, 4, 7, 11),
+    'min7': (0, 3, 7, 10),
+    'dim': (0, 3, 6),
+    'aug': (0, 4, 8),
+    'sus4': (0, 5, 7),
+    'sus2': (0, 2, 7),
+    '6': (0, 4, 7, 9),
+    'min6': (0, 3, 7, 9),
+    'min7b5': (0, 3, 6, 10),
+    'dim7': (0, 3, 6, 9),
+    'min/maj7': (0, 3, 7, 11),
+    '7sus4': (0, 5, 7, 10),
+    'add9': (0, 2, 4, 7),
+    'min(add9)': (0, 2, 3, 7),
+    '9': (0, 2, 4, 7, 10),
+    'maj9': (0, 2, 4, 7, 11),
+    'min9': (0, 2, 3, 7, 10),
+}
+"""Chord shape names and their intervals in semitones from the root.
+Shapes declared earlier take precedence for the same pitch class sets."""
+
+
+def _build_pitch_class_set_to_chords_table() -> tuple[tuple[tuple[int, str], ...], ...]:
+    """Builds the table of all 4096 pitch class sets as 12-bit masks
+    to tuples of matching (root pitch class, shape name) pairs"""
+    table = [()] * 4096
+    for shape, intervals in CHORD_SHAPES.items():
+        for root in range(12):
+            mask = 0
+            for interval in intervals:
+                mask |= 1 << ((root + interval) % 12)
+            table[mask] += ((root, shape),)
+    return tuple(table)
+
+
+_PITCH_CLASS_SET_TO_CHORDS = _build_pitch_class_set_to_chords_table()
+
+
+def _notes_bits_to_pitch_class_set(notes_bits: int) -> int:
+    pitch_class_set = 0
+    while notes_bits:
+        pitch_class_set |= notes_bits & 0xFFF
+        notes_bits >>= 12
+    return pitch_class_set
+
+
+def _notes_bits_to_notes(notes_bits: int) -> tuple[int, ...]:
+    notes = []
+    while notes_bits:
+        lowest_bit = notes_bits & -notes_bits
+        notes.append(lowest_bit.bit_length() - 1)
+        notes_bits ^= lowest_bit
+    return tuple(notes)
+
+
+class ChordMsg(midiscripter.base.msg_base.Msg):
+    """Chord message produced by [`NoteTracker`][midiscripter.NoteTracker]
+    when the held notes form a known chord shape"""
+
+    __match_args__ = ('shape', 'root', 'channel')
+    type: str = 'CHORD'
+
+    shape: str
+    """Chord shape name from `CHORD_SHAPES`, like `'maj'` or `'min7'`"""
+
+    root: str
+    """Chord root note name without octave, like `'C#'`"""
+
+    channel: int
+    """MIDI channel the chord notes are held on (1-16)"""
+
+    notes: tuple[int, ...]
+    """Held MIDI notes, sorted"""
+
+    def __init__(
+        self,
+        shape: str,
+        root: str,
+        channel: int,
+        notes: tuple[int, ...],
+        *,
+        source: 'None | NoteTracker' = None,
+    ):
+        """
+        Args:
+            shape: Chord shape name from `CHORD_SHAPES`
+            root: Chord root note name without octave
+            channel: MIDI channel the chord notes are held on (1-16)
+            notes: Held MIDI notes, sorted
+            source: The [`NoteTracker`][midiscripter.NoteTracker] instance that generated the message
+        """
+        super().__init__(self.type, source)
+        self.shape = shape
+        self.root = root
+        self.channel = channel
+        self.notes = notes
+
+    def __str__(self):
+        return f'{self.type} | {self.root} {self.shape} | {self.channel} | {self.notes}'
+
+    def matches(
+        self,
+        shape: 'None | Container[str] | str' = None,
+        root: 'None | Container[str] | str' = None,
+        channel: 'None | Container[int] | int' = None,
+    ) -> bool:
+        return super().matches(shape, root, channel)
+
+
+class NoteTracker(midiscripter.base.port_base.Subscribable):
+    """Held notes tracker of [`MidiIn`][midiscripter.MidiIn] port available as its `notes`
+    attribute. Produces [`ChordMsg`][midiscripter.ChordMsg] objects for subscribed calls.
+
+    Held notes are kept as a 128-bit set per channel updated on every "note on" and "note off"
+    message (including "note on" with zero velocity). Chords are found by a single lookup
+    of held notes' pitch classes in the precomputed table, only if there are subscribed calls.
+
+    Example:
+        ``` python
+        @midi_input.notes.subscribe(shape=('maj', 'min'))
+        def triad_played(msg: ChordMsg) -> None:
+            log(f'{msg.root} {msg.shape} triad')
+        ```
+    """
+
+    _log_color: str | None = 'green'
+    _log_show_link: bool = False
+
+    def __init__(self, port: 'MidiIn'):
+        """
+        Args:
+            port: The [`MidiIn`][midiscripter.MidiIn] instance which notes are tracked
+        """
+        super().__init__()
+        self.__port = port
+        self.__channels_notes_bits = [0] * 16
+        self.__channels_pitch_class_sets = [0] * 16
+
+    def __str__(self):
+        return f'{self.__port} notes'
+
+    def __reduce__(self) -> tuple:
+        # Pickled as a reference to the port's tracker to be sent to process pool workers
+        return getattr, (self.__port, 'notes')
+
+    def held_notes(self, channel: int | None = None) -> tuple[int, ...]:
+        """Get currently held notes
+
+        Args:
+            channel: MIDI channel (1-16) to get notes for, all channels if `None`
+
+        Returns:
+            Sorted held MIDI notes
+        """
+        return _notes_bits_to_notes(self.__get_notes_bits(channel))
+
+    def is_held(self, note: int, channel: int | None = None) -> bool:
+        """Check if the note is currently held
+
+        Args:
+            note: MIDI note (0-127)
+            channel: MIDI channel (1-16) to check, all channels if `None`
+        """
+        return bool(self.__get_notes_bits(channel) >> note & 1)
+
+    def get_chord(self, channel: int | None = None) -> tuple[str, str] | None:
+        """Get the chord formed by currently held notes
+
+        Args:
+            channel: MIDI channel (1-16) to get chord for, all channels if `None`
+
+        Returns:
+            Chord root note name and shape name or `None` if held notes are not a known chord
+        """
+        notes_bits = self.__get_notes_bits(channel)
+        root, shape = self.__find_chord(notes_bits, _notes_bits_to_pitch_class_set(notes_bits))
+        return None if shape is None else (root, shape)
+
+    def __get_notes_bits(self, channel: int | None) -> int:
+        if channel is not None:
+            return self.__channels_notes_bits[channel - 1]
+
+        notes_bits = 0
+        for channel_notes_bits in self.__channels_notes_bits:
+            notes_bits |= channel_notes_bits
+        return notes_bits
+
+    @staticmethod
+    def __find_chord(notes_bits: int, pitch_class_set: int) -> tuple[str | None, str | None]:
+        chords = _PITCH_CLASS_SET_TO_CHORDS[pitch_class_set]
+        if not chords:
+            return None, None
+
+        # Same pitch class set can be different chords, like C6 and Am7. Bass note decides.
+        bass_pitch_class = ((notes_bits & -notes_bits).bit_length() - 1) % 12
+        root, shape = next((chord for chord in chords if chord[0] == bass_pitch_class), chords[0])
+        return _NOTE_INT_TO_NOTE_NAME_MAP_SHARPS[root], shape
+
+    def _update_raw(self, raw_midi_data: 'list[int] | tuple[int, ...]') -> None:
+        """Update held notes with raw MIDI data in the port callback thread"""
+        type_bits = raw_midi_data[0] & 0xF0
+        if type_bits == 0x90 and raw_midi_data[2]:
+            channel_index = raw_midi_data[0] & 0x0F
+            notes_bits = self.__channels_notes_bits[channel_index] | (1 << raw_midi_data[1])
+        elif type_bits == 0x80 or type_bits == 0x90:
+            channel_index = raw_midi_data[0] & 0x0F
+            notes_bits = self.__channels_notes_bits[channel_index] & ~(1 << raw_midi_data[1])
+        else:
+            return
+
+        self.__channels_notes_bits[channel_index] = notes_bits
+
+        if not self._calls:
+            return
+
+        pitch_class_set = _notes_bits_to_pitch_class_set(notes_bits)
+        if pitch_class_set == self.__channels_pitch_class_sets[channel_index]:
+            return
+        self.__channels_pitch_class_sets[channel_index] = pitch_class_set
+
+        root, shape = self.__find_chord(notes_bits, pitch_class_set)
+        if shape is not None:
+            chord_msg = ChordMsg(
+                shape,
+                root,
+                channel_index + 1,
+                _notes_bits_to_notes(notes_bits),
+                source=self,
+            )
+            self._send_input_msg_to_calls(chord_msg)
+
+    @overload
+    def subscribe(self, call: 'Callable[[ChordMsg], None]') -> 'Callable': ...
+
+    @overload
+    def subscribe(
+        self,
+        shape: 'None | Container[str] | str' = None,
+        root: 'None | Container[str] | str' = None,
+        channel: 'None | Container[int] | int' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
+    ) -> 'Callable': ...
+
+    def subscribe(
+        self,
+        shape: 'None | Container[str] | str' = None,
+        root: 'None | Container[str] | str' = None,
+        channel: 'None | Container[int] | int' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
+    ) -> 'Callable':
+        return super().subscribe(shape, root, channel, executor=executor)
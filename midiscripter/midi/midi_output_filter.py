@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import midiscripter.shared
+from midiscripter.midi.midi_state import _get_slot_and_value
+
+if TYPE_CHECKING:
+    from midiscripter.midi.midi_msg import MidiMsg
+    from midiscripter.midi.midi_port import MidiOut
+
+
+class _MidiOutputFilter:
+    """Output traffic filter for [`MidiOut`][midiscripter.MidiOut] port.
+    Drops redundant messages, coalesces superseded ones and caps the output message rate.
+    Uses the port's state mirror as the shadow state of the device.
+    """
+
+    def __init__(
+        self,
+        port: 'MidiOut',
+        deduplicate: bool,
+        coalesce_window_sec: float,
+        max_msgs_per_sec: float | None,
+    ):
+        self.__port = port
+        self.__deduplicate = deduplicate
+        self.__coalesce_window_sec = coalesce_window_sec
+        self.__min_send_interval_sec = 1 / max_msgs_per_sec if max_msgs_per_sec else 0
+
+        self.__pending: dict[int | object, tuple[MidiMsg, float]] = {}
+        """Messages waiting to be sent by their state slot, with time they were queued"""
+
+        self.__condition = threading.Condition()
+        self.__worker_is_running = False
+        self.__next_send_time = 0
+
+        self.dropped_count = 0
+        """Number of redundant or superseded messages that were not sent"""
+
+    def send(self, msg: 'MidiMsg') -> None:
+        slot_and_value = _get_slot_and_value(msg)
+
+        with self.__condition:
+            if slot_and_value is None:
+                # Untracked message gets a unique slot to be queued as is, keeping the sending order
+                slot = object() if self.__pending or self.__min_send_interval_sec else None
+            else:
+                slot, value = slot_and_value
+                is_redundant = (
+                    self.__deduplicate and self.__port.state._get_slot_value(slot) == value
+                )
+
+                if slot in self.__pending:
+                    self.dropped_count += 1
+                    if is_redundant:  # superseded back to the value the device already has
+                        del self.__pending[slot]
+                    else:
+                        self.__pending[slot] = (msg, self.__pending[slot][1])
+                    return
+
+                if is_redundant:
+                    self.dropped_count += 1
+                    return
+
+            now = time.perf_counter()
+            if slot is not None and (
+                self.__coalesce_window_sec or self.__pending or now < self.__next_send_time
+            ):
+                self.__pending[slot] = (msg, now)
+                self.__start_worker()
+                self.__condition.notify()
+                return
+
+            self.__next_send_time = now + self.__min_send_interval_sec
+
+        self.__port._send_to_driver(msg)
+
+    def __start_worker(self) -> None:
+        if not self.__worker_is_running:
+            self.__worker_is_running = True
+            midiscripter.shared.thread_executor.submit(self.__pending_send_worker)
+
+    def __pending_send_worker(self) -> None:
+        """Thread worker loop that sends queued messages when they are due"""
+        while True:
+            with self.__condition:
+                if not self.__pending or not self.__port.is_opened:
+                    self.__pending.clear()
+                    self.__worker_is_running = False
+                    return
+
+                slot, (msg, queued_time) = next(iter(self.__pending.items()))
+                # Untracked messages can't be superseded so they are not held for coalescing
+                window_sec = self.__coalesce_window_sec if isinstance(slot, int) else 0
+                due_time = max(queued_time + window_sec, self.__next_send_time)
+                wait_time = due_time - time.perf_counter()
+                if wait_time > 0:
+                    self.__condition.wait(timeout=wait_time)
+                    continue
+
+                del self.__pending[slot]
+                self.__next_send_time = time.perf_counter() + self.__min_send_interval_sec
+
+            self.__port._send_to_driver(msg)
@@ -1,4 +1,5 @@
 import platform
+import threading
 from typing import TYPE_CHECKING, overload
 
 import rtmidi
@@ -6,11 +7,24 @@ import rtmidi.midiconstants
 
 import midiscripter.base.port_base
 from midiscripter.logger import log
+from midiscripter.midi.midi_clock import MidiClock
+from midiscripter.midi.midi_high_resolution import (
+    HIGH_RESOLUTION_TYPES,
+    _HighResolutionDecoder,
+    _HighResolutionEncoder,
+)
 from midiscripter.midi.midi_msg import MidiType, MidiMsg
+from midiscripter.midi.midi_note_tracker import NoteTracker
+from midiscripter.midi.midi_output_filter import _MidiOutputFilter
+from midiscripter.midi.midi_state import MidiState
+from midiscripter.midi.midi_sysex_reassembler import _SysexReassembler
+from midiscripter.midi.midi_sysex_transfer import SysexTransfer, _split_sysex_packets
 
 if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
     from midiscripter.midi.teVirtualMIDI import TeVirtualMidiPort
-    from collections.abc import Callable, Container
+    from collections.abc import Callable, Container, Iterable
+    from midiscripter.midi.midi_msg import SysexMsg
     from midiscripter.ableton_remote.ableton_port import AbletonIn, AbletonOut
 
 
@@ -26,6 +40,21 @@ BYTE_TO_TYPE_MAP = {
 
 TYPE_TO_BYTE_MAP = {type_: byte_ for byte_, type_ in BYTE_TO_TYPE_MAP.items()}
 
+SYSTEM_BYTE_TO_TYPE_MAP = {
+    rtmidi.midiconstants.MIDI_TIME_CODE: MidiType.TIME_CODE,
+    rtmidi.midiconstants.SONG_POSITION_POINTER: MidiType.SONG_POSITION,
+    rtmidi.midiconstants.SONG_SELECT: MidiType.SONG_SELECT,
+    rtmidi.midiconstants.TUNE_REQUEST: MidiType.TUNE_REQUEST,
+    rtmidi.midiconstants.TIMING_CLOCK: MidiType.CLOCK,
+    rtmidi.midiconstants.SONG_START: MidiType.START,
+    rtmidi.midiconstants.SONG_CONTINUE: MidiType.CONTINUE,
+    rtmidi.midiconstants.SONG_STOP: MidiType.STOP,
+    rtmidi.midiconstants.ACTIVE_SENSING: MidiType.ACTIVE_SENSING,
+    rtmidi.midiconstants.SYSTEM_RESET: MidiType.RESET,
+}
+
+SYSTEM_TYPE_TO_BYTE_MAP = {type_: byte_ for byte_, type_ in SYSTEM_BYTE_TO_TYPE_MAP.items()}
+
 TYPE_TO_DATA_BYTES_COUNT = {
     MidiType.NOTE_ON: 3,
     MidiType.NOTE_OFF: 3,
@@ -34,8 +63,24 @@ TYPE_TO_DATA_BYTES_COUNT = {
     MidiType.PITCH_BEND: 3,
     MidiType.AFTERTOUCH: 2,
     MidiType.PROGRAM_CHANGE: 2,
+    MidiType.TIME_CODE: 2,
+    MidiType.SONG_POSITION: 3,
+    MidiType.SONG_SELECT: 2,
+    MidiType.TUNE_REQUEST: 1,
+    MidiType.CLOCK: 1,
+    MidiType.START: 1,
+    MidiType.CONTINUE: 1,
+    MidiType.STOP: 1,
+    MidiType.ACTIVE_SENSING: 1,
+    MidiType.RESET: 1,
 }
 
+_MUTED_REAL_TIME_BYTES_BY_TYPE = {
+    MidiType.CLOCK: rtmidi.midiconstants.TIMING_CLOCK,
+    MidiType.ACTIVE_SENSING: rtmidi.midiconstants.ACTIVE_SENSING,
+}
+"""Frequent real-time messages that are sent to calls only if subscribed explicitly"""
+
 
 def get_persistent_midi_port_names(raw_port_names: list[str]) -> list[str]:
     persistent_port_names = [port_name[: port_name.rfind(' ')] for port_name in raw_port_names]
@@ -49,6 +94,46 @@ def get_persistent_midi_port_names(raw_port_names: list[str]) -> list[str]:
         return port_names_without_prefixes
 
 
+def raw_midi_to_msg(
+    raw_midi_data: 'list[int] | tuple[int, ...] | bytes',
+    source: 'midiscripter.base.port_base.Input | None' = None,
+) -> (
+    'midiscripter.midi.midi_msg.ChannelMsg'
+    '| midiscripter.midi.midi_msg.SysexMsg'
+    '| midiscripter.midi.midi_msg.SystemMsg'
+    '| None'
+):
+    if (
+        raw_midi_data[0] == rtmidi.midiconstants.SYSTEM_EXCLUSIVE
+        and raw_midi_data[-1] == rtmidi.midiconstants.END_OF_EXCLUSIVE
+    ):
+        return midiscripter.midi.midi_msg.SysexMsg(raw_midi_data, source=source)
+
+    elif raw_midi_data[0] < rtmidi.midiconstants.SYSTEM_EXCLUSIVE:
+        msg_atts = MidiIn._raw_channel_midi_to_attrs(raw_midi_data)
+        return midiscripter.midi.midi_msg.ChannelMsg(*msg_atts, source=source)
+
+    elif raw_midi_data[0] in SYSTEM_BYTE_TO_TYPE_MAP:
+        return midiscripter.midi.midi_msg.SystemMsg(
+            SYSTEM_BYTE_TO_TYPE_MAP[raw_midi_data[0]], *raw_midi_data[1:], source=source
+        )
+
+    else:
+        log.red(f'Unsupported MIDI msg type byte: {raw_midi_data[0]}')
+
+
+def msg_to_raw_midi(msg: MidiMsg) -> 'tuple[int, ...] | bytes':
+    if msg.type == MidiType.SYSEX:
+        return msg.combined_data
+    elif msg.type in SYSTEM_TYPE_TO_BYTE_MAP:
+        msg_raw_data = SYSTEM_TYPE_TO_BYTE_MAP[msg.type], msg.data1, msg.data2
+        return msg_raw_data[: TYPE_TO_DATA_BYTES_COUNT[msg.type]]
+    else:
+        status_byte = (TYPE_TO_BYTE_MAP[msg.type] & 0xF0) | (msg.channel - 1 & 0xF)
+        msg_raw_data = status_byte, msg.data1, msg.data2
+        return msg_raw_data[: TYPE_TO_DATA_BYTES_COUNT[msg.type]]
+
+
 class _MidiPortMixin(midiscripter.base.port_base.Port):
     # Attrs provided by the class that inherits from MidiPortMixin
     is_opened: bool
@@ -97,7 +182,7 @@ class _MidiPortMixin(midiscripter.base.port_base.Port):
                 self._rtmidi_port = self._rtmidi_port_class()
 
                 if is_input:
-                    self._rtmidi_port.ignore_types(sysex=False)
+                    self._rtmidi_port.ignore_types(sysex=False, timing=False, active_sense=False)
                     self._rtmidi_port.set_callback(self._input_callback)
 
                 if self._is_virtual:
@@ -137,24 +222,54 @@ class _MidiPortMixin(midiscripter.base.port_base.Port):
 
 
 class MidiIn(_MidiPortMixin, midiscripter.base.port_base.Input):
-    """MIDI input port. Produces [`MidiMsg`][midiscripter.MidiMsg] objects."""
+    """MIDI input port. Produces [`MidiMsg`][midiscripter.MidiMsg] objects.
+
+    Sysex messages split by MIDI driver into several parts are joined into a single
+    [`SysexMsg`][midiscripter.SysexMsg]. In sysex streaming mode the parts are sent to calls
+    as they arrive as [`SysexChunkMsg`][midiscripter.SysexChunkMsg] objects.
+
+    Clock and active sensing messages are sent only to calls subscribed
+    to `MidiType.CLOCK` or `MidiType.ACTIVE_SENSING` type explicitly.
+    Use the port's `clock` attribute to get the transport state and tempo without them.
+    """
 
     _rtmidi_port_class: type[rtmidi.MidiIn | rtmidi.MidiOut] = rtmidi.MidiIn
     _log_description: str = 'MIDI input'
 
-    def __init__(self, port_name: str, *, virtual: bool = False):
+    def __init__(self, port_name: str, *, virtual: bool = False, stream_sysex: bool = False):
         """
         Args:
             port_name: MIDI input port name
             virtual: Create virtual port
+            stream_sysex: Send split sysex message parts to calls as they arrive
+                          instead of joining them. Streamed parts are not passed through.
         """
         midiscripter.base.port_base.Input.__init__(self, port_name)
         _MidiPortMixin.__init__(self, virtual, self._callback)
 
+        self.__sysex_reassembler = _SysexReassembler(self, stream_sysex)
+
+        self.state = MidiState()
+        """The last values of controls, notes, pressures, programs and pitch bends
+        the port received"""
+
+        self.notes = NoteTracker(self)
+        """Held notes tracker that can have calls subscribed to chords played on the port"""
+
+        self.clock = MidiClock(self)
+        """MIDI clock follower with transport state, song position and tempo"""
+
+        self.__muted_real_time_bytes = frozenset(_MUTED_REAL_TIME_BYTES_BY_TYPE.values())
+        self.__high_resolution_decoder: _HighResolutionDecoder | None = None
+
         self._attached_passthrough_outs: list[MidiOut] = []
         """[`MidiOut`][midiscripter.MidiOut] ports attached as pass-through ports
         which will send all incoming messages as soon as they arrive before sending them to calls"""
 
+        self._msg_listeners: tuple[Callable[[MidiMsg], None], ...] = ()
+        """Internal callables called with every incoming message in the port callback thread.
+        Replaced as a whole to be changed from other threads."""
+
     def passthrough_out(self, midi_output: 'MidiOut') -> None:
         """Attach [`MidiOut`][midiscripter.MidiOut] as a pass-through port
         to send all incoming messages as soon as they arrive,
@@ -167,6 +282,40 @@ class MidiIn(_MidiPortMixin, midiscripter.base.port_base.Input):
             self._attached_passthrough_outs.append(midi_output)
             log('{input} input will pass through {output}', input=self, output=midi_output)
 
+    def set_high_resolution_decoder(
+        self,
+        *,
+        controls: 'Iterable[int]' = (),
+        rpn: bool = True,
+        nrpn: bool = True,
+        wait_for_lsb: bool = True,
+    ) -> None:
+        """Combine 14-bit control change pairs and RPN/NRPN sequences received by the port
+        into single messages with 14-bit values of `MidiType.CONTROL_CHANGE_14BIT`,
+        `MidiType.RPN` and `MidiType.NRPN` types. Combined control change messages
+        are not sent to calls. Call without arguments enables RPN and NRPN decoding.
+
+        Args:
+            controls: MSB control numbers (0-31) of 14-bit control change pairs to combine
+                      with their LSB controls (32-63)
+            rpn: Combine registered parameter number sequences (controls 101, 100, 6, 38)
+            nrpn: Combine non-registered parameter number sequences (controls 99, 98, 6, 38)
+            wait_for_lsb: Produce message only when the value LSB is received.
+                          Otherwise, produce message on MSB too, with zero LSB.
+
+        Warning:
+            Some devices send only MSB if LSB didn't change.
+            Disable `wait_for_lsb` for them to not miss values.
+        """
+        if controls or rpn or nrpn:
+            self.__high_resolution_decoder = _HighResolutionDecoder(
+                self, controls, rpn, nrpn, wait_for_lsb
+            )
+            log('{input} input will combine high resolution messages', input=self)
+        else:
+            self.__high_resolution_decoder = None
+            log('{input} input will not combine high resolution messages', input=self)
+
     @overload
     def subscribe(self, call: 'Callable[[MidiMsg], None]') -> 'Callable': ...
 
@@ -177,6 +326,8 @@ class MidiIn(_MidiPortMixin, midiscripter.base.port_base.Input):
         channel: 'None | Container | int | tuple[int, ...]' = None,
         data1: 'None | Container | int | tuple[int, ...]' = None,
         data2: 'None | Container | int | tuple[int, ...]' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
@@ -185,8 +336,24 @@ class MidiIn(_MidiPortMixin, midiscripter.base.port_base.Input):
         channel: 'None | Container | int | tuple[int, ...]' = None,
         data1: 'None | Container | int | tuple[int, ...]' = None,
         data2: 'None | Container | int | tuple[int, ...]' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return super().subscribe(type, channel, data1, data2)
+        if not callable(type):
+            self.__unmute_subscribed_real_time_types(type)
+        return super().subscribe(type, channel, data1, data2, executor=executor)
+
+    def __unmute_subscribed_real_time_types(self, type: 'None | Container | MidiType') -> None:
+        for real_time_type, status_byte in _MUTED_REAL_TIME_BYTES_BY_TYPE.items():
+            try:
+                is_subscribed = type == real_time_type or (
+                    not isinstance(type, str) and real_time_type in type
+                )
+            except TypeError:  # condition is not a container
+                is_subscribed = False
+
+            if is_subscribed:
+                self.__muted_real_time_bytes = self.__muted_real_time_bytes - {status_byte}
 
     @overload
     def _callback(self, rtmidi_input: list[list[hex, ...], float], _: list) -> None: ...
@@ -199,8 +366,40 @@ class MidiIn(_MidiPortMixin, midiscripter.base.port_base.Input):
             return
 
         raw_midi_data = args[0] if self._pytemidi_port else args[0][0]
-        [output._passthrough_send(raw_midi_data) for output in self._attached_passthrough_outs]
-        self._send_input_msg_to_calls(self._convert_to_msg(raw_midi_data))
+        status_byte = raw_midi_data[0]
+
+        if status_byte >= rtmidi.midiconstants.TIMING_CLOCK:  # real-time, mostly clock ticks
+            [output._passthrough_send(raw_midi_data) for output in self._attached_passthrough_outs]
+            self.clock._update_raw(raw_midi_data)
+            if status_byte in self.__muted_real_time_bytes:
+                return
+        else:
+            if self.__sysex_reassembler.received_len or (
+                status_byte == rtmidi.midiconstants.SYSTEM_EXCLUSIVE
+                and raw_midi_data[-1] != rtmidi.midiconstants.END_OF_EXCLUSIVE
+            ):
+                raw_midi_data = self.__sysex_reassembler.feed(raw_midi_data)
+                if raw_midi_data is None:
+                    return
+
+            [output._passthrough_send(raw_midi_data) for output in self._attached_passthrough_outs]
+
+            if status_byte == rtmidi.midiconstants.SONG_POSITION_POINTER:
+                self.clock._update_raw(raw_midi_data)
+            self.state._update_raw(raw_midi_data)
+            self.notes._update_raw(raw_midi_data)
+
+            if (
+                self.__high_resolution_decoder
+                and (status_byte & 0xF0) == rtmidi.midiconstants.CONTROL_CHANGE
+                and self.__high_resolution_decoder.feed(raw_midi_data)
+            ):
+                return
+
+        msg = self._convert_to_msg(raw_midi_data)
+        for listener in self._msg_listeners:
+            listener(msg)
+        self._send_input_msg_to_calls(msg)
 
     @staticmethod
     def _raw_channel_midi_to_attrs(raw_midi_data: list[hex, ...]) -> tuple[MidiType, int, ...]:
@@ -211,19 +410,12 @@ class MidiIn(_MidiPortMixin, midiscripter.base.port_base.Input):
 
     def _convert_to_msg(
         self, raw_midi_data: list[hex, ...]
-    ) -> 'midiscripter.midi.midi_msg.ChannelMsg | midiscripter.midi.midi_msg.SysexMsg':
-        if (
-            raw_midi_data[0] == rtmidi.midiconstants.SYSTEM_EXCLUSIVE
-            and raw_midi_data[-1] == rtmidi.midiconstants.END_OF_EXCLUSIVE
-        ):
-            return midiscripter.midi.midi_msg.SysexMsg(raw_midi_data, source=self)
-
-        elif raw_midi_data[0] < rtmidi.midiconstants.SYSTEM_EXCLUSIVE:
-            msg_atts = self._raw_channel_midi_to_attrs(raw_midi_data)
-            return midiscripter.midi.midi_msg.ChannelMsg(*msg_atts, source=self)
-
-        else:
-            log.red(f'Unsupported MIDI msg type byte: {raw_midi_data[0]}')
+    ) -> (
+        'midiscripter.midi.midi_msg.ChannelMsg'
+        '| midiscripter.midi.midi_msg.SysexMsg'
+        '| midiscripter.midi.midi_msg.SystemMsg'
+    ):
+        return raw_midi_to_msg(raw_midi_data, self)
 
 
 class MidiOut(_MidiPortMixin, midiscripter.base.port_base.Output):
@@ -242,6 +434,51 @@ class MidiOut(_MidiPortMixin, midiscripter.base.port_base.Output):
         midiscripter.base.port_base.Output.__init__(self, port_name)
         _MidiPortMixin.__init__(self, virtual)
 
+        self.state = MidiState()
+        """The last values of controls, notes, pressures, programs and pitch bends
+        the port sent"""
+
+        self._output_filter: _MidiOutputFilter | None = None
+        self.__high_resolution_encoder = _HighResolutionEncoder()
+        self.__control_change_lock = threading.Lock()
+        """Keeps high resolution message control change sequence and the encoder's
+        selected parameters from being interleaved by other control change sends"""
+
+    def set_output_filter(
+        self,
+        *,
+        deduplicate: bool = True,
+        coalesce_window_sec: float = 0,
+        max_msgs_per_sec: float | None = None,
+    ) -> None:
+        """Filter the port's output traffic. Made for LED and other feedback messages
+        that can overwhelm slow controllers when sent in bursts.
+
+        Filter keeps the shadow state of values the device got from the port,
+        so the redundant messages never reach the MIDI driver. Sysex messages are never dropped.
+        Call without arguments enables deduplication only.
+
+        Args:
+            deduplicate: Drop messages that set the value the device already has
+                         for the same type, channel and note/control
+            coalesce_window_sec: Hold messages for this time and send only the latest value
+                                 if the message is superseded during the hold
+            max_msgs_per_sec: Max number of messages sent per second,
+                              extra messages are queued and coalesced
+
+        Warning:
+            Deduplication drops repeated "note on" messages, which retrigger notes on synths.
+            Don't use it for ports that send notes to play.
+        """
+        if deduplicate or coalesce_window_sec or max_msgs_per_sec:
+            self._output_filter = _MidiOutputFilter(
+                self, deduplicate, coalesce_window_sec, max_msgs_per_sec
+            )
+            log('{output} output will be filtered', output=self)
+        else:
+            self._output_filter = None
+            log('{output} output will not be filtered', output=self)
+
     def send(self, msg: MidiMsg) -> None:
         """Send the MIDI message.
 
@@ -251,13 +488,98 @@ class MidiOut(_MidiPortMixin, midiscripter.base.port_base.Output):
         if not self._validate_msg_send(msg):
             return
 
-        if msg.type == MidiType.SYSEX:
-            raw_midi_output = msg.combined_data
+        if self._output_filter:
+            self._output_filter.send(msg)
         else:
-            status_byte = (TYPE_TO_BYTE_MAP[msg.type] & 0xF0) | (msg.channel - 1 & 0xF)
-            msg_raw_data = status_byte, msg.data1, msg.data2
-            raw_midi_output = msg_raw_data[: TYPE_TO_DATA_BYTES_COUNT[msg.type]]
+            self._send_to_driver(msg)
+
+    def send_bulk(
+        self,
+        data: 'SysexMsg | Iterable[SysexMsg] | bytes',
+        *,
+        bytes_per_sec: float | None = None,
+        packet_delay_sec: float = 0,
+        handshake_input: 'MidiIn | MidiIO | None' = None,
+        handshake_timeout_sec: float = 1,
+    ) -> SysexTransfer:
+        """Send large sysex data, like patch bank dumps, as a background transfer
+        that paces sysex messages for slow devices.
+
+        Data is sent as separate sysex messages, other messages sent with the port
+        in the meantime go between them. A sysex message can't be split, so a dump made of
+        one message larger than `SysexTransfer.MAX_PACKET_BYTES` raises `ValueError`.
+
+        Args:
+            data: Sysex message, messages or bytes of one or several sysex messages,
+                  like `.syx` file contents
+            bytes_per_sec: Max average transfer speed, unlimited if `None`
+            packet_delay_sec: Pause after each sysex message
+            handshake_input: Input port to wait for device's sysex reply after each sysex message
+            handshake_timeout_sec: Max time to wait for the reply before the transfer fails
+
+        Returns:
+            Transfer object that reports progress and can be waited for or cancelled
+        """
+        if isinstance(handshake_input, MidiIO):
+            handshake_input = handshake_input._input_ports[0]
+
+        transfer = SysexTransfer(
+            self,
+            _split_sysex_packets(data),
+            bytes_per_sec,
+            packet_delay_sec,
+            handshake_input,
+            handshake_timeout_sec,
+        )
+        transfer._start()
+        return transfer
+
+    def _send_to_driver(self, msg: MidiMsg) -> bool:
+        """Send the message to the MIDI driver, bypassing the output filter
+
+        Returns:
+            `True` if the driver took the message
+        """
+        if msg.type in HIGH_RESOLUTION_TYPES:
+            return self.__send_high_resolution_to_driver(msg)
+
+        raw_midi_output = msg_to_raw_midi(msg)
+
+        if msg.type == MidiType.CONTROL_CHANGE:
+            with self.__control_change_lock:
+                if not self.__send_raw_to_driver(raw_midi_output, msg):
+                    return False
+                self.__high_resolution_encoder._update_raw(raw_midi_output)
+        elif not self.__send_raw_to_driver(raw_midi_output, msg):
+            return False
+
+        self.state.update(msg)
+
+        if not self._disable_logging_in_send:
+            log._msg_sent(self, msg)
+        return True
+
+    def __send_high_resolution_to_driver(self, msg: MidiMsg) -> bool:
+        with self.__control_change_lock:
+            for raw_midi_output in self.__high_resolution_encoder.encode(msg):
+                if not self.__send_raw_to_driver(raw_midi_output, msg):
+                    # the device may have not got the parameter selection
+                    self.__high_resolution_encoder._reset_channel(msg.channel)
+                    return False
+                self.state._update_raw(raw_midi_output)
+
+        if not self._disable_logging_in_send:
+            log._msg_sent(self, msg)
+        return True
 
+    def __send_raw_to_driver(
+        self, raw_midi_output: 'tuple[int, ...] | bytes', msg: MidiMsg
+    ) -> bool:
+        """Send raw MIDI data to the driver, log the failure
+
+        Returns:
+            `True` if the driver took the data
+        """
         try:
             if self._pytemidi_port:
                 self._pytemidi_port.send(raw_midi_output)
@@ -266,21 +588,24 @@ class MidiOut(_MidiPortMixin, midiscripter.base.port_base.Output):
         except Exception:
             # For _rtmidi.SystemError or teVirtualMIDI.DriverError
             log.red(f'Failed to send message: {msg}')
-            return
-
-        if not self._disable_logging_in_send:
-            log._msg_sent(self, msg)
+            return False
+        return True
 
     def _passthrough_send(self, raw_midi_data: tuple[hex, ...]) -> None:
         if self.is_opened:
-            try:
-                if self._pytemidi_port:
-                    self._pytemidi_port.send(raw_midi_data)
-                else:
-                    self._rtmidi_port.send_message(raw_midi_data)
-            except Exception:
-                # For _rtmidi.SystemError or teVirtualMIDI.DriverError
-                log.red(f'Failed to send message data: {raw_midi_data}')
+            with self.__control_change_lock:
+                try:
+                    if self._pytemidi_port:
+                        self._pytemidi_port.send(raw_midi_data)
+                    else:
+                        self._rtmidi_port.send_message(raw_midi_data)
+                except Exception:
+                    # For _rtmidi.SystemError or teVirtualMIDI.DriverError
+                    log.red(f'Failed to send message data: {raw_midi_data}')
+                    return
+
+                self.__high_resolution_encoder._update_raw(raw_midi_data)
+            self.state._update_raw(raw_midi_data)
 
 
 class MidiIO(midiscripter.base.port_base.MultiPort):
@@ -294,21 +619,35 @@ class MidiIO(midiscripter.base.port_base.MultiPort):
     _output_port_class: 'type[MidiOut | AbletonOut]' = MidiOut
     _log_description: str = 'MIDI i/o port'
 
-    def __init__(self, port_name: str, *, virtual: bool = False, loopback: bool = False):
+    def __init__(
+        self,
+        port_name: str,
+        *,
+        virtual: bool = False,
+        loopback: bool = False,
+        stream_sysex: bool = False,
+    ):
         """
         Args:
             port_name: MIDI port name
             virtual: Create virtual input and output ports
             loopback: Immediately send the messages received by the input port with the output port
+            stream_sysex: Send split sysex message parts to calls as they arrive
+                          instead of joining them
         """
         self._is_virtual = virtual
 
         # For better MIDI port repr in log
+        input_port_kwargs = {}
+        if self._is_virtual:
+            input_port_kwargs['virtual'] = True
+        if stream_sysex:
+            input_port_kwargs['stream_sysex'] = True
+
+        input_port = self._input_port_class(port_name, **input_port_kwargs)
         if self._is_virtual:
-            input_port = self._input_port_class(port_name, virtual=self._is_virtual)
             output_port = self._output_port_class(port_name, virtual=self._is_virtual)
         else:
-            input_port = self._input_port_class(port_name)
             output_port = self._output_port_class(port_name)
 
         super().__init__(port_name, input_port, output_port)
@@ -358,6 +697,67 @@ class MidiIO(midiscripter.base.port_base.MultiPort):
         """
         self._input_ports[0].passthrough_out(midi_output)
 
+    def set_output_filter(
+        self,
+        *,
+        deduplicate: bool = True,
+        coalesce_window_sec: float = 0,
+        max_msgs_per_sec: float | None = None,
+    ) -> None:
+        """Filter the port's output traffic. Made for LED and other feedback messages
+        that can overwhelm slow controllers when sent in bursts.
+
+        Filter keeps the shadow state of values the device got from the port,
+        so the redundant messages never reach the MIDI driver. Sysex messages are never dropped.
+        Call without arguments enables deduplication only.
+
+        Args:
+            deduplicate: Drop messages that set the value the device already has
+                         for the same type, channel and note/control
+            coalesce_window_sec: Hold messages for this time and send only the latest value
+                                 if the message is superseded during the hold
+            max_msgs_per_sec: Max number of messages sent per second,
+                              extra messages are queued and coalesced
+
+        Warning:
+            Deduplication drops repeated "note on" messages, which retrigger notes on synths.
+            Don't use it for ports that send notes to play.
+        """
+        self._output_ports[0].set_output_filter(
+            deduplicate=deduplicate,
+            coalesce_window_sec=coalesce_window_sec,
+            max_msgs_per_sec=max_msgs_per_sec,
+        )
+
+    def set_high_resolution_decoder(
+        self,
+        *,
+        controls: 'Iterable[int]' = (),
+        rpn: bool = True,
+        nrpn: bool = True,
+        wait_for_lsb: bool = True,
+    ) -> None:
+        """Combine 14-bit control change pairs and RPN/NRPN sequences received by the port
+        into single messages with 14-bit values of `MidiType.CONTROL_CHANGE_14BIT`,
+        `MidiType.RPN` and `MidiType.NRPN` types. Combined control change messages
+        are not sent to calls. Call without arguments enables RPN and NRPN decoding.
+
+        Args:
+            controls: MSB control numbers (0-31) of 14-bit control change pairs to combine
+                      with their LSB controls (32-63)
+            rpn: Combine registered parameter number sequences (controls 101, 100, 6, 38)
+            nrpn: Combine non-registered parameter number sequences (controls 99, 98, 6, 38)
+            wait_for_lsb: Produce message only when the value LSB is received.
+                          Otherwise, produce message on MSB too, with zero LSB.
+
+        Warning:
+            Some devices send only MSB if LSB didn't change.
+            Disable `wait_for_lsb` for them to not miss values.
+        """
+        self._input_ports[0].set_high_resolution_decoder(
+            controls=controls, rpn=rpn, nrpn=nrpn, wait_for_lsb=wait_for_lsb
+        )
+
     @overload
     def subscribe(self, call: 'Callable[[MidiMsg], None]') -> 'Callable': ...
 
@@ -368,6 +768,8 @@ class MidiIO(midiscripter.base.port_base.MultiPort):
         channel: 'None | Container | int | tuple[int, ...]' = None,
         data1: 'None | Container | int | tuple[int, ...]' = None,
         data2: 'None | Container | int | tuple[int, ...]' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
@@ -376,8 +778,10 @@ class MidiIO(midiscripter.base.port_base.MultiPort):
         channel: 'None | Container | int | tuple[int, ...]' = None,
         data1: 'None | Container | int | tuple[int, ...]' = None,
         data2: 'None | Container | int | tuple[int, ...]' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return self._input_ports[0].subscribe(type, channel, data1, data2)
+        return self._input_ports[0].subscribe(type, channel, data1, data2, executor=executor)
 
     def send(self, msg: MidiMsg) -> None:
         """Send the MIDI message.
@@ -386,3 +790,38 @@ class MidiIO(midiscripter.base.port_base.MultiPort):
             msg: object to send
         """
         self._output_ports[0].send(msg)
+
+    def send_bulk(
+        self,
+        data: 'SysexMsg | Iterable[SysexMsg] | bytes',
+        *,
+        bytes_per_sec: float | None = None,
+        packet_delay_sec: float = 0,
+        handshake_input: 'MidiIn | MidiIO | None' = None,
+        handshake_timeout_sec: float = 1,
+    ) -> SysexTransfer:
+        """Send large sysex data, like patch bank dumps, as a background transfer
+        that paces sysex messages for slow devices.
+
+        Data is sent as separate sysex messages, other messages sent with the port
+        in the meantime go between them. A sysex message can't be split, so a dump made of
+        one message larger than `SysexTransfer.MAX_PACKET_BYTES` raises `ValueError`.
+
+        Args:
+            data: Sysex message, messages or bytes of one or several sysex messages,
+                  like `.syx` file contents
+            bytes_per_sec: Max average transfer speed, unlimited if `None`
+            packet_delay_sec: Pause after each sysex message
+            handshake_input: Input port to wait for device's sysex reply after each sysex message
+            handshake_timeout_sec: Max time to wait for the reply before the transfer fails
+
+        Returns:
+            Transfer object that reports progress and can be waited for or cancelled
+        """
+        return self._output_ports[0].send_bulk(
+            data,
+            bytes_per_sec=bytes_per_sec,
+            packet_delay_sec=packet_delay_sec,
+            handshake_input=handshake_input,
+            handshake_timeout_sec=handshake_timeout_sec,
+        )
@@ -0,0 +1,238 @@
+import array
+from typing import TYPE_CHECKING
+
+from midiscripter.midi.midi_msg import MidiType, ChannelMsg
+
+if TYPE_CHECKING:
+    from midiscripter.midi.midi_msg import MidiMsg
+
+
+_UNKNOWN_VALUE = 0xFFFF
+
+# Layout: 16 channels * 128 slots per note/control table, 16 slots per channel value table
+_CC_OFFSET = 0
+_NOTE_OFFSET = 2048
+_POLYTOUCH_OFFSET = 4096
+_AFTERTOUCH_OFFSET = 6144
+_PROGRAM_OFFSET = 6160
+_PITCH_BEND_OFFSET = 6176
+_STATE_SIZE = 6192
+
+_TYPE_TO_TABLE_OFFSET = {
+    MidiType.CONTROL_CHANGE: _CC_OFFSET,
+    MidiType.NOTE_ON: _NOTE_OFFSET,
+    MidiType.NOTE_OFF: _NOTE_OFFSET,
+    MidiType.POLYTOUCH: _POLYTOUCH_OFFSET,
+}
+_TYPE_TO_CHANNEL_VALUE_OFFSET = {
+    MidiType.AFTERTOUCH: _AFTERTOUCH_OFFSET,
+    MidiType.PROGRAM_CHANGE: _PROGRAM_OFFSET,
+    MidiType.PITCH_BEND: _PITCH_BEND_OFFSET,
+}
+
+
+def _get_slot_and_value(msg: 'MidiMsg') -> tuple[int, int] | None:
+    """Finds the state slot the message sets and the value it sets the slot to.
+
+    Returns:
+        Slot index and value or `None` for messages not tracked by state
+    """
+    try:
+        offset = _TYPE_TO_TABLE_OFFSET[msg.type]
+        value = 0 if msg.type == MidiType.NOTE_OFF else msg.data2
+        return offset + ((msg.channel - 1) << 7) + msg.data1, value
+    except KeyError:
+        pass
+
+    try:
+        offset = _TYPE_TO_CHANNEL_VALUE_OFFSET[msg.type]
+        value = msg.combined_data if msg.type == MidiType.PITCH_BEND else msg.data1
+        return offset + msg.channel - 1, value
+    except KeyError:
+        return None
+
+
+class MidiState:
+    """The last known values of MIDI controls, notes, pressures, programs and pitch bends
+    for each channel.
+
+    [`MidiIn`][midiscripter.MidiIn] and [`MidiOut`][midiscripter.MidiOut] ports keep their
+    state mirrors updated as `port.state`. Values are `None` until the port gets or sends them.
+
+    The state is stored in a preallocated array, so updating it doesn't allocate memory
+    and reading a value takes constant time. State mirrors are safe to read from any thread.
+
+    Example:
+        Save and recall the controller state for bank switching:
+        ``` python
+        bank_snapshot = midi_input.state.snapshot()
+        ...
+        bank_state = MidiState()
+        bank_state.restore(bank_snapshot)
+        for msg in bank_state.as_msgs():
+            midi_output.send(msg)
+        ```
+    """
+
+    def __init__(self):
+        self.__values = array.array('H', [_UNKNOWN_VALUE]) * _STATE_SIZE
+
+    def __get(self, slot: int) -> int | None:
+        value = self.__values[slot]
+        return None if value == _UNKNOWN_VALUE else value
+
+    def get_cc(self, channel: int, control: int) -> int | None:
+        """Get the last control change value
+
+        Args:
+            channel: MIDI channel (1-16)
+            control: Control number (0-127)
+        """
+        return self.__get(_CC_OFFSET + ((channel - 1) << 7) + control)
+
+    def get_note_velocity(self, channel: int, note: int) -> int | None:
+        """Get the last "note on" velocity, `0` for released note
+
+        Args:
+            channel: MIDI channel (1-16)
+            note: Note number (0-127)
+        """
+        return self.__get(_NOTE_OFFSET + ((channel - 1) << 7) + note)
+
+    def get_poly_pressure(self, channel: int, note: int) -> int | None:
+        """Get the last polyphonic aftertouch value
+
+        Args:
+            channel: MIDI channel (1-16)
+            note: Note number (0-127)
+        """
+        return self.__get(_POLYTOUCH_OFFSET + ((channel - 1) << 7) + note)
+
+    def get_aftertouch(self, channel: int) -> int | None:
+        """Get the last channel aftertouch value
+
+        Args:
+            channel: MIDI channel (1-16)
+        """
+        return self.__get(_AFTERTOUCH_OFFSET + channel - 1)
+
+    def get_program(self, channel: int) -> int | None:
+        """Get the last program change value
+
+        Args:
+            channel: MIDI channel (1-16)
+        """
+        return self.__get(_PROGRAM_OFFSET + channel - 1)
+
+    def get_pitch_bend(self, channel: int) -> int | None:
+        """Get the last pitch bend value (0-16383)
+
+        Args:
+            channel: MIDI channel (1-16)
+        """
+        return self.__get(_PITCH_BEND_OFFSET + channel - 1)
+
+    def update(self, msg: 'MidiMsg') -> None:
+        """Update the state with the message values. Messages not tracked by state are ignored.
+
+        Args:
+            msg: MIDI message to update the state with
+        """
+        slot_and_value = _get_slot_and_value(msg)
+        if slot_and_value is not None:
+            slot, value = slot_and_value
+            self.__values[slot] = value
+
+    def _update_raw(self, raw_midi_data: 'list[int] | tuple[int, ...]') -> None:
+        """Update the state with raw MIDI data in the port callback thread.
+        Does no allocations for the most of messages."""
+        status_byte = raw_midi_data[0]
+        type_bits = status_byte & 0xF0
+        channel_index = status_byte & 0x0F
+
+        if type_bits == 0xB0:
+            self.__values[_CC_OFFSET + (channel_index << 7) + raw_midi_data[1]] = raw_midi_data[2]
+        elif type_bits == 0x90:
+            self.__values[_NOTE_OFFSET + (channel_index << 7) + raw_midi_data[1]] = raw_midi_data[2]
+        elif type_bits == 0x80:
+            self.__values[_NOTE_OFFSET + (channel_index << 7) + raw_midi_data[1]] = 0
+        elif type_bits == 0xA0:
+            self.__values[_POLYTOUCH_OFFSET + (channel_index << 7) + raw_midi_data[1]] = (
+                raw_midi_data[2]
+            )
+        elif type_bits == 0xE0:
+            self.__values[_PITCH_BEND_OFFSET + channel_index] = raw_midi_data[1] | (
+                raw_midi_data[2] << 7
+            )
+        elif type_bits == 0xD0:
+            self.__values[_AFTERTOUCH_OFFSET + channel_index] = raw_midi_data[1]
+        elif type_bits == 0xC0:
+            self.__values[_PROGRAM_OFFSET + channel_index] = raw_midi_data[1]
+
+    def _get_slot_value(self, slot: int) -> int:
+        """Get raw value of the slot found by `_get_slot_and_value`"""
+        return self.__values[slot]
+
+    def snapshot(self) -> bytes:
+        """Get the whole state as bytes to restore it later. Takes a single memory copy.
+
+        Returns:
+            State snapshot
+        """
+        return self.__values.tobytes()
+
+    def restore(self, snapshot: bytes) -> None:
+        """Restore the state from a snapshot
+
+        Args:
+            snapshot: Snapshot made by the `snapshot` method
+        """
+        memoryview(self.__values).cast('B')[:] = snapshot
+
+    def clear(self) -> None:
+        """Reset all the values to unknown"""
+        self.__values[:] = array.array('H', [_UNKNOWN_VALUE]) * _STATE_SIZE
+
+    def as_msgs(self, channel: int | None = None) -> list[ChannelMsg]:
+        """Get messages that reproduce the known state values
+
+        Args:
+            channel: Channel (1-16) to get messages for, all channels if `None`
+
+        Returns:
+            Program change, control change, polyphonic aftertouch, "note on", pitch bend
+            and aftertouch messages for every known value
+        """
+        channels = range(1, 17) if channel is None else (channel,)
+        msgs = []
+        for msg_channel in channels:
+            channel_index = msg_channel - 1
+
+            program = self.__values[_PROGRAM_OFFSET + channel_index]
+            if program != _UNKNOWN_VALUE:
+                msgs.append(ChannelMsg(MidiType.PROGRAM_CHANGE, msg_channel, program))
+
+            for msg_type, table_offset in (
+                (MidiType.CONTROL_CHANGE, _CC_OFFSET),
+                (MidiType.POLYTOUCH, _POLYTOUCH_OFFSET),
+                (MidiType.NOTE_ON, _NOTE_OFFSET),
+            ):
+                channel_table_offset = table_offset + (channel_index << 7)
+                channel_table = self.__values[channel_table_offset : channel_table_offset + 128]
+                msgs.extend(
+                    ChannelMsg(msg_type, msg_channel, data1, value)
+                    for data1, value in enumerate(channel_table)
+                    if value != _UNKNOWN_VALUE
+                )
+
+            pitch_bend = self.__values[_PITCH_BEND_OFFSET + channel_index]
+            if pitch_bend != _UNKNOWN_VALUE:
+                msgs.append(
+                    ChannelMsg(MidiType.PITCH_BEND, msg_channel, pitch_bend & 0x7F, pitch_bend >> 7)
+                )
+
+            aftertouch = self.__values[_AFTERTOUCH_OFFSET + channel_index]
+            if aftertouch != _UNKNOWN_VALUE:
+                msgs.append(ChannelMsg(MidiType.AFTERTOUCH, msg_channel, aftertouch))
+
+        return msgs
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+import rtmidi.midiconstants
+
+from midiscripter.logger import log
+from midiscripter.midi.midi_msg import SysexChunkMsg
+
+if TYPE_CHECKING:
+    from midiscripter.midi.midi_port import MidiIn
+
+
+class _SysexReassembler:
+    """Joins sysex message split by MIDI driver across several port callbacks.
+    In streaming mode sends each part to port's calls as
+    [`SysexChunkMsg`][midiscripter.SysexChunkMsg] instead of joining them.
+    """
+
+    def __init__(self, port: 'MidiIn', stream: bool):
+        self.__port = port
+        self.__stream = stream
+        self.__chunks: list[bytes] = []
+
+        self.received_len = 0
+        """Number of bytes of incomplete sysex message received so far, `0` if there's none"""
+
+    def feed(self, raw_midi_data: 'list[int] | bytes') -> 'list[int] | bytes | None':
+        """Collect raw MIDI data that starts or continues incomplete sysex message.
+
+        Returns:
+            Raw MIDI data of complete message to handle or `None` if data was collected
+        """
+        status_byte = raw_midi_data[0]
+
+        if status_byte == rtmidi.midiconstants.SYSTEM_EXCLUSIVE:
+            if self.received_len:
+                self.__abandon()
+            if raw_midi_data[-1] == rtmidi.midiconstants.END_OF_EXCLUSIVE:
+                return raw_midi_data
+        elif not self.received_len or status_byte >= rtmidi.midiconstants.TIMING_CLOCK:
+            return raw_midi_data  # not a sysex part or real-time message inside sysex
+        elif status_byte & 0x80 and status_byte != rtmidi.midiconstants.END_OF_EXCLUSIVE:
+            self.__abandon()
+            return raw_midi_data
+
+        chunk = bytes(raw_midi_data)
+        is_last = chunk[-1] == rtmidi.midiconstants.END_OF_EXCLUSIVE
+
+        if self.__stream:
+            chunk_msg = SysexChunkMsg(chunk, self.received_len, is_last, source=self.__port)
+            self.received_len = 0 if is_last else self.received_len + len(chunk)
+            self.__port._send_input_msg_to_calls(chunk_msg)
+            return None
+
+        self.__chunks.append(chunk)
+        if not is_last:
+            self.received_len += len(chunk)
+            return None
+
+        sysex_data = b''.join(self.__chunks)
+        self.__chunks.clear()
+        self.received_len = 0
+        return sysex_data
+
+    def __abandon(self) -> None:
+        log.red(
+            '{input} got incomplete sysex message of {bytes_count} bytes',
+            input=self.__port,
+            bytes_count=self.received_len,
+        )
+        self.__chunks.clear()
+        self.received_len = 0
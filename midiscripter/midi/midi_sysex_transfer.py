@@ -0,0 +1,226 @@
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import rtmidi.midiconstants
+
+import midiscripter.shared
+from midiscripter.logger import log
+from midiscripter.midi.midi_msg import MidiType, SysexMsg
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from midiscripter.midi.midi_msg import MidiMsg
+    from midiscripter.midi.midi_port import MidiIn, MidiOut
+
+
+def _split_sysex_data(data: bytes) -> list[SysexMsg]:
+    """Split bytes of one or several sysex messages at the message ends"""
+    packets = []
+    packet_start = 0
+    while packet_start < len(data):
+        packet_end = data.find(rtmidi.midiconstants.END_OF_EXCLUSIVE, packet_start) + 1
+        if not packet_end:
+            packet_end = len(data)  # to raise an error for incomplete message
+        packets.append(SysexMsg(data[packet_start:packet_end]))
+        packet_start = packet_end
+    return packets
+
+
+def _split_sysex_packets(data: 'SysexMsg | Iterable[SysexMsg] | bytes') -> list[SysexMsg]:
+    """Split data into sysex messages to send as separate packets.
+    Sysex message objects made of several sysex messages are split too.
+
+    Raises:
+        ValueError: A sysex message is larger than `SysexTransfer.MAX_PACKET_BYTES`
+    """
+    if isinstance(data, bytes | bytearray | memoryview):
+        packets = _split_sysex_data(bytes(data))
+    else:
+        packets = []
+        for msg in [data] if isinstance(data, SysexMsg) else data:
+            combined_data = msg.combined_data
+            if combined_data.count(rtmidi.midiconstants.END_OF_EXCLUSIVE) > 1:
+                packets.extend(_split_sysex_data(bytes(combined_data)))
+            else:
+                packets.append(msg)
+
+    for packet in packets:
+        if len(packet.combined_data) > SysexTransfer.MAX_PACKET_BYTES:
+            raise ValueError(
+                f'Sysex message of {len(packet.combined_data)} bytes is larger than '
+                f'{SysexTransfer.MAX_PACKET_BYTES} bytes. MIDI driver takes only whole '
+                "sysex messages, so it can't be paced. Send the dump as the device's "
+                'separate sysex messages.'
+            )
+    return packets
+
+
+class SysexTransfer:
+    """Bulk sysex transfer started by [`MidiOut`][midiscripter.MidiOut] `send_bulk` method.
+    Reports the transfer progress and can wait for it to finish or cancel it.
+
+    Packets are sent straight to the MIDI driver, bypassing the port's output filter,
+    since the transfer paces them itself.
+    """
+
+    MAX_PACKET_BYTES = 65_536
+    """Max size of a sysex message to send. MIDI driver takes only whole sysex messages,
+    so the transfer can't pace the data within one message."""
+
+    total_bytes: int
+    """Number of bytes to send"""
+
+    bytes_sent: int
+    """Number of bytes the MIDI driver took so far"""
+
+    packets_count: int
+    """Number of sysex messages to send"""
+
+    packets_sent: int
+    """Number of sysex messages sent so far"""
+
+    error: str | None
+    """The reason transfer failed or `None`"""
+
+    def __init__(
+        self,
+        port: 'MidiOut',
+        packets: list[SysexMsg],
+        bytes_per_sec: float | None,
+        packet_delay_sec: float,
+        handshake_input: 'MidiIn | None',
+        handshake_timeout_sec: float,
+    ):
+        self.__port = port
+        self.__packets = packets
+        self.__min_sec_per_byte = 1 / bytes_per_sec if bytes_per_sec else 0
+        self.__packet_delay_sec = packet_delay_sec
+        self.__handshake_input = handshake_input
+        self.__handshake_timeout_sec = handshake_timeout_sec
+
+        self.__handshake_event = threading.Event()
+        self.__cancel_event = threading.Event()
+        self.__done_event = threading.Event()
+        self.__start_time = 0
+        self.__end_time = None
+
+        self.total_bytes = sum(len(packet.combined_data) for packet in packets)
+        self.bytes_sent = 0
+        self.packets_count = len(packets)
+        self.packets_sent = 0
+        self.error = None
+
+    def __str__(self):
+        return f'{self.__port} bulk transfer'
+
+    @property
+    def progress(self) -> float:
+        """Share of bytes sent (0-1)"""
+        return self.bytes_sent / self.total_bytes if self.total_bytes else 1
+
+    @property
+    def bytes_per_sec(self) -> float:
+        """Average transfer speed"""
+        if not self.__start_time:
+            return 0
+        elapsed_sec = (self.__end_time or time.perf_counter()) - self.__start_time
+        return self.bytes_sent / elapsed_sec if elapsed_sec else 0
+
+    @property
+    def is_done(self) -> bool:
+        """Transfer is finished, cancelled or failed"""
+        return self.__done_event.is_set()
+
+    def wait(self, timeout_sec: float | None = None) -> bool:
+        """Wait for the transfer to finish, be cancelled or fail.
+
+        Args:
+            timeout_sec: Max time to wait, wait forever if `None`
+
+        Returns:
+            `True` if all data was sent
+        """
+        self.__done_event.wait(timeout_sec)
+        return self.packets_sent == self.packets_count
+
+    def cancel(self) -> None:
+        """Stop the transfer after the packet being sent"""
+        self.__cancel_event.set()
+
+    def _start(self) -> None:
+        log(
+            '{transfer} of {bytes} bytes in {packets} packets started',
+            transfer=self,
+            bytes=self.total_bytes,
+            packets=self.packets_count,
+        )
+        midiscripter.shared.thread_executor.submit(self.__transfer_worker)
+
+    def __handshake_listener(self, msg: 'MidiMsg') -> None:
+        if msg.type == MidiType.SYSEX:
+            self.__handshake_event.set()
+
+    def __transfer_worker(self) -> None:
+        if self.__handshake_input:
+            self.__handshake_input._msg_listeners += (self.__handshake_listener,)
+
+        try:
+            self.__send_packets()
+        finally:
+            if self.__handshake_input:
+                self.__handshake_input._msg_listeners = tuple(
+                    listener
+                    for listener in self.__handshake_input._msg_listeners
+                    if listener != self.__handshake_listener
+                )
+            self.__end_time = time.perf_counter()
+            self.__done_event.set()
+
+        if self.error:
+            log.red('{transfer} failed: {error}', transfer=self, error=self.error)
+        else:
+            log(
+                '{transfer} finished: {bytes} bytes sent at {speed} bytes/sec',
+                transfer=self,
+                bytes=self.bytes_sent,
+                speed=round(self.bytes_per_sec),
+            )
+
+    def __send_packets(self) -> None:
+        self.__start_time = time.perf_counter()
+        next_packet_time = self.__start_time
+
+        for packet in self.__packets:
+            # Pacing by bytes/sec is counted from the transfer start to keep the average speed
+            due_time = max(
+                self.__start_time + self.bytes_sent * self.__min_sec_per_byte, next_packet_time
+            )
+            wait_time = due_time - time.perf_counter()
+            if (
+                self.__cancel_event.wait(wait_time)
+                if wait_time > 0
+                else self.__cancel_event.is_set()
+            ):
+                self.error = 'cancelled'
+                return
+
+            if not self.__port.is_opened:
+                self.error = 'port is closed'
+                return
+
+            self.__handshake_event.clear()
+            # Other messages are sent between whole sysex packets
+            if not self.__port._send_to_driver(packet):
+                self.error = f'MIDI driver failed to send packet {self.packets_sent + 1}'
+                return
+            self.bytes_sent += len(packet.combined_data)
+            self.packets_sent += 1
+
+            if self.__handshake_input and not self.__handshake_event.wait(
+                self.__handshake_timeout_sec
+            ):
+                self.error = f'no handshake reply for packet {self.packets_sent}'
+                return
+
+            next_packet_time = time.perf_counter() + self.__packet_delay_sec
@@ -6,6 +6,7 @@ from midiscripter.mouse.mouse_msg import MouseEvent, MouseMsg
 from midiscripter.logger import log
 
 if TYPE_CHECKING:
+    from midiscripter.base.port_base import Executor
     from collections.abc import Container, Callable
 
 
@@ -87,6 +88,8 @@ class MouseIn(midiscripter.base.port_base.Input):
         type: 'None | Container[MouseEvent] | MouseEvent' = None,
         x: 'None | Container[int] | int' = None,
         y: 'None | Container[int] | int' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
@@ -94,8 +97,10 @@ class MouseIn(midiscripter.base.port_base.Input):
         type: 'None | Container[MouseEvent] | MouseEvent' = None,
         x: 'None | Container[int] | int' = None,
         y: 'None | Container[int] | int' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return super().subscribe(type, x, y)
+        return super().subscribe(type, x, y, executor=executor)
 
 
 class MouseOut(midiscripter.base.port_base.Output):
@@ -175,6 +180,8 @@ class MouseIO(midiscripter.base.port_base.MultiPort):
         type: 'None | Container[MouseEvent] | MouseEvent' = None,
         x: 'None | Container[int] | int' = None,
         y: 'None | Container[int] | int' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
@@ -182,8 +189,10 @@ class MouseIO(midiscripter.base.port_base.MultiPort):
         type: 'None | Container[MouseEvent] | MouseEvent' = None,
         x: 'None | Container[int] | int' = None,
         y: 'None | Container[int] | int' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return self._input_ports[0].subscribe(type, x, y)
+        return self._input_ports[0].subscribe(type, x, y, executor=executor)
 
     def send(self, msg: MouseMsg) -> None:
         """Send the mouse input.
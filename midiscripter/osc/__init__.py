@@ -1,2 +1,3 @@
 from midiscripter.osc.osc_msg import OscMsg
 from midiscripter.osc.osc_port import OscIn, OscOut, OscIO
+from midiscripter.osc.osc_query_cache import OscQueryCache
@@ -0,0 +1,128 @@
+import functools
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_PATTERN_CHARS = frozenset('*?[]{}')
+
+
+def _is_pattern(address_part: str) -> bool:
+    return not _PATTERN_CHARS.isdisjoint(address_part)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_part_pattern(pattern: str) -> 'Callable[[str], Any]':
+    """Compile OSC 1.0 address part pattern to match function
+
+    Pattern supports `*` for any sequence, `?` for any character,
+    `[abc]`, `[a-z]` and `[!abc]` for character from the set or not from the set,
+    `{foo,bar}` for any of the strings.
+    """
+    regex = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        index += 1
+        if char == '*':
+            regex.append('.*')
+        elif char == '?':
+            regex.append('.')
+        elif char == '[' and ']' in pattern[index:]:
+            end = pattern.index(']', index)
+            chars = pattern[index:end]
+            negate = chars.startswith('!')
+            chars = chars[1:] if negate else chars
+            escaped_chars = '-'.join(re.escape(chars_part) for chars_part in chars.split('-'))
+            regex.append(f'[{"^" if negate else ""}{escaped_chars}]')
+            index = end + 1
+        elif char == '{' and '}' in pattern[index:]:
+            end = pattern.index('}', index)
+            options = pattern[index:end].split(',')
+            regex.append(f'(?:{"|".join(re.escape(option) for option in options)})')
+            index = end + 1
+        else:
+            regex.append(re.escape(char))
+
+    return re.compile(''.join(regex), re.DOTALL).fullmatch
+
+
+def _match_address(address_pattern: str, address: str) -> bool:
+    """Check if OSC address matches OSC 1.0 address pattern. Wildcards don't cross `/`."""
+    pattern_parts = address_pattern.split('/')
+    address_parts = address.split('/')
+    if len(pattern_parts) != len(address_parts):
+        return False
+    return all(
+        _compile_part_pattern(pattern_part)(address_part)
+        if _is_pattern(pattern_part)
+        else pattern_part == address_part
+        for pattern_part, address_part in zip(pattern_parts, address_parts, strict=True)
+    )
+
+
+class _TrieNode:
+    __slots__ = ('literal_children', 'pattern_children', 'values')
+
+    def __init__(self):
+        self.literal_children: dict[str, _TrieNode] = {}
+        self.pattern_children: dict[str, tuple[Callable[[str], Any], _TrieNode]] = {}
+        self.values: list = []
+
+
+class _OscAddressTrie:
+    """Index of values by OSC addresses split to parts.
+
+    Addresses and address patterns added to the trie are matched by OSC 1.0 pattern rules
+    in both directions: address pattern added matches the addresses
+    and the address pattern looked up matches the added addresses.
+    Lookup time depends on the address depth, not on the number of added addresses.
+    """
+
+    def __init__(self):
+        self.__root = _TrieNode()
+
+    def add(self, address: str, value: Any) -> None:
+        """Add value for address or address pattern"""
+        node = self.__root
+        for part in address.split('/'):
+            if _is_pattern(part):
+                try:
+                    node = node.pattern_children[part][1]
+                except KeyError:
+                    child = _TrieNode()
+                    node.pattern_children[part] = (_compile_part_pattern(part), child)
+                    node = child
+            else:
+                node = node.literal_children.setdefault(part, _TrieNode())
+        node.values.append(value)
+
+    def match(self, address: str) -> list:
+        """Get values for addresses and address patterns matching the address or address pattern.
+        Value added for several matching addresses is returned several times."""
+        nodes = [self.__root]
+        for part in address.split('/'):
+            next_nodes = []
+            if _is_pattern(part):
+                matcher = _compile_part_pattern(part)
+                for node in nodes:
+                    next_nodes.extend(
+                        child for name, child in node.literal_children.items() if matcher(name)
+                    )
+                    if part in node.pattern_children:
+                        next_nodes.append(node.pattern_children[part][1])
+            else:
+                for node in nodes:
+                    if part in node.literal_children:
+                        next_nodes.append(node.literal_children[part])
+                    next_nodes.extend(
+                        child for matcher, child in node.pattern_children.values() if matcher(part)
+                    )
+
+            if not next_nodes:
+                return []
+            nodes = next_nodes
+
+        return [value for node in nodes for value in node.values]
@@ -0,0 +1,187 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import pythonosc.dispatcher
+import pythonosc.osc_message_builder
+import pythonosc.osc_packet
+import pythonosc.parsing.osc_types
+
+import midiscripter.shared
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pythonosc.osc_message import OscMessage
+    from midiscripter.osc.osc_msg import OscMsg
+    from midiscripter.osc.osc_port import OscOut
+
+
+_BUNDLE_STRING = b'#bundle\x00'
+_BUNDLE_HEADER_SIZE = 16  # '#bundle' string and timetag
+_BUNDLE_ELEMENT_SIZE_SIZE = 4
+_SCHEDULER_SPIN_SEC = 0.002  # OS timer can oversleep that much
+
+
+def _build_osc_message(msg: 'OscMsg') -> 'OscMessage':
+    """Build pythonosc message the same way `SimpleUDPClient.send_message` does"""
+    builder = pythonosc.osc_message_builder.OscMessageBuilder(msg.address)
+    if msg.data is None:
+        pass
+    elif not isinstance(msg.data, Iterable) or isinstance(msg.data, str | bytes):
+        builder.add_arg(msg.data)
+    else:
+        for arg in msg.data:
+            builder.add_arg(arg)
+    return builder.build()
+
+
+def _build_bundles(message_dgrams: 'Sequence[bytes]', timetag: float, max_size: int) -> list[bytes]:
+    """Pack encoded messages into as few bundles not larger than max size as possible.
+
+    Args:
+        message_dgrams: Message datagrams to pack
+        timetag: Epoch time to handle the bundle at or `0` to handle it immediately
+        max_size: Max bundle datagram size, single larger message gets its own bundle
+
+    Returns:
+        Bundle datagrams
+    """
+    header = _BUNDLE_STRING + pythonosc.parsing.osc_types.write_date(timetag)
+    bundles = []
+    elements = []
+    bundle_size = _BUNDLE_HEADER_SIZE
+    for message_dgram in message_dgrams:
+        element_size = _BUNDLE_ELEMENT_SIZE_SIZE + len(message_dgram)
+        if elements and bundle_size + element_size > max_size:
+            bundles.append(header + b''.join(elements))
+            elements = []
+            bundle_size = _BUNDLE_HEADER_SIZE
+        elements.append(pythonosc.parsing.osc_types.write_int(len(message_dgram)))
+        elements.append(message_dgram)
+        bundle_size += element_size
+
+    if elements:
+        bundles.append(header + b''.join(elements))
+    return bundles
+
+
+class _OscBatcher:
+    """Batcher of [`OscOut`][midiscripter.OscOut] port that collects messages sent
+    during the window and sends them as a single bundle.
+    """
+
+    def __init__(self, port: 'OscOut', window_sec: float):
+        self.__port = port
+        self.__window_sec = window_sec
+        self.__pending: list[OscMsg] = []
+        self.__lock = threading.Lock()
+        self.__worker_is_running = False
+
+    def send(self, msg: 'OscMsg') -> None:
+        with self.__lock:
+            self.__pending.append(msg)
+            if not self.__worker_is_running:
+                self.__worker_is_running = True
+                midiscripter.shared.thread_executor.submit(self.__flush_worker)
+
+    def __flush_worker(self) -> None:
+        """Thread worker that sends messages collected during the window"""
+        time.sleep(self.__window_sec)
+        with self.__lock:
+            msgs = self.__pending
+            self.__pending = []
+            self.__worker_is_running = False
+
+        if self.__port.is_opened:
+            self.__port._send_bundles(msgs)
+
+
+class _OscBundleScheduler:
+    """Scheduler of [`OscIn`][midiscripter.OscIn] port that handles messages
+    from the bundles with future timetag at their time. A single thread waits
+    for the earliest message, so the server thread keeps receiving meanwhile.
+    """
+
+    def __init__(self, handler: 'Callable[[str, tuple], None]'):
+        self.__handler = handler
+        self.__queue: list[tuple[float, int, str, tuple]] = []
+        self.__counter = itertools.count()  # keeps the order of messages with the same time
+        self.__condition = threading.Condition()
+        self.__worker_is_running = False
+
+    def schedule(self, timetag: float, address: str, data: tuple) -> None:
+        """Schedule the message handling at the time
+
+        Args:
+            timetag: Epoch time to handle the message at
+            address: Message address
+            data: Message arguments
+        """
+        due_time = time.perf_counter() + timetag - midiscripter.shared.precise_epoch_time()
+        with self.__condition:
+            heapq.heappush(self.__queue, (due_time, next(self.__counter), address, data))
+            if not self.__worker_is_running:
+                self.__worker_is_running = True
+                midiscripter.shared.thread_executor.submit(self.__scheduler_worker)
+            self.__condition.notify()
+
+    def clear(self) -> None:
+        """Drop all the scheduled messages"""
+        with self.__condition:
+            self.__queue.clear()
+            self.__condition.notify()
+
+    def __scheduler_worker(self) -> None:
+        """Thread worker loop that handles scheduled messages when they are due"""
+        while True:
+            with self.__condition:
+                if not self.__queue:
+                    self.__worker_is_running = False
+                    return
+
+                due_time = self.__queue[0][0]
+                wait_time = due_time - time.perf_counter()
+                if wait_time > _SCHEDULER_SPIN_SEC:
+                    self.__condition.wait(timeout=wait_time - _SCHEDULER_SPIN_SEC)
+                    continue
+
+                _, _, address, data = heapq.heappop(self.__queue)
+
+            midiscripter.shared.precise_sleep_until(due_time)
+            self.__handler(address, *data)
+
+
+class _TimedDispatcher(pythonosc.dispatcher.Dispatcher):
+    """Dispatcher that passes the bundles' messages with future timetag to the scheduler
+    instead of sleeping in the server thread until their time.
+    """
+
+    def __init__(self, handler: 'Callable[[str, tuple], None]', scheduler: _OscBundleScheduler):
+        super().__init__()
+        self.received_count = 0
+        self.dropped_count = 0  # not reported by the socket server
+        self.parse_error_count = 0
+
+        self.__handler = handler
+        self.__scheduler = scheduler
+
+    def call_handlers_for_packet(self, data: bytes, client_address: tuple[str, int]) -> list:
+        self.received_count += 1
+        try:
+            packet = pythonosc.osc_packet.OscPacket(data)
+        except pythonosc.osc_packet.ParseError:
+            self.parse_error_count += 1
+            return []
+
+        now = time.time()
+        for timed_msg in packet.messages:
+            if timed_msg.time > now:
+                self.__scheduler.schedule(
+                    timed_msg.time, timed_msg.message.address, tuple(timed_msg.message.params)
+                )
+            else:
+                self.__handler(timed_msg.message.address, *timed_msg.message.params)
+        return []
@@ -0,0 +1,272 @@
+import functools
+import struct
+from typing import Any
+
+_NTP_EPOCH_OFFSET_SEC = 2208988800  # 1900-01-01 to 1970-01-01
+_NTP_IMMEDIATELY = 1
+_BUNDLE_PREFIX = b'#bundle\x00'
+_CACHE_MAX_SIZE = 4096
+_ENCODED_PREFIX_CACHE_MAX_SIZE = 1024
+
+_UINT32 = struct.Struct('>I')
+_UINT64 = struct.Struct('>Q')
+
+# Type tags of fixed size arguments and their struct format characters
+_FIXED_SIZE_FORMATS = {'i': 'i', 'h': 'q', 'f': 'f', 'd': 'd', 'r': 'I'}
+_NO_DATA_VALUES = {'T': True, 'F': False, 'N': None, 'I': None}
+
+_address_cache: dict[bytes, str] = {}
+"""Decoded addresses by their datagram bytes"""
+
+_fixed_struct_cache: dict[str, struct.Struct | None] = {}
+"""Compiled structs for type tags of fixed size arguments only, `None` for other type tags"""
+
+
+class _OscParseError(ValueError):
+    pass
+
+
+class _EncodedPacket:
+    """Encoded packet to send with pythonosc client"""
+
+    __slots__ = ('dgram',)
+
+    def __init__(self, dgram: bytes):
+        self.dgram = dgram
+
+
+def _ntp_to_epoch(ntp_timetag: int) -> float:
+    """Convert NTP timetag to epoch time, `0` for the "immediately" timetag"""
+    if ntp_timetag == _NTP_IMMEDIATELY:
+        return 0
+    return (ntp_timetag >> 32) - _NTP_EPOCH_OFFSET_SEC + (ntp_timetag & 0xFFFFFFFF) / 2**32
+
+
+def _read_string(data: bytes, index: int) -> tuple[bytes, int]:
+    """Read null terminated 4-byte padded string
+
+    Returns:
+        String bytes and the index after its padding
+    """
+    end = data.find(b'\x00', index)
+    if end == -1:
+        raise _OscParseError('Unterminated string')
+    return data[index:end], (end + 4) & ~3
+
+
+def _get_fixed_struct(type_tag: str) -> struct.Struct | None:
+    try:
+        return _fixed_struct_cache[type_tag]
+    except KeyError:
+        if all(tag in _FIXED_SIZE_FORMATS for tag in type_tag):
+            fixed_struct = struct.Struct(
+                '>' + ''.join(_FIXED_SIZE_FORMATS[tag] for tag in type_tag)
+            )
+        else:
+            fixed_struct = None
+        if len(_fixed_struct_cache) < _CACHE_MAX_SIZE:
+            _fixed_struct_cache[type_tag] = fixed_struct
+        return fixed_struct
+
+
+def _read_text(data: bytes, index: int) -> tuple[str, int]:
+    string, index = _read_string(data, index)
+    return string.decode(), index
+
+
+def _read_blob(data: bytes, index: int) -> tuple[bytes, int]:
+    size = _UINT32.unpack_from(data, index)[0]
+    index += 4
+    if index + size > len(data):
+        raise _OscParseError('Blob is longer than the datagram')
+    return data[index : index + size], index + ((size + 3) & ~3)
+
+
+def _read_midi(data: bytes, index: int) -> tuple[tuple, int]:
+    return tuple(data[index : index + 4]), index + 4
+
+
+def _read_char(data: bytes, index: int) -> tuple[str, int]:
+    return chr(_UINT32.unpack_from(data, index)[0]), index + 4
+
+
+def _read_timetag(data: bytes, index: int) -> tuple[float, int]:
+    return _ntp_to_epoch(_UINT64.unpack_from(data, index)[0]), index + 8
+
+
+# Readers of variable size arguments by type tag
+_ARG_READERS = {
+    's': _read_text,
+    'S': _read_text,
+    'b': _read_blob,
+    'm': _read_midi,
+    'c': _read_char,
+    't': _read_timetag,
+}
+
+
+def _decode_args(data: bytes, index: int, type_tag: str) -> tuple:
+    args: list[Any] = []
+    args_stack = [args]
+    for tag in type_tag:
+        if tag in _FIXED_SIZE_FORMATS:
+            fixed_struct = _get_fixed_struct(tag)
+            args_stack[-1].append(fixed_struct.unpack_from(data, index)[0])
+            index += fixed_struct.size
+        elif tag in _ARG_READERS:
+            arg, index = _ARG_READERS[tag](data, index)
+            args_stack[-1].append(arg)
+        elif tag in _NO_DATA_VALUES:
+            args_stack[-1].append(_NO_DATA_VALUES[tag])
+        elif tag == '[':
+            array = []
+            args_stack[-1].append(array)
+            args_stack.append(array)
+        elif tag == ']' and len(args_stack) > 1:
+            args_stack.pop()
+        else:
+            raise _OscParseError(f'Unexpected type tag: {tag}')
+
+    if len(args_stack) != 1 or index > len(data):
+        raise _OscParseError('Malformed arguments')
+    return tuple(args)
+
+
+def _decode_message(data: bytes) -> tuple[str, tuple]:
+    """Decode OSC message datagram
+
+    Returns:
+        Message address and arguments
+    """
+    end = data.find(b'\x00')
+    if end <= 0:
+        raise _OscParseError('No address')
+    address_bytes = data[:end]
+    try:
+        address = _address_cache[address_bytes]
+    except KeyError:
+        if address_bytes[0] != 47:  # '/'
+            raise _OscParseError('Address must start with "/"') from None
+        address = address_bytes.decode()
+        if len(_address_cache) < _CACHE_MAX_SIZE:
+            _address_cache[address_bytes] = address
+
+    index = (end + 4) & ~3
+    if index >= len(data):  # no type tag
+        return address, ()
+
+    type_tag_bytes, index = _read_string(data, index)
+    if type_tag_bytes[:1] != b',':
+        raise _OscParseError('Type tag must start with ","')
+    type_tag = type_tag_bytes[1:].decode()
+
+    fixed_struct = _get_fixed_struct(type_tag)
+    if fixed_struct:
+        if index + fixed_struct.size > len(data):
+            raise _OscParseError('Datagram is too short')
+        return address, fixed_struct.unpack_from(data, index)
+    return address, _decode_args(data, index, type_tag)
+
+
+def _decode_packet(
+    data: bytes, timetag: float = 0, messages: list | None = None
+) -> list[tuple[float, str, tuple]]:
+    """Decode OSC message or bundle datagram without pythonosc overhead.
+
+    Args:
+        data: Datagram
+        timetag: Epoch time of the enclosing bundle
+        messages: List to append decoded messages to
+
+    Raises:
+        _OscParseError: on malformed datagram
+
+    Returns:
+        Epoch time to handle the message at (`0` for immediately), address and arguments
+        for every message in the datagram
+    """
+    if messages is None:
+        messages = []
+
+    try:
+        if not data.startswith(_BUNDLE_PREFIX):
+            messages.append((timetag, *_decode_message(data)))
+            return messages
+
+        timetag = _ntp_to_epoch(_UINT64.unpack_from(data, 8)[0])
+        index = 16
+        while index < len(data):
+            size = _UINT32.unpack_from(data, index)[0]
+            index += 4
+            if index + size > len(data):
+                raise _OscParseError('Bundle element is longer than the bundle')
+            _decode_packet(data[index : index + size], timetag, messages)
+            index += size
+    except (struct.error, UnicodeDecodeError, IndexError) as exc:
+        raise _OscParseError(str(exc)) from exc
+
+    return messages
+
+
+def _pad_string(data: bytes) -> bytes:
+    """Null terminate and pad the string to 4 bytes"""
+    return data + b'\x00' * (4 - len(data) % 4)
+
+
+@functools.lru_cache(maxsize=_ENCODED_PREFIX_CACHE_MAX_SIZE)
+def _encode_prefix(address: str, type_tag: str) -> bytes:
+    """Encode message address and type tag, the same for all messages with the address
+    and the arguments types"""
+    return _pad_string(address.encode()) + _pad_string(f',{type_tag}'.encode())
+
+
+def _get_arg_type_tag(arg: Any) -> str:
+    """Get type tag the same way pythonosc guesses it. Exact types only,
+    `KeyError` for the other types that are encoded by pythonosc."""
+    if arg is True:
+        return 'T'
+    if arg is False:
+        return 'F'
+    if arg is None:
+        return 'N'
+    if type(arg) is int:
+        return 'h' if arg.bit_length() > 31 else 'i'
+    return _TYPE_TAG_BY_TYPE[type(arg)]
+
+
+def _encode_str_arg(arg: str) -> bytes:
+    return _pad_string(arg.encode())
+
+
+def _encode_blob_arg(arg: bytes) -> bytes:
+    return _UINT32.pack(len(arg)) + arg + b'\x00' * (-len(arg) % 4)
+
+
+_TYPE_TAG_BY_TYPE = {float: 'f', str: 's', bytes: 'b'}
+_ARG_ENCODERS = {'s': _encode_str_arg, 'b': _encode_blob_arg}
+
+
+def _encode_message(address: str, args: tuple | list) -> bytes | None:
+    """Encode OSC message datagram. Encoded address and type tag are cached,
+    only the arguments are encoded for every message.
+
+    Returns:
+        Message datagram or `None` if the arguments need pythonosc to encode them
+    """
+    try:
+        type_tag = ''.join([_get_arg_type_tag(arg) for arg in args])
+    except KeyError:
+        return None
+
+    prefix = _encode_prefix(address, type_tag)
+    fixed_struct = _get_fixed_struct(type_tag)
+    if fixed_struct:
+        return prefix + fixed_struct.pack(*args)
+
+    encoded_args = [prefix]
+    for tag, arg in zip(type_tag, args, strict=True):
+        if tag in _ARG_ENCODERS:
+            encoded_args.append(_ARG_ENCODERS[tag](arg))
+        elif tag in _FIXED_SIZE_FORMATS:
+            encoded_args.append(_get_fixed_struct(tag).pack(arg))
+    return b''.join(encoded_args)
@@ -1,5 +1,9 @@
+import asyncio
+import concurrent.futures
+import contextlib
 import threading
-from typing import TYPE_CHECKING, overload
+import time
+from typing import TYPE_CHECKING, Any, overload
 
 import pythonosc.osc_server
 import pythonosc.udp_client
@@ -8,10 +12,23 @@ import midiscripter.base.port_base
 import midiscripter.shared
 import midiscripter.osc.osc_msg
 from midiscripter.logger import log
+from midiscripter.osc.osc_address_trie import _OscAddressTrie
+from midiscripter.osc.osc_bundle import (
+    _OscBatcher,
+    _OscBundleScheduler,
+    _TimedDispatcher,
+    _build_bundles,
+    _build_osc_message,
+)
+from midiscripter.osc.osc_codec import _EncodedPacket, _encode_message
 from midiscripter.osc.osc_msg import OscMsg
+from midiscripter.osc.osc_query_cache import OscQueryCache
+from midiscripter.osc.osc_receiver import _OscReceiver
+from midiscripter.osc.osc_tcp import OscTransport, _OscTcpClient, _OscTcpReceiver
 
 if TYPE_CHECKING:
-    from collections.abc import Container, Callable
+    from midiscripter.base.port_base import CallOn, Executor, SubscribedCall
+    from collections.abc import Container, Callable, Iterable, Sequence
 
 
 def _parse_ip_port(ip_port: str | int) -> (str, int):
@@ -34,20 +51,99 @@ def _parse_ip_port(ip_port: str | int) -> (str, int):
     return ip_address, port
 
 
+def _data_to_tuple(data: Any) -> tuple:
+    """Convert OSC message data to tuple of arguments"""
+    if data is None:
+        return ()
+    if isinstance(data, list | tuple):
+        return tuple(data)
+    return (data,)
+
+
 class OscIn(midiscripter.base.port_base.Input):
-    """Open Sound Control input port. Produces [`OscMsg`][midiscripter.OscMsg] objects."""
+    """Open Sound Control input port. Produces [`OscMsg`][midiscripter.OscMsg] objects.
+
+    Messages from bundles with future timetag are produced at the timetag time.
+
+    Subscription addresses can be OSC address patterns with `*`, `?`, `[a-z]`, `[!abc]`
+    and `{foo,bar}` wildcards, incoming message address patterns match subscription addresses.
+    Subscriptions are indexed by address, so many of them don't slow down the message handling.
+    """
 
     _log_description: str = 'OSC input'
 
-    def __init__(self, listener_ip_port: str | int):
+    DEFAULT_RECEIVE_BUFFER_SIZE: int = 4 * 1024 * 1024
+    """Socket receive buffer size for the high-throughput receiver"""
+
+    def __init__(self, listener_ip_port: str | int, transport: OscTransport | str = 'udp'):
         """
         Args:
             listener_ip_port: `'ip:port'` or local port to listen for incoming OSC messages
+            transport: `'udp'`, `'tcp'` for OSC 1.0 size prefixed TCP stream
+                       or `'slip'` for OSC 1.1 SLIP encoded TCP stream
         """
         super().__init__(listener_ip_port)
         self.listener_ip_address, self.listener_port = _parse_ip_port(listener_ip_port)
-        self.__dispatcher = pythonosc.osc_server.Dispatcher()
-        self.__dispatcher.set_default_handler(self.__osc_server_msg_handler)
+        self.transport = OscTransport(transport)
+        self.__bundle_scheduler = _OscBundleScheduler(self.__osc_server_msg_handler)
+        self.__dispatcher = _TimedDispatcher(self.__osc_server_msg_handler, self.__bundle_scheduler)
+        self.__receiver: _OscReceiver | None = None
+        if self.transport != OscTransport.UDP:
+            self.__receiver = _OscTcpReceiver(
+                self.__osc_server_msg_handler, self.__bundle_scheduler, self.transport
+            )
+
+        self.__address_index = _OscAddressTrie()
+        self.__indexed_calls_count = 0
+        self.__not_indexed_calls_positions: list[int] = []
+        self.__index_lock = threading.Lock()
+
+    @property
+    def received_count(self) -> int:
+        """Datagrams or TCP frames received by the current server"""
+        return (self.__receiver or self.__dispatcher).received_count
+
+    @property
+    def dropped_count(self) -> int:
+        """Datagrams dropped by the OS for full receive buffer.
+        Reported by the high-throughput receiver on Linux only."""
+        return (self.__receiver or self.__dispatcher).dropped_count
+
+    @property
+    def parse_error_count(self) -> int:
+        """Malformed datagrams ignored by the current server"""
+        return (self.__receiver or self.__dispatcher).parse_error_count
+
+    def set_high_throughput(
+        self, enabled: bool = True, *, receive_buffer_size: int = DEFAULT_RECEIVE_BUFFER_SIZE
+    ) -> None:
+        """Receive messages with the high-throughput server instead of the pythonosc one.
+        It drains all pending datagrams from a large socket buffer on every wake-up
+        and decodes them with a lean decoder, so floods of messages aren't dropped.
+
+        Args:
+            enabled: Use the high-throughput server
+            receive_buffer_size: Socket receive buffer size in bytes
+        """
+        if self.transport != OscTransport.UDP:
+            log.yellow('{input} input always uses TCP stream server', input=self)
+            return
+
+        was_opened = self.is_opened
+        if was_opened:
+            self._close()
+
+        if enabled:
+            self.__receiver = _OscReceiver(
+                self.__osc_server_msg_handler, self.__bundle_scheduler, receive_buffer_size
+            )
+            log('{input} input will use high-throughput server', input=self)
+        else:
+            self.__receiver = None
+            log('{input} input will use pythonosc server', input=self)
+
+        if was_opened:
+            self._open()
 
     def __osc_server_msg_handler(self, address: str, *data) -> None:
         if len(data) == 1:
@@ -55,16 +151,70 @@ class OscIn(midiscripter.base.port_base.Input):
         input_msg = OscMsg(address, data, source=self)
         self._send_input_msg_to_calls(input_msg)
 
+    def _get_calls_to_match(
+        self, msg: OscMsg
+    ) -> 'Iterable[tuple[None | CallOn | tuple[tuple, dict], list[SubscribedCall]]]':
+        if self.__indexed_calls_count < len(self._calls):
+            with self.__index_lock:
+                self.__index_calls()
+
+        # Position in calls list to keep the subscription order
+        conditions_by_position = dict(self.__address_index.match(msg.address))
+        for position in self.__not_indexed_calls_positions:
+            conditions_by_position[position] = self._calls[position][0]
+
+        return [
+            (conditions_by_position[position], self._calls[position][1])
+            for position in sorted(conditions_by_position)
+        ]
+
+    def __index_calls(self) -> None:
+        """Add the calls subscribed since the last indexing to the address index"""
+        for position in range(self.__indexed_calls_count, len(self._calls)):
+            conditions = self._calls[position][0]
+            if isinstance(conditions, tuple):
+                args, kwargs = conditions
+                address = kwargs['address'] if 'address' in kwargs else next(iter(args), None)
+            else:
+                address = None
+
+            if isinstance(address, str):
+                addresses = (address,)
+            elif isinstance(address, list | tuple | set | frozenset) and all(
+                isinstance(item, str) for item in address
+            ):
+                addresses = address
+            else:
+                self.__not_indexed_calls_positions.append(position)
+                continue
+
+            # The index matches the address, so only the other conditions are checked
+            if 'address' in kwargs:
+                conditions_without_address = (args, {**kwargs, 'address': None})
+            else:
+                conditions_without_address = ((None, *args[1:]), kwargs)
+            for address in addresses:
+                self.__address_index.add(address, (position, conditions_without_address))
+
+        self.__indexed_calls_count = len(self._calls)
+
     def _open(self) -> None:
-        self._osc_server = pythonosc.osc_server.BlockingOSCUDPServer(
-            (self.listener_ip_address, self.listener_port), self.__dispatcher
-        )
-        midiscripter.shared.thread_executor.submit(self._osc_server.serve_forever)
+        if self.__receiver:
+            self.__receiver.start(self.listener_ip_address, self.listener_port)
+        else:
+            self._osc_server = pythonosc.osc_server.BlockingOSCUDPServer(
+                (self.listener_ip_address, self.listener_port), self.__dispatcher
+            )
+            midiscripter.shared.thread_executor.submit(self._osc_server.serve_forever)
         self.is_opened = True
         log._port_open(self, True)
 
     def _close(self) -> None:
-        self._osc_server.server_close()
+        if self.__receiver:
+            self.__receiver.stop()
+        else:
+            self._osc_server.server_close()
+        self.__bundle_scheduler.clear()
         self.is_opened = False
         log._port_close(self, True)
 
@@ -76,14 +226,18 @@ class OscIn(midiscripter.base.port_base.Input):
         self,
         address: 'None | Container | str' = None,
         data: 'None | Container | str | bytes | bool | int | float | list | tuple' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
         self,
         address: 'None | Container | str' = None,
         data: 'None | Container | str | bytes | bool | int | float | list | tuple' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return super().subscribe(address, data)
+        return super().subscribe(address, data, executor=executor)
 
 
 class OscOut(midiscripter.base.port_base.Output):
@@ -91,14 +245,36 @@ class OscOut(midiscripter.base.port_base.Output):
 
     _log_description: str = 'OSC output'
 
-    def __init__(self, target_ip_port: str | int):
+    MAX_BUNDLE_SIZE: int = 8192
+    """Max bundle datagram size, more messages are split to several bundles"""
+
+    def __init__(self, target_ip_port: str | int, transport: OscTransport | str = 'udp'):
         """
         Args:
             target_ip_port: `'ip:port'` or local port to send output OSC messages to
+            transport: `'udp'`, `'tcp'` for OSC 1.0 size prefixed TCP stream
+                       or `'slip'` for OSC 1.1 SLIP encoded TCP stream
         """
         super().__init__(target_ip_port)
         target_ip_address, target_port = _parse_ip_port(target_ip_port)
-        self._osc_client = pythonosc.udp_client.SimpleUDPClient(target_ip_address, target_port)
+        self.transport = OscTransport(transport)
+        if self.transport == OscTransport.UDP:
+            self._osc_client = pythonosc.udp_client.SimpleUDPClient(target_ip_address, target_port)
+        else:
+            self._osc_client = _OscTcpClient(target_ip_address, target_port, self.transport)
+        self.__batcher: _OscBatcher | None = None
+
+    def _open(self) -> None:
+        if self.transport != OscTransport.UDP:
+            self._osc_client.open()
+        self.is_opened = True
+        log._port_open(self, True)
+
+    def _close(self) -> None:
+        if self.transport != OscTransport.UDP:
+            self._osc_client.close()
+        self.is_opened = False
+        log._port_close(self, True)
 
     def send(self, msg: OscMsg) -> None:
         """Send the OSC message.
@@ -109,10 +285,58 @@ class OscOut(midiscripter.base.port_base.Output):
         if not self._validate_msg_send(msg):
             return
 
-        data = list(msg.data) if isinstance(msg.data, tuple) else msg.data
-        self._osc_client.send_message(msg.address, data)
+        if self.__batcher:
+            self.__batcher.send(msg)
+            return
+
+        dgram = _encode_message(msg.address, _data_to_tuple(msg.data))
+        if dgram:
+            self._osc_client.send(_EncodedPacket(dgram))
+        else:
+            data = list(msg.data) if isinstance(msg.data, tuple) else msg.data
+            self._osc_client.send_message(msg.address, data)
         log._msg_sent(self, msg)
 
+    def send_bundle(self, msgs: 'Sequence[OscMsg]', *, delay_sec: float = 0) -> None:
+        """Send the OSC messages packed into a single bundle datagram.
+        Saves network and system call overhead when updating many values at once.
+
+        Args:
+            msgs: objects to send
+            delay_sec: Time for the receiver to delay the bundle's messages handling
+                       using the bundle timetag, `0` to handle them immediately
+        """
+        msgs = [msg for msg in msgs if self._validate_msg_send(msg)]
+        if msgs:
+            timetag = midiscripter.shared.precise_epoch_time() + delay_sec if delay_sec else 0
+            self._send_bundles(msgs, timetag)
+
+    def set_batching(self, window_sec: float | None = 0.001) -> None:
+        """Collect messages sent during the window after the first one
+        and send them as a single bundle. Saves network and system call overhead
+        for bursts of messages at cost of the window latency.
+
+        Args:
+            window_sec: Time to collect messages for, `None` to send messages on their own
+        """
+        if window_sec:
+            self.__batcher = _OscBatcher(self, window_sec)
+            log('{output} output will batch messages into bundles', output=self)
+        else:
+            self.__batcher = None
+            log('{output} output will not batch messages', output=self)
+
+    def _send_bundles(self, msgs: 'Sequence[OscMsg]', timetag: float = 0) -> None:
+        message_dgrams = [
+            _encode_message(msg.address, _data_to_tuple(msg.data)) or _build_osc_message(msg).dgram
+            for msg in msgs
+        ]
+        for bundle_dgram in _build_bundles(message_dgrams, timetag, self.MAX_BUNDLE_SIZE):
+            self._osc_client.send(_EncodedPacket(bundle_dgram))
+
+        for msg in msgs:
+            log._msg_sent(self, msg)
+
 
 class OscIO(midiscripter.base.port_base.MultiPort):
     """Open Sound Control input/output port that combines [`OscIn`][midiscripter.OscIn] and
@@ -122,36 +346,50 @@ class OscIO(midiscripter.base.port_base.MultiPort):
 
     _log_description: str = 'OSC i/o port'
 
-    def __init__(self, input_listener_ip_port: str | int, output_target_ip_port: str | int):
+    def __init__(
+        self,
+        input_listener_ip_port: str | int,
+        output_target_ip_port: str | int,
+        transport: OscTransport | str = 'udp',
+    ):
         """
         Args:
             input_listener_ip_port: `'ip:port'` or local port to listen for incoming OSC messages
             output_target_ip_port: `'ip:port'` or local port to send output OSC messages to
+            transport: `'udp'`, `'tcp'` for OSC 1.0 size prefixed TCP stream
+                       or `'slip'` for OSC 1.1 SLIP encoded TCP stream
         """
-        input_port = OscIn(input_listener_ip_port)
-        output_port = OscOut(output_target_ip_port)
+        input_port = OscIn(input_listener_ip_port, transport)
+        output_port = OscOut(output_target_ip_port, transport)
         super().__init__(
             f'{input_listener_ip_port} > {output_target_ip_port}', input_port, output_port
         )
 
-        self.__new_msg_condition = threading.Condition()
-        self.__last_msg = OscMsg('')
+        self.__pending_queries: dict[str, list[tuple[tuple, concurrent.futures.Future]]] = {}
+        self.__pending_queries_lock = threading.Lock()
         input_port.subscribe(self.__osc_query_listener)
 
+        self.query_cache = OscQueryCache()
+        """Response cache for `cached_query` and `cached_query_async` methods"""
+
     def query(
         self,
         address: str,
         data: str | bytes | bool | int | float | list | tuple = None,
         *,
         timeout_sec: float = 1,
+        match_data: bool = False,
     ) -> str | bytes | bool | float | list | tuple:
         """Queries data by sending the request to OSC address
-           and returns the data of response from that address
+           and returns the data of response from that address.
+           Queries from different threads don't wait for each other.
 
         Args:
             address: OSC address to send request to
-            data: data to send request with, not used to match response
+            data: data to send request with
             timeout_sec: time for response until raising `TimeoutError`
+            match_data: Match only the response which data starts with the request data,
+                        like AbletonOSC responses do
 
         Raises:
             TimeoutError: on query timeout
@@ -159,27 +397,207 @@ class OscIO(midiscripter.base.port_base.MultiPort):
         Returns:
             Response OSC message data
         """
-        with self.__new_msg_condition:
-            self.__last_msg = OscMsg('')
+        return self.query_many([(address, data)], timeout_sec=timeout_sec, match_data=match_data)[0]
 
-            log(
-                "Requesting '{address}' data from OSC {input}",
-                address=address,
-                input=self._input_ports[0],
+    def query_many(
+        self,
+        queries: 'Iterable[tuple[str, Any] | tuple[str, Any, float]]',
+        *,
+        timeout_sec: float = 1,
+        match_data: bool = False,
+    ) -> list[str | bytes | bool | float | list | tuple]:
+        """Sends all the query requests at once and waits for all the responses.
+           Takes about the time of a single query instead of the sum of them.
+
+        Args:
+            queries: `(address, data)` or `(address, data, timeout_sec)` tuples for queries
+            timeout_sec: time for response until raising `TimeoutError`
+                         for the queries without own timeout
+            match_data: Match only the response which data starts with the request data,
+                        like AbletonOSC responses do. Otherwise, the responses from the same
+                        address are matched to the queries in the order they came.
+
+        Raises:
+            TimeoutError: if any query timed out
+
+        Returns:
+            Response OSC messages data in the order of the queries
+
+        Example:
+            ``` python
+            track_names = ableton_osc.query_many(
+                [('/live/track/get/name', track_index) for track_index in range(track_count)],
+                match_data=True,
             )
-            self._output_ports[0].send(OscMsg(address, data))
+            ```
+        """
+        now = time.monotonic()
+        pending_queries = []
+        for address, data, *query_timeout_sec in queries:
+            future = self.__send_query(address, data, match_data)
+            deadline = now + (query_timeout_sec[0] if query_timeout_sec else timeout_sec)
+            pending_queries.append((address, future, deadline))
+
+        results = []
+        timed_out_addresses = []
+        for address, future, deadline in pending_queries:
+            try:
+                results.append(future.result(max(0.0, deadline - time.monotonic())))
+            except concurrent.futures.TimeoutError:
+                self.__cancel_query(address, future)
+                timed_out_addresses.append(address)
+
+        if timed_out_addresses:
+            addresses_text = "', '".join(timed_out_addresses)
+            raise TimeoutError(f"OSC query to '{addresses_text}' got no response")
+
+        return results
+
+    async def query_async(
+        self,
+        address: str,
+        data: str | bytes | bool | int | float | list | tuple = None,
+        *,
+        timeout_sec: float = 1,
+        match_data: bool = False,
+    ) -> str | bytes | bool | float | list | tuple:
+        """Queries data by sending the request to OSC address
+           and returns the data of response from that address.
+           Awaitable version of `query` that doesn't occupy a thread while waiting.
 
-            if self.__new_msg_condition.wait_for(
-                lambda: self.__last_msg.address == address, timeout=timeout_sec
-            ):
-                return self.__last_msg.data
-            else:
-                raise TimeoutError(f"OSC query to '{address}' got no response")
+        Args:
+            address: OSC address to send request to
+            data: data to send request with
+            timeout_sec: time for response until raising `TimeoutError`
+            match_data: Match only the response which data starts with the request data,
+                        like AbletonOSC responses do
+
+        Raises:
+            TimeoutError: on query timeout
+
+        Returns:
+            Response OSC message data
+        """
+        future = self.__send_query(address, data, match_data)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout_sec)
+        except TimeoutError:
+            raise TimeoutError(f"OSC query to '{address}' got no response") from None
+        finally:
+            self.__cancel_query(address, future)
+
+    def cached_query(
+        self,
+        address: str,
+        data: str | bytes | bool | int | float | list | tuple = None,
+        *,
+        timeout_sec: float = 1,
+        match_data: bool = False,
+    ) -> str | bytes | bool | float | list | tuple:
+        """Returns the response data from `query_cache` or queries it if it's not cached
+           or expired. Cached responses are updated by messages from their address,
+           so values with AbletonOSC listener set stay up to date.
+
+        Args:
+            address: OSC address to send request to
+            data: data to send request with
+            timeout_sec: time for response until raising `TimeoutError`
+            match_data: Match only the response which data starts with the request data,
+                        like AbletonOSC responses do
+
+        Raises:
+            TimeoutError: on query timeout
+
+        Returns:
+            Response OSC message data
+        """
+        data_prefix = _data_to_tuple(data)
+        is_cached, response_data = self.query_cache._get(address, data_prefix)
+        if not is_cached:
+            response_data = self.query(
+                address, data, timeout_sec=timeout_sec, match_data=match_data
+            )
+            self.query_cache._put(address, data_prefix, response_data)
+        return response_data
+
+    async def cached_query_async(
+        self,
+        address: str,
+        data: str | bytes | bool | int | float | list | tuple = None,
+        *,
+        timeout_sec: float = 1,
+        match_data: bool = False,
+    ) -> str | bytes | bool | float | list | tuple:
+        """Awaitable version of `cached_query` that doesn't occupy a thread while waiting.
+
+        Args:
+            address: OSC address to send request to
+            data: data to send request with
+            timeout_sec: time for response until raising `TimeoutError`
+            match_data: Match only the response which data starts with the request data,
+                        like AbletonOSC responses do
+
+        Raises:
+            TimeoutError: on query timeout
+
+        Returns:
+            Response OSC message data
+        """
+        data_prefix = _data_to_tuple(data)
+        is_cached, response_data = self.query_cache._get(address, data_prefix)
+        if not is_cached:
+            response_data = await self.query_async(
+                address, data, timeout_sec=timeout_sec, match_data=match_data
+            )
+            self.query_cache._put(address, data_prefix, response_data)
+        return response_data
+
+    def __send_query(self, address: str, data: Any, match_data: bool) -> concurrent.futures.Future:
+        data_prefix = _data_to_tuple(data) if match_data else ()
+        future = concurrent.futures.Future()
+        with self.__pending_queries_lock:
+            self.__pending_queries.setdefault(address, []).append((data_prefix, future))
+
+        log(
+            "Requesting '{address}' data from OSC {input}",
+            address=address,
+            input=self._input_ports[0],
+        )
+        self._output_ports[0].send(OscMsg(address, data))
+        return future
+
+    def __cancel_query(self, address: str, future: concurrent.futures.Future) -> None:
+        with self.__pending_queries_lock:
+            address_queries = self.__pending_queries.get(address, [])
+            for query in address_queries:
+                if query[1] is future:
+                    address_queries.remove(query)
+                    break
+            if not address_queries:
+                self.__pending_queries.pop(address, None)
 
     def __osc_query_listener(self, msg: OscMsg) -> None:
-        with self.__new_msg_condition:
-            self.__last_msg = msg
-            self.__new_msg_condition.notify_all()
+        response_data = _data_to_tuple(msg.data)
+        self.query_cache._update(msg, response_data)
+
+        with self.__pending_queries_lock:
+            address_queries = self.__pending_queries.get(msg.address)
+            if not address_queries:
+                return
+
+            for query in address_queries:
+                data_prefix, future = query
+                if response_data[: len(data_prefix)] == data_prefix:
+                    address_queries.remove(query)
+                    break
+            else:
+                return
+
+            if not address_queries:
+                del self.__pending_queries[msg.address]
+
+        with contextlib.suppress(concurrent.futures.InvalidStateError):  # cancelled by timeout
+            future.set_result(msg.data)
 
     @overload
     def subscribe(self, call: 'Callable[[OscMsg], None]') -> 'Callable': ...
@@ -189,14 +607,18 @@ class OscIO(midiscripter.base.port_base.MultiPort):
         self,
         address: 'None | Container | str' = None,
         data: 'None | Container | str | bytes | bool | int | float | list | tuple' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable': ...
 
     def subscribe(
         self,
         address: 'None | Container | str' = None,
         data: 'None | Container | str | bytes | bool | int | float | list | tuple' = None,
+        *,
+        executor: 'Executor | str' = 'thread',
     ) -> 'Callable':
-        return self._input_ports[0].subscribe(address, data)
+        return self._input_ports[0].subscribe(address, data, executor=executor)
 
     def send(self, msg: OscMsg) -> None:
         """Send the OSC message.
@@ -205,3 +627,40 @@ class OscIO(midiscripter.base.port_base.MultiPort):
             msg: object to send
         """
         self._output_ports[0].send(msg)
+
+    def send_bundle(self, msgs: 'Sequence[OscMsg]', *, delay_sec: float = 0) -> None:
+        """Send the OSC messages packed into a single bundle datagram.
+        Saves network and system call overhead when updating many values at once.
+
+        Args:
+            msgs: objects to send
+            delay_sec: Time for the receiver to delay the bundle's messages handling
+                       using the bundle timetag, `0` to handle them immediately
+        """
+        self._output_ports[0].send_bundle(msgs, delay_sec=delay_sec)
+
+    def set_batching(self, window_sec: float | None = 0.001) -> None:
+        """Collect messages sent during the window after the first one
+        and send them as a single bundle. Saves network and system call overhead
+        for bursts of messages at cost of the window latency.
+
+        Args:
+            window_sec: Time to collect messages for, `None` to send messages on their own
+        """
+        self._output_ports[0].set_batching(window_sec)
+
+    def set_high_throughput(
+        self,
+        enabled: bool = True,
+        *,
+        receive_buffer_size: int = OscIn.DEFAULT_RECEIVE_BUFFER_SIZE,
+    ) -> None:
+        """Receive messages with the high-throughput server instead of the pythonosc one.
+        It drains all pending datagrams from a large socket buffer on every wake-up
+        and decodes them with a lean decoder, so floods of messages aren't dropped.
+
+        Args:
+            enabled: Use the high-throughput server
+            receive_buffer_size: Socket receive buffer size in bytes
+        """
+        self._input_ports[0].set_high_throughput(enabled, receive_buffer_size=receive_buffer_size)
@@ -0,0 +1,121 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from midiscripter.osc.osc_address_trie import _match_address
+
+if TYPE_CHECKING:
+    from midiscripter.osc.osc_msg import OscMsg
+
+
+class OscQueryCache:
+    """Response cache of [`OscIO`][midiscripter.OscIO] port available as its `query_cache`
+    attribute. Used by `cached_query` and `cached_query_async` methods.
+
+    Every message the port gets updates the cached responses from its address
+    which request data the message data starts with. So values pushed by AbletonOSC
+    listeners (`/live/.../start_listen/...`) keep the cache up to date without expiring.
+
+    Example:
+        ``` python
+        ableton_osc.query_cache.set_ttl('/live/clip/get/*', 60)
+        clip_name = ableton_osc.cached_query('/live/clip/get/name', (track, clip), match_data=True)
+        ```
+    """
+
+    DEFAULT_TTL_SEC: float = 10
+    """Time to keep cached responses for addresses without TTL set by `set_ttl`"""
+
+    hits: int
+    """Queries answered from the cache"""
+
+    misses: int
+    """Queries that were sent because the response wasn't cached or expired"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__ttl_by_pattern: dict[str, float] = {}
+        self.__ttl_by_address: dict[str, float] = {}
+        # Response data and update time by address and request data
+        self.__responses: dict[str, dict[tuple, tuple[Any, float]]] = {}
+        self.__lock = threading.Lock()
+
+    def __str__(self):
+        return f'OSC query cache ({self.hits} hits, {self.misses} misses)'
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of queries answered from the cache (0-1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def set_ttl(self, address_pattern: str, ttl_sec: float) -> None:
+        """Set time to keep cached responses from the addresses
+
+        Args:
+            address_pattern: OSC address or pattern with `*`, `?`, `[...]` and `{...}`
+                             wildcards matched by OSC rules, so `*` doesn't match `/`.
+                             The last set matching pattern is used.
+            ttl_sec: Time to keep the response, `math.inf` to keep it until it's updated
+        """
+        with self.__lock:
+            self.__ttl_by_pattern.pop(address_pattern, None)
+            self.__ttl_by_pattern[address_pattern] = ttl_sec
+            self.__ttl_by_address.clear()
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset the statistics"""
+        with self.__lock:
+            self.__responses.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get(self, address: str, data_prefix: tuple) -> tuple[bool, Any]:
+        """Get cached response data. Counts the hit or the miss.
+
+        Returns:
+            `True` if the response is cached and response data
+        """
+        with self.__lock:
+            try:
+                data, update_time = self.__responses[address][data_prefix]
+                if time.monotonic() - update_time < self.__get_ttl(address):
+                    self.hits += 1
+                    return True, data
+            except KeyError:
+                pass
+
+            self.misses += 1
+            return False, None
+
+    def _put(self, address: str, data_prefix: tuple, data: Any) -> None:
+        with self.__lock:
+            self.__responses.setdefault(address, {})[data_prefix] = (data, time.monotonic())
+
+    def _update(self, msg: 'OscMsg', msg_data: tuple) -> None:
+        """Update cached responses with the message got by the port"""
+        address_responses = self.__responses.get(msg.address)
+        if not address_responses:
+            return
+
+        with self.__lock:
+            update_time = time.monotonic()
+            for data_prefix in address_responses:
+                if msg_data[: len(data_prefix)] == data_prefix:
+                    address_responses[data_prefix] = (msg.data, update_time)
+
+    def __get_ttl(self, address: str) -> float:
+        try:
+            return self.__ttl_by_address[address]
+        except KeyError:
+            ttl_sec = next(
+                (
+                    ttl_sec
+                    for pattern, ttl_sec in reversed(self.__ttl_by_pattern.items())
+                    if _match_address(pattern, address)
+                ),
+                self.DEFAULT_TTL_SEC,
+            )
+            self.__ttl_by_address[address] = ttl_sec
+            return ttl_sec
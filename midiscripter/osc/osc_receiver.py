@@ -0,0 +1,127 @@
+import selectors
+import socket
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import midiscripter.shared
+from midiscripter.logger import log
+from midiscripter.osc.osc_codec import _decode_packet, _OscParseError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from midiscripter.osc.osc_bundle import _OscBundleScheduler
+
+
+_MAX_DATAGRAM_SIZE = 65535
+_MAX_DATAGRAMS_PER_BATCH = 1024  # handle the batch even if the flood doesn't end
+_POLL_TIMEOUT_SEC = 0.1  # to notice the receiver stop
+
+# Linux reports the number of datagrams dropped for full receive buffer
+# in the ancillary data of each received datagram
+_SO_RXQ_OVFL = 40 if sys.platform == 'linux' else None
+
+
+class _OscReceiver:
+    """High-throughput UDP server of [`OscIn`][midiscripter.OscIn] port.
+
+    A non-blocking socket with a large receive buffer is drained of all pending
+    datagrams on every wake-up, then the batch is decoded by the lean decoder
+    and its messages are passed to the handler without dispatcher address matching.
+    """
+
+    def __init__(
+        self,
+        handler: 'Callable[[str, tuple], None]',
+        scheduler: '_OscBundleScheduler',
+        receive_buffer_size: int,
+    ):
+        self.received_count = 0
+        self.dropped_count = 0
+        self.parse_error_count = 0
+
+        self.__handler = handler
+        self.__scheduler = scheduler
+        self.__receive_buffer_size = receive_buffer_size
+        self.__socket: socket.socket | None = None
+        self.__kernel_dropped_count = 0
+
+    def start(self, ip_address: str, port: int) -> None:
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.__receive_buffer_size)
+        if _SO_RXQ_OVFL:
+            self.__socket.setsockopt(socket.SOL_SOCKET, _SO_RXQ_OVFL, 1)
+        self.__socket.setblocking(False)
+        self.__socket.bind((ip_address, port))
+        self.__kernel_dropped_count = 0
+
+        actual_buffer_size = self.__socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if actual_buffer_size < self.__receive_buffer_size:
+            log.yellow(
+                'OSC receive buffer is limited to {size} bytes by the OS', size=actual_buffer_size
+            )
+
+        midiscripter.shared.thread_executor.submit(self.__receive_worker, self.__socket)
+
+    def stop(self) -> None:
+        if self.__socket:
+            self.__socket.close()
+            self.__socket = None
+
+    def __receive_worker(self, sock: socket.socket) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        try:
+            while self.__socket is sock:
+                if selector.select(_POLL_TIMEOUT_SEC):
+                    self._handle_datagrams(self.__drain(sock))
+        except (OSError, ValueError):  # socket closed
+            pass
+        finally:
+            selector.close()
+
+    def __drain(self, sock: socket.socket) -> list[bytes]:
+        """Read all the pending datagrams without blocking"""
+        datagrams = []
+        try:
+            if _SO_RXQ_OVFL:
+                ancillary_buffer_size = socket.CMSG_SPACE(4)
+                while len(datagrams) < _MAX_DATAGRAMS_PER_BATCH:
+                    datagram, ancillary_data, _, _ = sock.recvmsg(
+                        _MAX_DATAGRAM_SIZE, ancillary_buffer_size
+                    )
+                    datagrams.append(datagram)
+                    if ancillary_data:
+                        self.__update_kernel_dropped_count(ancillary_data[0][2])
+            else:
+                while len(datagrams) < _MAX_DATAGRAMS_PER_BATCH:
+                    datagrams.append(sock.recv(_MAX_DATAGRAM_SIZE))
+        except BlockingIOError:
+            pass
+        except OSError:
+            if self.__socket is not sock:
+                raise
+            self.dropped_count += 1  # Windows raises on oversized datagrams
+
+        return datagrams
+
+    def __update_kernel_dropped_count(self, counter_bytes: bytes) -> None:
+        kernel_dropped_count = int.from_bytes(counter_bytes[:4], sys.byteorder)
+        self.dropped_count += kernel_dropped_count - self.__kernel_dropped_count
+        self.__kernel_dropped_count = kernel_dropped_count
+
+    def _handle_datagrams(self, datagrams: list[bytes]) -> None:
+        self.received_count += len(datagrams)
+        now = time.time()
+        for datagram in datagrams:
+            try:
+                messages = _decode_packet(datagram)
+            except _OscParseError:
+                self.parse_error_count += 1
+                continue
+
+            for timetag, address, data in messages:
+                if timetag > now:
+                    self.__scheduler.schedule(timetag, address, data)
+                else:
+                    self.__handler(address, *data)
@@ -0,0 +1,282 @@
+import enum
+import select
+import selectors
+import socket
+import struct
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import pythonosc.osc_message_builder
+
+import midiscripter.shared
+from midiscripter.logger import log
+from midiscripter.osc.osc_receiver import _OscReceiver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pythonosc.osc_bundle import OscBundle
+    from midiscripter.osc.osc_bundle import _OscBundleScheduler
+    from pythonosc.osc_message import OscMessage
+
+
+class OscTransport(enum.StrEnum):
+    UDP = 'udp'
+    """Datagrams, the default"""
+    TCP = 'tcp'
+    """OSC 1.0 stream with frames prefixed by their size"""
+    SLIP = 'slip'
+    """OSC 1.1 stream with SLIP encoded frames"""
+
+
+_SIZE_PREFIX = struct.Struct('>I')
+_SLIP_END = b'\xc0'
+_SLIP_ESC = b'\xdb'
+_SLIP_ESC_END = b'\xdb\xdc'
+_SLIP_ESC_ESC = b'\xdb\xdd'
+
+_RECV_SIZE = 65536
+_POLL_TIMEOUT_SEC = 0.1  # to notice the server stop
+_CONNECT_TIMEOUT_SEC = 1
+
+
+def _encode_frame(packet: bytes, transport: OscTransport) -> bytes:
+    if transport == OscTransport.SLIP:
+        escaped = packet.replace(_SLIP_ESC, _SLIP_ESC_ESC).replace(_SLIP_END, _SLIP_ESC_END)
+        return _SLIP_END + escaped + _SLIP_END
+    return _SIZE_PREFIX.pack(len(packet)) + packet
+
+
+class _FrameParser:
+    """Splits TCP stream to OSC packets. Works with whole received chunks,
+    not byte by byte, so frame boundaries are found by C-level bytes methods.
+    """
+
+    def __init__(self, transport: OscTransport):
+        self.__transport = transport
+        self.__buffer = bytearray()
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add received data to the stream
+
+        Returns:
+            Packets completed by the data
+        """
+        self.__buffer += data
+        if self.__transport == OscTransport.SLIP:
+            return self.__split_slip_frames()
+        return self.__split_size_prefixed_frames()
+
+    def __split_slip_frames(self) -> list[bytes]:
+        *frames, self.__buffer = self.__buffer.split(_SLIP_END)
+        return [
+            bytes(frame).replace(_SLIP_ESC_END, _SLIP_END).replace(_SLIP_ESC_ESC, _SLIP_ESC)
+            for frame in frames
+            if frame  # SLIP frames can start with END too
+        ]
+
+    def __split_size_prefixed_frames(self) -> list[bytes]:
+        frames = []
+        index = 0
+        buffer_size = len(self.__buffer)
+        while buffer_size - index >= _SIZE_PREFIX.size:
+            frame_end = (
+                index + _SIZE_PREFIX.size + _SIZE_PREFIX.unpack_from(self.__buffer, index)[0]
+            )
+            if frame_end > buffer_size:
+                break
+            frames.append(bytes(self.__buffer[index + _SIZE_PREFIX.size : frame_end]))
+            index = frame_end
+
+        del self.__buffer[:index]
+        return frames
+
+
+class _OscTcpClient:
+    """Persistent TCP connection of [`OscOut`][midiscripter.OscOut] port.
+
+    Packets sent while the previous write is in progress are written together,
+    so bursts take few system calls while Nagle's algorithm is disabled
+    to send each write without delay. The connection is reestablished on failure.
+    """
+
+    def __init__(self, address: str, port: int, transport: OscTransport):
+        self.__address = (address, port)
+        self.__transport = transport
+        self.__socket: socket.socket | None = None
+        self.__is_closed = True
+        self.__pending: list[bytes] = []
+        self.__lock = threading.Lock()
+        self.__writer_is_running = False
+
+    def open(self) -> None:
+        """Connect to the server. Failed connection is retried on send."""
+        self.__is_closed = False
+        self.__connect()
+
+    def close(self) -> None:
+        self.__is_closed = True
+        with self.__lock:
+            self.__pending.clear()
+        if self.__socket:
+            self.__socket.close()
+            self.__socket = None
+
+    def __connect(self) -> bool:
+        """Connect if not connected
+
+        Returns:
+            `True` if connected
+        """
+        if self.__is_closed:
+            return False
+        if self.__socket:
+            if not self.__is_closed_by_server():
+                return True
+            self.__socket.close()
+            self.__socket = None
+
+        try:
+            sock = socket.create_connection(self.__address, timeout=_CONNECT_TIMEOUT_SEC)
+        except OSError as exc:
+            log.red(
+                "Can't connect to OSC TCP server {address}: {exc}",
+                address='{}:{}'.format(*self.__address),
+                exc=exc,
+            )
+            return False
+
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.__socket = sock
+        return True
+
+    def __is_closed_by_server(self) -> bool:
+        """Check if the server closed the connection, since the first write
+        to the closed connection doesn't fail and its data is lost"""
+        readable, _, _ = select.select([self.__socket], [], [], 0)
+        if not readable:
+            return False
+        try:
+            return not self.__socket.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+    def send(self, content: 'OscMessage | OscBundle') -> None:
+        """Send pythonosc message or bundle, same as pythonosc client does"""
+        frame = _encode_frame(content.dgram, self.__transport)
+        with self.__lock:
+            self.__pending.append(frame)
+            if not self.__writer_is_running:
+                self.__writer_is_running = True
+                midiscripter.shared.thread_executor.submit(self.__write_worker)
+
+    def send_message(self, address: str, value: Any) -> None:
+        """Build and send message, same as pythonosc client does"""
+        builder = pythonosc.osc_message_builder.OscMessageBuilder(address)
+        if value is None:
+            values = []
+        elif not isinstance(value, Iterable) or isinstance(value, str | bytes):
+            values = [value]
+        else:
+            values = value
+        for arg in values:
+            builder.add_arg(arg)
+        self.send(builder.build())
+
+    def __write_worker(self) -> None:
+        """Thread worker that writes the pending frames until there are none"""
+        while True:
+            with self.__lock:
+                if not self.__pending:
+                    self.__writer_is_running = False
+                    return
+                data = b''.join(self.__pending)
+                self.__pending.clear()
+
+            self.__write(data)
+
+    def __write(self, data: bytes) -> None:
+        for is_retry in (False, True):
+            if not self.__connect():
+                return
+
+            try:
+                self.__socket.sendall(data)
+                return
+            except (OSError, AttributeError) as exc:  # socket is closed by the port close
+                if self.__socket:
+                    self.__socket.close()
+                    self.__socket = None
+                if is_retry and not self.__is_closed:
+                    log.red(
+                        'Sending to OSC TCP server {address} failed: {exc}',
+                        address='{}:{}'.format(*self.__address),
+                        exc=exc,
+                    )
+
+
+class _OscTcpReceiver(_OscReceiver):
+    """TCP server of [`OscIn`][midiscripter.OscIn] port.
+
+    A single thread waits for new connections and data from all the connections.
+    Each data chunk is split to packets by the connection's frame parser
+    and the packets are decoded and handled the same way as UDP datagrams.
+    """
+
+    def __init__(
+        self,
+        handler: 'Callable[[str, tuple], None]',
+        scheduler: '_OscBundleScheduler',
+        transport: OscTransport,
+    ):
+        super().__init__(handler, scheduler, 0)
+        self.__transport = transport
+        self.__server_socket: socket.socket | None = None
+
+    def start(self, ip_address: str, port: int) -> None:
+        self.__server_socket = socket.create_server((ip_address, port))
+        self.__server_socket.setblocking(False)
+        midiscripter.shared.thread_executor.submit(self.__server_worker, self.__server_socket)
+
+    def stop(self) -> None:
+        if self.__server_socket:
+            self.__server_socket.close()
+            self.__server_socket = None
+
+    def __server_worker(self, server_socket: socket.socket) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(server_socket, selectors.EVENT_READ)
+        try:
+            while self.__server_socket is server_socket:
+                for key, _ in selector.select(_POLL_TIMEOUT_SEC):
+                    if key.fileobj is server_socket:
+                        connection, _ = server_socket.accept()
+                        connection.setblocking(False)
+                        selector.register(
+                            connection, selectors.EVENT_READ, _FrameParser(self.__transport)
+                        )
+                    else:
+                        self.__read_connection(selector, key.fileobj, key.data)
+        except (OSError, ValueError):  # server socket closed
+            pass
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+
+    def __read_connection(
+        self, selector: selectors.BaseSelector, connection: socket.socket, parser: _FrameParser
+    ) -> None:
+        try:
+            data = connection.recv(_RECV_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+
+        if data:
+            self._handle_datagrams(parser.feed(data))
+        else:  # connection closed by the client
+            selector.unregister(connection)
+            connection.close()
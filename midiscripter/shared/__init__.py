@@ -7,9 +7,12 @@ except AttributeError:  # in subprocess or IPython
 
 from .autostart import AutostartManager
 from .ableton_script_installer import install_ableton_remote_script, get_ableton_remote_script_path
+from .async_loop import async_loop
+from .process_executor import process_executor
 from .util import (
     thread_executor,
     precise_epoch_time,
+    precise_sleep_until,
     restart_script,
     raise_current_process_cpu_priority,
 )
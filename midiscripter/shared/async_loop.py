@@ -0,0 +1,74 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+
+class AsyncLoop:
+    """asyncio event loop running in its own thread.
+    Runs coroutine calls subscribed to ports and other coroutines.
+    """
+
+    def __init__(self):
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__thread: threading.Thread | None = None
+        self.__lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop, started on first use"""
+        if not self.__loop:
+            self.start()
+        return self.__loop
+
+    def start(self) -> None:
+        """Start the event loop thread if it's not running"""
+        with self.__lock:
+            if self.__loop:
+                return
+
+            self.__loop = asyncio.new_event_loop()
+            self.__thread = threading.Thread(
+                target=self.__loop.run_forever, name='MIDI Scripter async loop', daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """Cancel all pending coroutines and stop the event loop thread"""
+        with self.__lock:
+            if not self.__loop:
+                return
+
+            loop = self.__loop
+            self.__loop = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.__cancel_tasks(), loop).result(timeout=1)
+        except concurrent.futures.TimeoutError:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        self.__thread.join(timeout=1)
+        if not self.__thread.is_alive():
+            loop.close()
+
+    @staticmethod
+    async def __cancel_tasks() -> None:
+        current_task = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current_task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def run_coroutine(self, coroutine: 'Coroutine') -> concurrent.futures.Future:
+        """Schedule the coroutine on the event loop from any thread.
+
+        Returns:
+            Future with the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+
+async_loop = AsyncLoop()
@@ -0,0 +1,153 @@
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from midiscripter.logger import log
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.queues import SimpleQueue
+
+
+_main_process_queue: 'SimpleQueue | None' = None
+"""Queue to forward calls to the script process. Set in process pool workers only."""
+
+
+_WORKER_NAME_PREFIX = 'MIDI Scripter process pool worker '
+
+
+class _WorkerProcess(multiprocessing.context.SpawnProcess):
+    """Spawned process named to tell pool workers from the processes spawned by the script.
+    The name is set in the worker before it imports the script."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.name = _WORKER_NAME_PREFIX + self.name
+
+
+class _WorkerContext(multiprocessing.context.SpawnContext):
+    Process = _WorkerProcess
+
+
+_is_worker_process = multiprocessing.current_process().name.startswith(_WORKER_NAME_PREFIX)
+"""Checked once at import, the worker name is set before the worker imports the script"""
+
+
+def _init_worker(main_process_queue: 'SimpleQueue') -> None:
+    global _main_process_queue
+    _main_process_queue = main_process_queue
+
+
+def _warm_up_worker() -> None:
+    pass
+
+
+class ProcessExecutor:
+    """Worker process pool for calls subscribed with `executor='process'`.
+
+    Workers are spawned processes that import the script. Calls forwarded by the workers
+    with `forward_to_main_process` are run in the script process by the listener thread.
+    """
+
+    is_used: bool
+    """Any call is subscribed with process executor, so the pool is started with the ports.
+    Set it for the script that calls `submit` directly to spawn the workers in advance."""
+
+    def __init__(self):
+        self.is_used = False
+        self.__max_workers = max(1, (os.cpu_count() or 2) - 1)  # leave a core for the script
+        self.__pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self.__queue: SimpleQueue | None = None
+        self.__listener_thread: threading.Thread | None = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def is_worker_process() -> bool:
+        """The code is run by process pool worker, not by the script process
+        or the process spawned by the script"""
+        return _is_worker_process
+
+    @staticmethod
+    def forward_to_main_process(callable_: 'Callable', *args: Any, **kwargs: Any) -> None:
+        """Call the callable in the script process from process pool worker.
+        The callable and its arguments must be picklable."""
+        if _main_process_queue:
+            _main_process_queue.put((callable_, args, kwargs))
+
+    def start(self) -> None:
+        """Start the worker processes if they aren't running"""
+        with self.__lock:
+            if self.__pool or self.is_worker_process():
+                return
+
+            context = _WorkerContext()  # forking a threaded process is unsafe
+            self.__queue = context.SimpleQueue()
+            self.__pool = concurrent.futures.ProcessPoolExecutor(
+                self.__max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.__queue,),
+            )
+            self.__listener_thread = threading.Thread(
+                target=self.__forwarded_calls_worker,
+                args=(self.__queue,),
+                name='MIDI Scripter process pool listener',
+                daemon=True,
+            )
+            self.__listener_thread.start()
+
+            for _ in range(self.__max_workers):  # workers import the script, so spawn them early
+                self.__pool.submit(_warm_up_worker)
+
+    def stop(self) -> None:
+        """Cancel pending calls and stop the worker processes"""
+        with self.__lock:
+            if not self.__pool:
+                return
+
+            pool = self.__pool
+            self.__pool = None
+
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.__queue.put(None)
+        self.__listener_thread.join(timeout=1)
+
+    def submit(self, fn: 'Callable', *args: Any) -> concurrent.futures.Future:
+        """Run the function with the arguments in worker process.
+        The function and the arguments must be picklable.
+
+        Returns:
+            Future with the function result
+        """
+        if not self.__pool:
+            self.start()
+
+        try:
+            return self.__pool.submit(fn, *args)
+        except concurrent.futures.BrokenExecutor:  # a worker was terminated
+            self.stop()
+            self.start()
+            return self.__pool.submit(fn, *args)
+
+    @staticmethod
+    def __forwarded_calls_worker(queue: 'SimpleQueue') -> None:
+        while True:
+            try:
+                forwarded_call = queue.get()
+            except Exception as exc:  # unpickling failed
+                log.red("Can't get call forwarded from process pool worker: {exc}", exc=exc)
+                continue
+
+            if forwarded_call is None:
+                return
+
+            callable_, args, kwargs = forwarded_call
+            try:
+                callable_(*args, **kwargs)
+            except Exception as exc:
+                log.red('Call forwarded from process pool worker raised exception: {exc}', exc=exc)
+
+
+process_executor = ProcessExecutor()
@@ -15,6 +15,15 @@ if platform.system() == 'Windows':
 thread_executor = concurrent.futures.ThreadPoolExecutor(100)
 
 _precise_time_delta = time.time() - time.perf_counter()
+_PRECISE_SLEEP_SPIN_SEC = 0.002
+
+
+def precise_sleep_until(perf_counter_time: float) -> None:
+    """Sleep until `time.perf_counter()` reaches the time. Sleeps with OS timer and spins
+    for the last couple of milliseconds, since OS timer can oversleep that much."""
+    while (remaining_sec := perf_counter_time - time.perf_counter()) > 0:
+        if remaining_sec > _PRECISE_SLEEP_SPIN_SEC:
+            time.sleep(remaining_sec - _PRECISE_SLEEP_SPIN_SEC)
 
 
 def precise_epoch_time() -> float: